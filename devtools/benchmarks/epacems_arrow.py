@@ -0,0 +1,206 @@
+#! /usr/bin/env python
+"""Benchmark the pandas and Arrow-native EPA CEMS extract/transform paths.
+
+A synthetic quarterly CEMS CSV with the same columns as the EPA API files is generated,
+and then each path is run in its own fresh process, so that the peak resident set size
+reported for it isn't polluted by the other paths. For each path we report rows per
+second, the peak RSS of the process, and the baseline RSS of the process after it
+has imported PUDL but before it has touched any data.
+
+Example:
+    python devtools/benchmarks/epacems_arrow.py --rows 5000000
+"""
+
+import logging
+import multiprocessing
+import resource
+import tempfile
+import time
+from pathlib import Path
+
+import click
+import numpy as np
+import pandas as pd
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+PATHS = ["pandas", "pandas-chunked", "arrow"]
+
+
+def make_synthetic_csv(path: Path, rows: int, n_plants: int = 2000) -> None:
+    """Write a synthetic EPA CEMS API style CSV with ``rows`` rows to ``path``."""
+    rng = np.random.default_rng(42)
+    plant_ids = rng.integers(1, n_plants + 1, size=rows)
+    codes = np.array(["Measured", "Calculated", "Substitute", ""])
+    dates = pd.Timestamp("2023-01-01") + pd.to_timedelta(
+        rng.integers(0, 90, size=rows), unit="D"
+    )
+    floats = {
+        col: np.round(rng.random(rows) * scale, 3)
+        for col, scale in {
+            "Operating Time": 1,
+            "Gross Load (MW)": 1000,
+            "Steam Load (1000 lb/hr)": 100,
+            "SO2 Mass (lbs)": 100,
+            "SO2 Rate (lbs/mmBtu)": 1,
+            "NOx Rate (lbs/mmBtu)": 1,
+            "NOx Mass (lbs)": 100,
+            "CO2 Mass (short tons)": 100,
+            "CO2 Rate (short tons/mmBtu)": 1,
+            "Heat Input (mmBtu)": 1000,
+        }.items()
+    }
+    df = pd.DataFrame(
+        {
+            "State": rng.choice(["CO", "ID", "ME", "TX"], size=rows),
+            "Facility Name": "Plant " + pd.Series(plant_ids).astype(str),
+            "Facility ID": plant_ids,
+            "Unit ID": rng.choice(["1", "01", "2", "CT1", "0A1"], size=rows),
+            "Associated Stacks": "",
+            "Date": dates.strftime("%Y-%m-%d"),
+            "Hour": rng.integers(0, 24, size=rows),
+            "SO2 Mass Measure Indicator": rng.choice(codes, size=rows),
+            "NOx Mass Measure Indicator": rng.choice(codes, size=rows),
+            "CO2 Mass Measure Indicator": rng.choice(codes, size=rows),
+            "Heat Input Measure Indicator": rng.choice(codes, size=rows),
+            "Primary Fuel Type": "Coal",
+            "Unit Type": "Tangentially-fired",
+        }
+        | floats
+    )
+    df.to_csv(path, index=False)
+
+
+def make_lookup_tables(n_plants: int = 2000) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Build a synthetic crosswalk and plant timezone table for the CSV plants."""
+    plant_ids = np.arange(1, n_plants + 1)
+    crosswalk = pd.DataFrame(
+        {
+            "plant_id_epa": plant_ids,
+            "plant_id_eia": plant_ids + 100_000,
+            "emissions_unit_id_epa": "1",
+        }
+    )
+    plants = pd.DataFrame(
+        {
+            "plant_id_eia": np.concatenate([plant_ids, plant_ids + 100_000]),
+            "timezone": "America/Denver",
+        }
+    )
+    return crosswalk, plants
+
+
+def _run_path(name: str, csv_path: Path, out_path: Path, queue) -> None:
+    """Run one extract/transform/write path and report its timing and peak RSS."""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    import pudl
+    from pudl.extract.epacems import (
+        API_DTYPE_DICT,
+        API_IGNORE_COLS,
+        API_RENAME_DICT,
+        EpaCemsDatastore,
+    )
+    from pudl.metadata.classes import Resource
+
+    crosswalk, plants = make_lookup_tables()
+    schema = Resource.from_id("core_epacems__hourly_emissions").to_pyarrow()
+    ds = EpaCemsDatastore(datastore=None)
+    csv_kwargs = {
+        "ignore_cols": API_IGNORE_COLS,
+        "rename_dict": API_RENAME_DICT,
+        "dtype_dict": API_DTYPE_DICT,
+    }
+    baseline_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    start = time.perf_counter()
+    if name == "pandas":
+        df = ds._csv_to_dataframe(csv_path, **csv_kwargs).assign(year=2023)
+        df = pudl.transform.epacems.transform(df, crosswalk, plants)
+        tables = [pa.Table.from_pandas(df, schema=schema, preserve_index=False)]
+    elif name == "pandas-chunked":
+        tables = (
+            pa.Table.from_pandas(df, schema=schema, preserve_index=False)
+            for df in pudl.transform.epacems.transform_chunks(
+                (
+                    chunk.assign(year=2023)
+                    for chunk in ds._csv_to_dataframe_chunks(csv_path, **csv_kwargs)
+                ),
+                crosswalk,
+                plants,
+            )
+        )
+    else:
+        tables = pudl.transform.epacems.transform_arrow(
+            (
+                table.append_column(
+                    "year", pa.repeat(pa.scalar(2023, pa.int32()), table.num_rows)
+                )
+                for table in ds._csv_to_arrow_batches(csv_path)
+            ),
+            crosswalk,
+            plants,
+        )
+    rows = 0
+    with pq.ParquetWriter(out_path, schema=schema, compression="snappy") as writer:
+        for table in tables:
+            rows += table.num_rows
+            writer.write_table(table)
+    elapsed = time.perf_counter() - start
+    peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    queue.put((name, rows, elapsed, peak_kb / 1024, baseline_kb / 1024))
+
+
+@click.command()
+@click.option("--rows", type=int, default=2_000_000, help="Rows in the synthetic CSV.")
+@click.option(
+    "--keep-outputs",
+    type=click.Path(file_okay=False, writable=True, path_type=Path),
+    default=None,
+    help="Directory to keep the Parquet outputs of each path in, for comparison.",
+)
+@click.option(
+    "--paths",
+    "-p",
+    multiple=True,
+    type=click.Choice(PATHS),
+    default=PATHS,
+    help="Which extract/transform paths to benchmark.",
+)
+def benchmark_epacems_arrow(
+    rows: int, keep_outputs: Path | None, paths: tuple[str, ...]
+):
+    """Compare rows/sec and peak RSS of the EPA CEMS extract/transform paths."""
+    ctx = multiprocessing.get_context("spawn")
+    with tempfile.TemporaryDirectory() as tmpdir:
+        out_dir = keep_outputs or Path(tmpdir)
+        out_dir.mkdir(parents=True, exist_ok=True)
+        csv_path = Path(tmpdir) / "epacems-2023q1.csv"
+        logger.info(f"Writing synthetic CEMS CSV with {rows} rows to {csv_path}")
+        make_synthetic_csv(csv_path, rows)
+        results = []
+        for name in paths:
+            queue = ctx.Queue()
+            proc = ctx.Process(
+                target=_run_path,
+                args=(name, csv_path, out_dir / f"{name}.parquet", queue),
+            )
+            proc.start()
+            results.append(queue.get())
+            proc.join()
+
+    click.echo(
+        f"{'path':<16}{'rows':>12}{'seconds':>10}{'rows/sec':>14}"
+        f"{'peak MiB':>10}{'base MiB':>10}"
+    )
+    for name, n_rows, elapsed, peak_mib, baseline_mib in results:
+        click.echo(
+            f"{name:<16}{n_rows:>12,}{elapsed:>10.2f}{n_rows / elapsed:>14,.0f}"
+            f"{peak_mib:>10.0f}{baseline_mib:>10.0f}"
+        )
+
+
+if __name__ == "__main__":
+    benchmark_epacems_arrow()
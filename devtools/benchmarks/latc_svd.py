@@ -0,0 +1,101 @@
+#! /usr/bin/env python
+"""Benchmark the SVD kernels used by the LATC timeseries imputation methods.
+
+A synthetic tensor shaped like a year of the FERC 714 hourly demand matrix (series x
+days x hours) is generated from a few smooth, low-rank daily and seasonal profiles
+plus noise, and a fraction of its values are nulled. It is then imputed with each
+imputation method and SVD kernel. For each run we report the wall time, the relative
+difference from the result of the exact SVD, and the mean absolute percent error of
+the imputed values with respect to the true values.
+
+Example:
+    python devtools/benchmarks/latc_svd.py --series 200 --days 365 --maxiter 20
+"""
+
+import logging
+import time
+
+import click
+import numpy as np
+
+from pudl.analysis.timeseries_cleaning import (
+    SVD_KERNELS,
+    impute_latc_tnn,
+    impute_latc_tubal,
+)
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+METHODS = {"tnn": impute_latc_tnn, "tubal": impute_latc_tubal}
+KERNELS = ["exact", *SVD_KERNELS]
+
+
+def make_synthetic_tensor(
+    series: int, days: int, hours: int = 24, rank: int = 4, seed: int = 42
+) -> np.ndarray:
+    """Synthetic positive demand tensor with shape (series, days, hours)."""
+    rng = np.random.default_rng(seed)
+    hour = np.arange(hours) / hours * 2 * np.pi
+    day = np.arange(days) / 365 * 2 * np.pi
+    daily = np.stack(
+        [np.sin(hour * (i + 1) + rng.uniform(0, np.pi)) for i in range(rank)]
+    )
+    seasonal = np.stack(
+        [np.cos(day * (i + 1) + rng.uniform(0, np.pi)) for i in range(rank)]
+    )
+    loadings = rng.uniform(0.1, 1, size=(series, rank))
+    scale = rng.lognormal(mean=6, sigma=1, size=series)
+    tensor = np.einsum("sr,rd,rh->sdh", loadings, 1 + 0.3 * seasonal, 1 + 0.2 * daily)
+    tensor = scale[:, None, None] * (tensor + rng.normal(0, 0.02, size=tensor.shape))
+    return np.abs(tensor) + 1
+
+
+@click.command()
+@click.option("--series", type=int, default=200, help="Number of series (respondents).")
+@click.option("--days", type=int, default=365, help="Number of days in the tensor.")
+@click.option(
+    "--missing", type=float, default=0.05, help="Fraction of values to null and impute."
+)
+@click.option("--maxiter", type=int, default=20, help="Iterations of each imputer.")
+@click.option(
+    "--methods",
+    "-m",
+    multiple=True,
+    type=click.Choice(list(METHODS)),
+    default=list(METHODS),
+    help="Which imputation methods to benchmark.",
+)
+def benchmark_latc_svd(
+    series: int, days: int, missing: float, maxiter: int, methods: tuple[str, ...]
+):
+    """Compare wall time and accuracy of the SVD kernels for LATC imputation."""
+    truth = make_synthetic_tensor(series, days)
+    mask = np.random.default_rng(0).random(truth.shape) < missing
+    observed = np.where(mask, np.nan, truth)
+    logger.info(f"Imputing {mask.sum():,} of {truth.size:,} values in {truth.shape}")
+
+    results = []
+    for method in methods:
+        exact = None
+        for kernel in KERNELS:
+            start = time.perf_counter()
+            imputed = METHODS[method](
+                observed.copy(), maxiter=maxiter, epsilon=0, seed=0, svd=kernel
+            )
+            elapsed = time.perf_counter() - start
+            if exact is None:
+                exact = imputed
+            diff = np.linalg.norm(imputed - exact) / np.linalg.norm(exact)
+            mape = np.mean(np.abs(imputed[mask] - truth[mask]) / truth[mask])
+            results.append((method, kernel, elapsed, diff, mape))
+
+    click.echo(
+        f"{'method':<8}{'kernel':<12}{'seconds':>10}{'vs exact':>12}{'MAPE':>10}"
+    )
+    for method, kernel, elapsed, diff, mape in results:
+        click.echo(f"{method:<8}{kernel:<12}{elapsed:>10.2f}{diff:>12.2e}{mape:>10.2%}")
+
+
+if __name__ == "__main__":
+    benchmark_latc_svd()
@@ -0,0 +1,183 @@
+#! /usr/bin/env python
+"""Benchmark matching EIA plant-part records to their generators.
+
+The plant parts list labels true granularities, integrates the 1:m FERC-EIA matches
+and builds its association table by matching every plant-part record to the
+``plant_gen`` records it is made of, one plant part at a time, on that part's primary
+key columns. This compares, on a synthetic plant parts list with the data types of
+``out_eia__yearly_plant_parts``:
+
+* ``multi-key merge``: :func:`pudl.analysis.plant_parts_eia.match_to_single_plant_part`,
+  which merges all the plant-part columns on the primary key columns.
+* ``multi-key merge, ids only``: the same, with only the id columns of the plant parts.
+* ``integer key, rows only``:
+  :func:`pudl.analysis.plant_parts_eia.match_rows_to_single_plant_part`, which merges
+  the row positions of the records on one integer key made from the codes of the
+  primary key columns.
+* ``integer key, all columns``: the same, followed by taking all the plant-part
+  columns of the matched rows, to make the same table as the multi-key merge.
+* ``factorize id columns``: just making the integer codes of the id columns, which is
+  the most that storing them on the plant-part records could save.
+
+Example:
+    python devtools/benchmarks/plant_parts_keys.py --plants 5000
+"""
+
+import logging
+import time
+
+import click
+import numpy as np
+import pandas as pd
+
+from pudl.analysis.plant_parts_eia import (
+    IDX_OWN_TO_ADD,
+    IDX_TO_ADD,
+    PLANT_PARTS,
+    make_id_cols_list,
+    match_rows_to_single_plant_part,
+    match_to_single_plant_part,
+)
+from pudl.metadata.classes import Resource
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def synthetic_plant_parts(plants: int, years: int, seed: int = 0) -> pd.DataFrame:
+    """Make a plant parts list with random generators, owners and attributes."""
+    rng = np.random.default_rng(seed)
+    gens_per_plant = rng.integers(1, 8, plants)
+    plant_ids = np.repeat(np.arange(1, plants + 1), gens_per_plant)
+    n_gens = len(plant_ids)
+    gens = pd.DataFrame(
+        {
+            "plant_id_eia": plant_ids,
+            "generator_id": (
+                np.arange(n_gens)
+                - np.repeat(np.cumsum(gens_per_plant) - gens_per_plant, gens_per_plant)
+            ).astype(str),
+            "unit_id_pudl": pd.array(rng.integers(1, 3, n_gens), dtype="Int64"),
+            "prime_mover_code": rng.choice(["ST", "CT", "CA", "WT", "PV"], n_gens),
+            "technology_description": rng.choice(
+                [
+                    "Conventional Steam Coal",
+                    "Onshore Wind Turbine",
+                    "Solar Photovoltaic",
+                ],
+                n_gens,
+            ),
+            "energy_source_code_1": rng.choice(["BIT", "NG", "WND", "SUN"], n_gens),
+            "ferc_acct_name": rng.choice(["Steam", "Other", "Nuclear"], n_gens),
+            "generator_operating_year": pd.array(
+                rng.integers(1950, 2020, n_gens), dtype="Int64"
+            ),
+            "ferc1_generator_agg_id": pd.array([pd.NA] * n_gens, dtype="Int64"),
+            "utility_id_eia": 100 + plant_ids % 300,
+        }
+    )
+    gens = pd.concat(
+        [
+            gens.assign(
+                report_date=pd.Timestamp(f"{2010 + year}-01-01"),
+                operational_status_pudl="operating",
+                ownership_record_type=ownership,
+            )
+            for year in range(years)
+            for ownership in ["owned", "total"]
+        ],
+        ignore_index=True,
+    )
+    parts = []
+    for part_name, part in PLANT_PARTS.items():
+        pk_cols = part["id_cols"] + IDX_TO_ADD + IDX_OWN_TO_ADD
+        part_df = gens if part_name == "plant_gen" else gens.drop_duplicates(pk_cols)
+        parts.append(
+            part_df.assign(
+                **{
+                    col: pd.NA
+                    for col in make_id_cols_list() + IDX_OWN_TO_ADD
+                    if col not in pk_cols
+                },
+                plant_part=part_name,
+            ).astype(gens.dtypes.to_dict())
+        )
+    ppe = pd.concat(parts, ignore_index=True)
+    ppe = ppe.assign(
+        record_id_eia=lambda x: "record_" + pd.Series(np.arange(len(x))).astype(str),
+        capacity_mw=rng.uniform(1, 500, len(ppe)),
+        net_generation_mwh=rng.uniform(0, 1e6, len(ppe)),
+        fuel_type_code_pudl="coal",
+        appro_part_label=lambda x: x.plant_part,
+    )
+    return Resource.from_id("out_eia__yearly_plant_parts").format_df(ppe)
+
+
+def match_all_columns_on_rows(ppe: pd.DataFrame) -> pd.DataFrame:
+    """Make the association table's matches from the matched row positions."""
+    multi_rows, part_rows = match_rows_to_single_plant_part(ppe, ppe, one_to_many=True)
+    parts = ppe.plant_part.to_numpy()[multi_rows]
+    starts = np.flatnonzero(np.r_[True, parts[1:] != parts[:-1]])
+    ppe = ppe.reset_index(drop=True)
+    out_dfs = []
+    for start, end in zip(starts, np.r_[starts[1:], len(parts)], strict=True):
+        pk_cols = PLANT_PARTS[parts[start]]["id_cols"] + IDX_TO_ADD + IDX_OWN_TO_ADD
+        out_dfs.append(
+            pd.concat(
+                [
+                    ppe.iloc[multi_rows[start:end]][
+                        pk_cols + ["record_id_eia"]
+                    ].reset_index(drop=True),
+                    ppe.drop(columns=pk_cols)
+                    .rename(columns={"record_id_eia": "record_id_eia_plant_gen"})
+                    .reindex(part_rows[start:end])
+                    .reset_index(drop=True),
+                ],
+                axis=1,
+            )
+        )
+    return pd.concat(out_dfs)
+
+
+def factorize_id_cols(ppe: pd.DataFrame) -> None:
+    """Make the integer codes of all the plant-part id columns."""
+    gens = ppe[ppe.plant_part == "plant_gen"]
+    for col in make_id_cols_list() + IDX_OWN_TO_ADD:
+        pd.factorize(pd.concat([ppe[col], gens[col]]), use_na_sentinel=False)
+
+
+@click.command()
+@click.option("--plants", type=int, default=5_000, help="Number of synthetic plants.")
+@click.option("--years", type=int, default=5, help="Number of report years.")
+@click.option("--repeats", type=int, default=3, help="Best of this many runs.")
+def benchmark_plant_parts_keys(plants: int, years: int, repeats: int):
+    """Compare matching plant-part records on their id columns and integer keys."""
+    ppe = synthetic_plant_parts(plants, years)
+    id_cols = list(dict.fromkeys(["plant_part", "record_id_eia"] + make_id_cols_list()))
+    methods = {
+        "multi-key merge": lambda: match_to_single_plant_part(
+            ppe.copy(), ppe, one_to_many=True
+        ),
+        "multi-key merge, ids only": lambda: match_to_single_plant_part(
+            ppe[id_cols + IDX_OWN_TO_ADD].copy(),
+            ppe[id_cols + IDX_OWN_TO_ADD],
+            one_to_many=True,
+        ),
+        "integer key, rows only": lambda: match_rows_to_single_plant_part(
+            ppe, ppe, one_to_many=True
+        ),
+        "integer key, all columns": lambda: match_all_columns_on_rows(ppe),
+        "factorize id columns": lambda: factorize_id_cols(ppe),
+    }
+    click.echo(f"{len(ppe)} plant-part records")
+    for label, method in methods.items():
+        elapsed = []
+        for _ in range(repeats):
+            start = time.perf_counter()
+            method()
+            elapsed.append(time.perf_counter() - start)
+        click.echo(f"{label:<28}{min(elapsed):>8.2f} s")
+
+
+if __name__ == "__main__":
+    benchmark_plant_parts_keys()
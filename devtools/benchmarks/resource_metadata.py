@@ -0,0 +1,80 @@
+#! /usr/bin/env python
+"""Benchmark the per-asset overhead of looking up PUDL table metadata.
+
+Writing and reading each table with the parquet IO manager looks up its
+:class:`pudl.metadata.classes.Resource`, and then its PyArrow schema and pandas data
+types. Several other steps of the ETL do the same. This compares the time taken by
+those lookups when every one of them constructs the resource from scratch (as
+:meth:`pudl.metadata.classes.Resource.from_id` used to) with the time taken when
+the resource and its schemas are cached.
+
+Example:
+    python devtools/benchmarks/resource_metadata.py --lookups 4
+"""
+
+import logging
+import time
+
+import click
+
+from pudl.metadata.classes import Resource
+from pudl.metadata.resources import RESOURCE_METADATA
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def uncached_resource(resource_id: str) -> Resource:
+    """Construct a new resource, without any of its schemas cached."""
+    return Resource(**Resource.dict_from_id(resource_id))
+
+
+def lookup_metadata(resource_id: str, lookups: int, from_id) -> None:
+    """Look up a table's metadata like the parquet IO manager does, several times."""
+    for _ in range(lookups):
+        resource = from_id(resource_id)
+        resource.to_pyarrow()
+        resource.to_pandas_dtypes()
+
+
+@click.command()
+@click.option(
+    "--lookups",
+    type=int,
+    default=4,
+    help="Number of times the metadata of each table is looked up.",
+)
+@click.option(
+    "--tables",
+    type=int,
+    default=None,
+    help="Number of tables to look up. Defaults to all of them.",
+)
+def benchmark_resource_metadata(lookups: int, tables: int | None):
+    """Compare constructing table metadata on every lookup with caching it."""
+    resource_ids = sorted(RESOURCE_METADATA)[:tables]
+    Resource.from_id.cache_clear()
+    results = []
+    # The first cached pass constructs every resource, the second finds them all
+    for label, from_id in (
+        ("uncached", uncached_resource),
+        ("cold", Resource.from_id),
+        ("warm", Resource.from_id),
+    ):
+        start = time.perf_counter()
+        for resource_id in resource_ids:
+            lookup_metadata(resource_id, lookups, from_id)
+        elapsed = time.perf_counter() - start
+        results.append((label, elapsed))
+
+    click.echo(f"{len(resource_ids)} tables, {lookups} lookups each")
+    click.echo(f"{'':<10}{'total s':>10}{'ms/table':>10}{'ms/lookup':>11}")
+    for label, elapsed in results:
+        per_table = 1000 * elapsed / len(resource_ids)
+        click.echo(
+            f"{label:<10}{elapsed:>10.2f}{per_table:>10.2f}{per_table / lookups:>11.3f}"
+        )
+
+
+if __name__ == "__main__":
+    benchmark_resource_metadata()
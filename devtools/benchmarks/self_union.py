@@ -0,0 +1,109 @@
+#! /usr/bin/env python
+"""Benchmark the self-union of overlapping, county-sized polygons.
+
+:func:`pudl.analysis.spatial.self_union` splits overlapping features, like the
+service territories of utilities and balancing authorities, into pieces. It now
+finds the intersecting pairs of features with a spatial index instead of
+intersecting every pair of features. This generates layers of random, roughly
+county-sized polygons (in meters), each overlapping a few of its neighbors on
+average, and times the self-union of each layer. For the smaller layers, it also
+times intersecting all pairs of features, which is what the self-union used to
+do, to show how much work the spatial index avoids.
+
+Example:
+    python devtools/benchmarks/self_union.py --sizes 1000 10000 50000
+"""
+
+import itertools
+import logging
+import time
+
+import click
+import geopandas as gpd
+import numpy as np
+import shapely
+
+from pudl.analysis.spatial import intersecting_pairs, self_union
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def make_polygons(
+    n: int, radius: float = 25_000, neighbors: float = 4, seed: int = 42
+) -> gpd.GeoDataFrame:
+    """Random polygons with about `neighbors` overlapping polygons each.
+
+    Args:
+        n: Number of polygons.
+        radius: Mean radius of the polygons, in meters. Counties in the US have a
+            median area of about 1,600 km^2, or a radius of about 23 km.
+        neighbors: Mean number of other polygons that each polygon overlaps.
+        seed: Random number generator seed.
+    """
+    rng = np.random.default_rng(seed)
+    # Expected overlaps are n * pi * (2 * radius)^2 / extent^2
+    extent = np.sqrt(n * np.pi * 4 / neighbors) * radius
+    points = shapely.points(rng.uniform(0, extent, size=(n, 2)))
+    radii = radius * rng.uniform(0.6, 1.4, size=n)
+    return gpd.GeoDataFrame(
+        {"id": np.arange(n), "demand_mwh": rng.uniform(0, 1000, size=n)},
+        geometry=shapely.buffer(points, radii, quad_segs=4),
+    )
+
+
+def all_pairs_intersections(geoms: gpd.GeoSeries) -> gpd.GeoSeries:
+    """Intersect every pair of geometries, as the self-union used to."""
+    return gpd.GeoSeries(
+        [a.intersection(b) for a, b in itertools.combinations(geoms, 2)]
+    )
+
+
+@click.command()
+@click.option(
+    "--sizes",
+    type=int,
+    multiple=True,
+    default=[1000, 10_000, 50_000],
+    help="Numbers of polygons in the layers to self-union.",
+)
+@click.option(
+    "--max-all-pairs",
+    type=int,
+    default=2000,
+    help="Largest layer for which to time the intersection of all pairs.",
+)
+def benchmark_self_union(sizes: tuple[int, ...], max_all_pairs: int):
+    """Time the self-union of random polygon layers of several sizes."""
+    results = []
+    for n in sizes:
+        gdf = make_polygons(n)
+        start = time.perf_counter()
+        left, _ = intersecting_pairs(gdf.geometry)
+        pairs_seconds = time.perf_counter() - start
+        start = time.perf_counter()
+        union = self_union(gdf, ratios=["demand_mwh"])
+        union_seconds = time.perf_counter() - start
+        all_pairs_seconds = np.nan
+        if n <= max_all_pairs:
+            start = time.perf_counter()
+            all_pairs_intersections(gdf.geometry)
+            all_pairs_seconds = time.perf_counter() - start
+        logger.info(
+            f"{n} polygons: {len(left)} intersecting pairs, {len(union)} pieces"
+        )
+        results.append((n, len(left), pairs_seconds, union_seconds, all_pairs_seconds))
+
+    click.echo(
+        f"{'polygons':>10}{'pairs':>10}{'index s':>10}{'union s':>10}"
+        f"{'all pairs s':>13}"
+    )
+    for n, pairs, pairs_seconds, union_seconds, all_pairs_seconds in results:
+        click.echo(
+            f"{n:>10}{pairs:>10}{pairs_seconds:>10.2f}{union_seconds:>10.2f}"
+            f"{all_pairs_seconds:>13.2f}"
+        )
+
+
+if __name__ == "__main__":
+    benchmark_self_union()
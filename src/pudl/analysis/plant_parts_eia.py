@@ -677,13 +677,23 @@ class MakePlantParts:
         if plant_parts_eia_filt.empty:  # If 1:m matches not in plant_part subset
             return plant_parts_eia.assign(ferc1_generator_agg_id=pd.NA)
         # Get the 'm' generator IDs 1:m
-        one_to_many_single = match_to_single_plant_part(
+        record_rows, gen_rows = match_rows_to_single_plant_part(
             multi_gran_df=plant_parts_eia_filt,
             ppe=plant_parts_eia,
             part_name="plant_gen",
-            cols_to_keep=["plant_part"],
-        )[["record_id_eia", "record_id_eia_plant_gen", "plant_part"]].rename(
-            columns={"record_id_eia_plant_gen": "gen_id"}
+        )
+        one_to_many_single = pd.DataFrame(
+            {
+                "record_id_eia": plant_parts_eia_filt["record_id_eia"].array.take(
+                    record_rows
+                ),
+                "gen_id": plant_parts_eia["record_id_eia"].array.take(
+                    gen_rows, allow_fill=True
+                ),
+                "plant_part": plant_parts_eia_filt["plant_part"].array.take(
+                    record_rows
+                ),
+            }
         )
 
         # If any 'duplicate records' actually match to the same generator, these aren't 1:m matches. Drop them and any corresponding non-matches.
@@ -789,10 +799,9 @@ class MakePlantParts:
 
     def add_attributes(self, part_df, attribute_df, part_name):
         """Add constant and min/max attributes to plant parts."""
-        for attribute_col in CONSISTENT_ATTRIBUTE_COLS:
-            part_df = AddConsistentAttributes(attribute_col, part_name).execute(
-                part_df, attribute_df
-            )
+        part_df = AddConsistentAttributes(CONSISTENT_ATTRIBUTE_COLS, part_name).execute(
+            part_df, attribute_df
+        )
         for attribute_col in PRIORITY_ATTRIBUTES_DICT:
             part_df = AddPriorityAttribute(attribute_col, part_name).execute(
                 part_df, attribute_df
@@ -1078,29 +1087,21 @@ class TrueGranLabeler:
         Arguments:
             ppe: (pd.DataFrame) The plant parts list
         """
-        parts_to_gens = match_to_single_plant_part(
-            multi_gran_df=ppe,
-            ppe=ppe,
-            part_name="plant_gen",
-            cols_to_keep=["plant_part"],
-            one_to_many=True,
-        )[["record_id_eia", "record_id_eia_plant_gen", "plant_part"]].rename(
-            columns={"record_id_eia_plant_gen": "gen_id"},
-        )
-        # concatenate the gen id's to get the combo of gens for each record
-        combos = (
-            parts_to_gens.sort_values(["gen_id"])
-            .groupby(["record_id_eia"])["gen_id"]
-            .apply(lambda x: ",".join(x))
-            .rename("gens_combo")
+        # the row positions of the records and of their generators in the plant parts
+        # list are compact integer keys for them
+        record_rows, gen_rows = match_rows_to_single_plant_part(
+            multi_gran_df=ppe, ppe=ppe, part_name="plant_gen", one_to_many=True
         )
-        parts_to_gens = parts_to_gens.merge(
-            combos, how="left", left_on="record_id_eia", right_index=True
-        )
-
-        # categorical columns allow sorting by PLANT_PARTS key order
-        parts_to_gens["plant_part"] = pd.Categorical(
-            parts_to_gens["plant_part"], PLANT_PARTS.keys()
+        parts_to_gens = pd.DataFrame(
+            {
+                "record_id_eia": record_rows,
+                # categorical columns allow sorting by PLANT_PARTS key order
+                "plant_part": pd.Categorical(
+                    ppe["plant_part"].to_numpy()[record_rows], PLANT_PARTS.keys()
+                ),
+                # identify the combo of gens for each record
+                "gens_combo": get_combo_codes(record_rows, gen_rows),
+            }
         )
         parts_to_gens = parts_to_gens.sort_values("plant_part")
         # get the true gran records by finding duplicate gen combos
@@ -1124,16 +1125,22 @@ class TrueGranLabeler:
             .astype({"appro_part_label": "string"})
         )
         # merge the true gran cols onto the parts to gens dataframe
-        # drop cols to get a table with just record id and true gran cols
-        record_id_true_gran = parts_to_gens.merge(
-            true_grans, on="gens_combo", how="left", validate="m:1"
-        ).drop(["plant_part", "gens_combo", "gen_id"], axis=1)
-
-        ppe_true_gran = ppe.merge(
-            record_id_true_gran, how="left", on="record_id_eia", validate="1:1"
+        # drop cols to get a table with just the true gran cols for each record
+        record_id_true_gran = (
+            parts_to_gens.merge(true_grans, on="gens_combo", how="left", validate="m:1")
+            .drop(["plant_part", "gens_combo"], axis=1)
+            .assign(
+                appro_record_id_eia=lambda x: ppe["record_id_eia"].array.take(
+                    x.appro_record_id_eia
+                )
+            )
+            .set_index("record_id_eia")
+            .reindex(range(len(ppe)))
+        )
+        return pd.concat(
+            [ppe.reset_index(drop=True), record_id_true_gran.reset_index(drop=True)],
+            axis=1,
         )
-
-        return ppe_true_gran
 
 
 class AddAttribute:
@@ -1173,7 +1180,28 @@ class AddAttribute:
 
 
 class AddConsistentAttributes(AddAttribute):
-    """Adder of attributes records to a plant-part table."""
+    """Adder of attributes records to a plant-part table.
+
+    Several consistent attributes can be added at once, in a single grouped pass over
+    the generator records.
+    """
+
+    def __init__(self, attribute_col: str | list[str], part_name: str):
+        """Initialize a consistent attribute adder.
+
+        Args:
+            attribute_col: name of qualifier record that you want added, or a list of
+                them. Must be in :py:const:`CONSISTENT_ATTRIBUTE_COLS`.
+            part_name (str): the name of the part to aggregate to. Names can be
+                only those in :py:const:`PLANT_PARTS` or `plant_match_ferc1`
+        """
+        attribute_cols = (
+            [attribute_col] if isinstance(attribute_col, str) else list(attribute_col)
+        )
+        assert set(attribute_cols).issubset(CONSISTENT_ATTRIBUTE_COLS)
+        super().__init__(attribute_cols[0], part_name)
+        self.attribute_col = attribute_col
+        self.attribute_cols = attribute_cols
 
     def execute(self, part_df, gens_mega):
         """Get qualifier records.
@@ -1208,21 +1236,27 @@ class AddConsistentAttributes(AddAttribute):
                 identifying columns and data columns, sliced by ownership which
                 makes "total" and "owned" records for each generator owner.
         """
-        attribute_col = self.attribute_col
-        if attribute_col in part_df.columns:
-            logger.debug(f"{attribute_col} already here.. ")
+        attribute_cols = []
+        for attribute_col in self.attribute_cols:
+            if attribute_col in part_df.columns:
+                logger.debug(f"{attribute_col} already here.. ")
+            else:
+                attribute_cols.append(attribute_col)
+        if not attribute_cols:
             return part_df
 
-        record_df = gens_mega.copy()
-        record_df = self.assign_col(record_df)
+        record_df = self.assign_col(gens_mega)
 
-        consistent_records = self.get_consistent_qualifiers(record_df)
+        consistent_records = self.get_consistent_qualifiers(record_df, attribute_cols)
 
-        non_nulls = consistent_records[consistent_records[attribute_col].notnull()]
-        logger.debug(f"merging in consistent {attribute_col}: {len(non_nulls)}")
+        for attribute_col in attribute_cols:
+            non_nulls = consistent_records[attribute_col].notnull().sum()
+            logger.debug(f"merging in consistent {attribute_col}: {non_nulls}")
         return part_df.merge(consistent_records, how="left")
 
-    def get_consistent_qualifiers(self, record_df):
+    def get_consistent_qualifiers(
+        self, record_df: pd.DataFrame, attribute_cols: list[str] | None = None
+    ) -> pd.DataFrame:
         """Get fully consistent qualifier records.
 
         When data is a qualifier column is identical for every record in a
@@ -1230,33 +1264,29 @@ class AddConsistentAttributes(AddAttribute):
         points for the related generator records are not identical, then
         nothing is associated with the record.
 
+        All of the qualifier columns are checked in a single grouped pass: a
+        qualifier is consistent within a group of records if it has no nulls and
+        only one distinct value.
+
         Args:
-            record_df (pandas.DataFrame): the dataframe with the record
-            base_cols (list) : list of identifying columns.
-            record_name (string) : name of qualitative record
+            record_df: the dataframe with the record
+            attribute_cols: names of the qualifier columns. Defaults to all of the
+                attribute columns of this adder.
+
+        Returns:
+            One record for each group of the identifying ``base_cols``, with the
+            value of each qualifier column where it is consistent and null where it
+            is not.
         """
-        # TODO: determine if we can move this up the chain so we can do this
-        # once per plant-part, not once per plant-part * qualifier record
-        attribute_col = self.attribute_col
-        base_cols = self.base_cols
-        entity_count_df = pudl.helpers.count_records(
-            record_df, base_cols, "entity_occurrences"
-        ).pipe(pudl.helpers.convert_cols_dtypes, "eia")
-        record_count_df = pudl.helpers.count_records(
-            record_df, base_cols + [attribute_col], "record_occurrences"
-        ).pipe(pudl.helpers.convert_cols_dtypes, "eia")
-        re_count = (
-            record_df[base_cols + [attribute_col]]
-            .merge(entity_count_df, how="left", on=base_cols)
-            .merge(record_count_df, how="left", on=base_cols + [attribute_col])
-        )
-        # find all of the matching records..
-        consistent_records = (
-            re_count[re_count["entity_occurrences"] == re_count["record_occurrences"]]
-            .drop(columns=["entity_occurrences", "record_occurrences"])
-            .drop_duplicates()
-        )
-        return consistent_records
+        if attribute_cols is None:
+            attribute_cols = self.attribute_cols
+        grouped = record_df.groupby(self.base_cols, observed=True, sort=False)[
+            attribute_cols
+        ]
+        consistent = (
+            grouped.count().to_numpy() == grouped.size().to_numpy()[:, None]
+        ) & (grouped.nunique().to_numpy() == 1)
+        return grouped.first().where(consistent).reset_index()
 
 
 class AddPriorityAttribute(AddAttribute):
@@ -1382,54 +1412,117 @@ def make_parts_to_ids_dict():
     return parts_to_ids
 
 
+def get_combo_codes(group_codes: np.ndarray, member_codes: np.ndarray) -> np.ndarray:
+    """Label the groups which have the same combination of members.
+
+    This is a compact alternative to joining the sorted member ids of each group into
+    a string, e.g. to find the plant-part records that are made up of the same
+    generators. The groups are first labeled by their number of members, and the
+    labels are then refined by each group's sorted members, one position at a time,
+    so that no work is done group by group.
+
+    Args:
+        group_codes: Integer code of the group of each member.
+        member_codes: Integer code of each member.
+
+    Returns:
+        Integer code of the combination of members of the group of each member, in the
+        order of the input. Groups with the same (multi)set of members have the same
+        code.
+    """
+    if not len(group_codes):
+        return np.array([], dtype=np.intp)
+    order = np.lexsort((member_codes, group_codes))
+    groups = group_codes[order]
+    members = member_codes[order].astype(np.int64)
+    members -= members.min()
+    n_members = members.max() + 1
+    starts = np.flatnonzero(np.r_[True, groups[1:] != groups[:-1]])
+    sizes = np.diff(np.r_[starts, len(groups)])
+    # sort the groups from largest to smallest, so the groups which have a member at
+    # each position always come first
+    by_size = np.argsort(-sizes, kind="stable")
+    sorted_sizes, sorted_starts = sizes[by_size], starts[by_size]
+    combos = pd.factorize(sorted_sizes)[0]
+    next_combo = combos.max() + 1
+    for position in range(sorted_sizes[0]):
+        n_groups = np.searchsorted(-sorted_sizes, -position)
+        combos[:n_groups], uniques = pd.factorize(
+            combos[:n_groups] * n_members + members[sorted_starts[:n_groups] + position]
+        )
+        # keep the refined labels distinct from those of the smaller groups
+        combos[:n_groups] += next_combo
+        next_combo += len(uniques)
+    group_combos = np.empty_like(combos)
+    group_combos[by_size] = combos
+    member_combos = np.empty(len(order), dtype=combos.dtype)
+    member_combos[order] = np.repeat(group_combos, sizes)
+    return pd.factorize(member_combos)[0]
+
+
 def add_record_id(part_df, id_cols, plant_part_col="plant_part", year=True):
     """Add a record id to a compiled part df.
 
     We need a standardized way to refer to these compiled records that contains enough
     information in the id itself that in theory we could deconstruct the id and
     determine which plant id and plant part id columns are associated with this record.
+
+    The records are first given a compact integer code for each distinct combination of
+    the columns that make up the id, and the string id is only built once for each
+    code, rather than for every record.
     """
+    id_col = "record_id_eia" if year else "plant_part_id_eia"
+    key_cols = (
+        id_cols
+        + (["report_date"] if year else [])
+        + [
+            plant_part_col,
+            "ownership_record_type",
+            "utility_id_eia",
+            "operational_status_pudl",
+        ]
+    )
+    codes = (
+        part_df.groupby(key_cols, sort=False, dropna=False, observed=True)
+        .ngroup()
+        .to_numpy()
+    )
+    _, firsts = np.unique(codes, return_index=True)
+    record_ids = _make_record_ids(
+        part_df.iloc[firsts], id_cols, plant_part_col=plant_part_col, year=year
+    )
+    return part_df.assign(**{id_col: record_ids.array.take(codes)})
+
+
+def _make_record_ids(part_df, id_cols, plant_part_col="plant_part", year=True):
+    """Build the string record ids of a compiled part df."""
     ids = deepcopy(id_cols)
     # we want the plant id first... mostly just bc it'll be easier to read
-    part_df = part_df.assign(record_id_eia_temp=lambda x: x.plant_id_eia.astype(str))
+    record_ids = part_df.plant_id_eia.astype(str)
     ids.remove("plant_id_eia")
     for col in ids:
-        part_df = part_df.assign(
-            record_id_eia_temp=lambda x, col=col: x.record_id_eia_temp
-            + "_"
-            + x[col].astype(str)
-        )
+        record_ids = record_ids + "_" + part_df[col].astype(str)
     if year:
-        part_df = part_df.assign(
-            record_id_eia_temp=lambda x: x.record_id_eia_temp
-            + "_"
-            + x.report_date.dt.year.astype(str)
-        )
-    part_df = part_df.assign(
-        record_id_eia_temp=lambda x: x.record_id_eia_temp
+        record_ids = record_ids + "_" + part_df.report_date.dt.year.astype(str)
+    record_ids = (
+        record_ids
         + "_"
-        + x[plant_part_col]
+        + part_df[plant_part_col]
         + "_"
-        + x.ownership_record_type.astype(str)
+        + part_df.ownership_record_type.astype(str)
         + "_"
-        + x.utility_id_eia.astype("Int64").astype(str)
+        + part_df.utility_id_eia.astype("Int64").astype(str)
     )
     # add operational status only when records are not "operating" (i.e.
     # existing or retiring mid-year see MakeMegaGenTbl.abel_operating_gens()
     # for more details)
     non_op_mask = part_df.operational_status_pudl != "operating"
-    part_df.loc[non_op_mask, "record_id_eia_temp"] = (
-        part_df.loc[non_op_mask, "record_id_eia_temp"]
+    record_ids.loc[non_op_mask] = (
+        record_ids.loc[non_op_mask]
         + "_"
         + part_df.loc[non_op_mask, "operational_status_pudl"]
     )
-    if year:
-        part_df = part_df.rename(columns={"record_id_eia_temp": "record_id_eia"})
-        part_df["record_id_eia"] = part_df["record_id_eia"].astype("string")
-    else:
-        part_df = part_df.rename(columns={"record_id_eia_temp": "plant_part_id_eia"})
-        part_df["plant_part_id_eia"] = part_df["plant_part_id_eia"].astype("string")
-    return part_df
+    return record_ids.astype("string")
 
 
 def match_to_single_plant_part(
@@ -1521,6 +1614,81 @@ def match_to_single_plant_part(
     return out_df
 
 
+def match_rows_to_single_plant_part(
+    multi_gran_df: pd.DataFrame,
+    ppe: pd.DataFrame,
+    part_name: PLANT_PARTS_LITERAL = "plant_gen",
+    one_to_many: bool = False,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Find the rows of a single plant-part that records of any granularity match.
+
+    This makes the same matches as :func:`match_to_single_plant_part`, for when only
+    the matched records are needed and not their data. Each of the id columns of the
+    records and of the ``part_name`` plant-part records is factorized into integer
+    codes once. For each plant part, the codes of its primary key columns are then
+    combined into one integer key, and the row positions of the records are merged on
+    that key, without copying any of the other columns.
+
+    Args:
+        multi_gran_df: a data table where all records have been linked to EIA plant-part
+            list but they may be heterogeneous in its plant-part granularities.
+        ppe: the EIA plant-part list.
+        part_name: name of the single plant part to match to. Must be a key in
+            PLANT_PARTS dictionary.
+        one_to_many: boolean (False by default). If True, add `plant_match_ferc1` into
+            plant parts list.
+
+    Returns:
+        The positions of the records in ``multi_gran_df`` and the positions in ``ppe``
+        of the ``part_name`` records they are matched to, or -1 if there is no match.
+        Like in :func:`match_to_single_plant_part`, the matches are ordered by plant
+        part and then by record.
+    """
+    merge_parts = [
+        merge_part
+        for merge_part in PLANT_PARTS
+        if one_to_many or merge_part != "plant_match_ferc1"
+    ]
+    part_rows = np.flatnonzero(ppe.plant_part == part_name)
+    multi_part_rows = multi_gran_df.groupby("plant_part", observed=True).indices
+    id_codes = {}
+    for col in pudl.helpers.dedupe_n_flatten_list_of_lists(
+        [PLANT_PARTS[merge_part]["id_cols"] for merge_part in merge_parts]
+        + [IDX_TO_ADD + IDX_OWN_TO_ADD]
+    ):
+        multi_col = multi_gran_df[col]
+        if col == "report_date":
+            # compare by year start, like match_to_single_plant_part
+            multi_col = pd.to_datetime(multi_col.dt.year, format="%Y")
+        id_codes[col] = pd.factorize(
+            pd.concat([multi_col, ppe[col].iloc[part_rows]], ignore_index=True),
+            use_na_sentinel=False,
+        )[0]
+    multi_rows = []
+    matched_rows = []
+    for merge_part in merge_parts:
+        pk_cols = PLANT_PARTS[merge_part]["id_cols"] + IDX_TO_ADD + IDX_OWN_TO_ADD
+        rows = multi_part_rows.get(merge_part, np.array([], dtype=np.intp))
+        code_rows = np.concatenate(
+            [rows, len(multi_gran_df) + np.arange(len(part_rows))]
+        )
+        keys = np.zeros(len(code_rows), dtype=np.int64)
+        for col in pk_cols:
+            codes = id_codes[col][code_rows]
+            # renumber the keys after adding each column, so they can't overflow
+            keys = pd.factorize(keys * (codes.max(initial=0) + 1) + codes)[0]
+        matches = pd.merge(
+            pd.DataFrame({"key": keys[: len(rows)], "multi_row": rows}),
+            pd.DataFrame({"key": keys[len(rows) :], "part_row": part_rows}),
+            on="key",
+            how="left",
+            validate="m:m",
+        )
+        multi_rows.append(matches.multi_row.to_numpy())
+        matched_rows.append(matches.part_row.fillna(-1).to_numpy(dtype=np.intp))
+    return np.concatenate(multi_rows), np.concatenate(matched_rows)
+
+
 def plant_parts_eia_distinct(plant_parts_eia: pd.DataFrame) -> pd.DataFrame:
     """Get the EIA plant_parts with only the unique granularities.
 
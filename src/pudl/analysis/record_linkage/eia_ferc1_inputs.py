@@ -6,7 +6,7 @@ from typing import Literal
 import pandas as pd
 
 import pudl
-from pudl.analysis.plant_parts_eia import match_to_single_plant_part
+from pudl.analysis.plant_parts_eia import match_rows_to_single_plant_part
 
 logger = pudl.logging_helpers.get_logger(__name__)
 
@@ -294,13 +294,15 @@ def prep_train_connections(
     )
 
     # Get the 'm' generator IDs 1:m
-    one_to_many_single = match_to_single_plant_part(
-        multi_gran_df=ppe.loc[ppe.index.isin(one_to_many.record_id_eia)].reset_index(),
-        ppe=ppe.reset_index(),
-        part_name="plant_gen",
-        cols_to_keep=["plant_part"],
-    )[["record_id_eia", "record_id_eia_plant_gen"]].rename(
-        columns={"record_id_eia_plant_gen": "gen_id"}
+    one_to_many_ppe = ppe.loc[ppe.index.isin(one_to_many.record_id_eia)]
+    record_rows, gen_rows = match_rows_to_single_plant_part(
+        multi_gran_df=one_to_many_ppe, ppe=ppe, part_name="plant_gen"
+    )
+    one_to_many_single = pd.DataFrame(
+        {
+            "record_id_eia": one_to_many_ppe.index.array.take(record_rows),
+            "gen_id": ppe.index.array.take(gen_rows, allow_fill=True),
+        }
     )
     one_to_many = (
         one_to_many.merge(
@@ -29,7 +29,9 @@ are the connections we keep as the matches between FERC1 plant records and EIA
 plant-parts.
 """
 
-import importlib
+import importlib.metadata
+import importlib.resources
+from pathlib import Path
 from typing import Literal
 
 import jellyfish
@@ -170,23 +172,75 @@ def get_input_dfs(inputs):
     return eia_df, ferc_df
 
 
+def _metaphone_memo_path() -> Path:
+    """Location of the on-disk memo of name metaphones used by :func:`get_metaphones`.
+
+    The memo is specific to the installed version of jellyfish, in case its
+    metaphone encoding changes between versions.
+    """
+    version = importlib.metadata.version("jellyfish")
+    return pudl.workspace.memo.memo_path(
+        "metaphones", f"metaphones-jellyfish{version}.parquet"
+    )
+
+
+def _read_metaphone_memo(memo_path: Path | None) -> pd.Series:
+    """Read the memo of previously encoded names, if there is one."""
+    memo = pd.Series(dtype=object, index=pd.Index([], dtype=object, name="name"))
+    memo_df = pudl.workspace.memo.read_memo(memo_path)
+    if memo_df is not None and {"name", "metaphone"}.issubset(memo_df.columns):
+        memo = memo_df.set_index("name")["metaphone"]
+    return memo
+
+
+def get_metaphones(names: pd.Series, memo_path: Path | None = None) -> pd.Series:
+    """Encode names with :func:`jellyfish.metaphone`.
+
+    Each distinct name is only encoded once. Encodings from previous runs are
+    reused from a memo of the metaphone of each name, and names that aren't in it
+    yet are added to it.
+
+    Args:
+        names: Cleaned names to encode.
+        memo_path: Parquet file in which metaphones are memoized by name. If None,
+            nothing is memoized between runs.
+
+    Returns:
+        The metaphone of each name, with the same index as ``names``. Null names
+        have a metaphone of None.
+    """
+    memo = _read_metaphone_memo(memo_path)
+    unique_names = pd.Index(names.dropna().unique())
+    new_names = unique_names.difference(memo.index, sort=False)
+    if not new_names.empty:
+        logger.info(f"Encoding metaphones of {len(new_names)} new names.")
+        new_memo = pd.Series(
+            [jellyfish.metaphone(name) for name in new_names],
+            index=new_names.rename("name"),
+            dtype=object,
+            name="metaphone",
+        )
+        # Pick up names memoized by any other process since the memo was read
+        memo = pd.concat([_read_metaphone_memo(memo_path), new_memo])
+        memo = memo[~memo.index.duplicated(keep="first")]
+        pudl.workspace.memo.write_memo(
+            memo.rename("metaphone").reset_index(), memo_path
+        )
+    return names.map(memo).astype(object).where(names.notna(), None)
+
+
 @op
 def prepare_for_matching(df, transformed_df):
     """Prepare the input dataframes for matching with splink."""
-
-    def _get_metaphone(row, col_name):
-        if pd.isnull(row[col_name]):
-            return None
-        return jellyfish.metaphone(row[col_name])
-
     # replace old cols with transformed cols
     for col in transformed_df.columns:
         orig_col_name = col.split("__")[1]
         df[orig_col_name] = transformed_df[col]
     df["installation_year"] = pd.to_datetime(df["installation_year"], format="%Y")
     df["construction_year"] = pd.to_datetime(df["construction_year"], format="%Y")
-    df["plant_name_mphone"] = df.apply(_get_metaphone, axis=1, args=("plant_name",))
-    df["utility_name_mphone"] = df.apply(_get_metaphone, axis=1, args=("utility_name",))
+    memo_path = _metaphone_memo_path()
+    df["plant_name_mphone"] = get_metaphones(df["plant_name"], memo_path=memo_path)
+    df["utility_name_mphone"] = get_metaphones(df["utility_name"], memo_path=memo_path)
     cols = ID_COL + MATCHING_COLS + EXTRA_COLS
     df = df.loc[:, cols]
     return df
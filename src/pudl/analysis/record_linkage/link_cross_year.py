@@ -6,11 +6,13 @@ from tempfile import TemporaryDirectory
 import mlflow
 import numpy as np
 import pandas as pd
+import scipy.sparse
+import scipy.sparse.csgraph
 from dagster import Config, graph, op
 from numba import njit
 from numba.typed import List
 from sklearn.cluster import DBSCAN, AgglomerativeClustering
-from sklearn.metrics import pairwise_distances_chunked
+from sklearn.metrics import pairwise_distances, pairwise_distances_chunked
 from sklearn.neighbors import NearestNeighbors
 
 import pudl
@@ -25,22 +27,40 @@ class PenalizeReportYearDistanceConfig(Config):
 
     The metric can be any string accepted by :func:`scipy.spatial.distance.pdist`, e.g.
     ``cosine`` or ``euclidean``.
+
+    When ``sparse`` is set, the full pairwise distance matrix is never materialized.
+    Instead, only the ``eps``-radius neighbor graph is built using a neighbor index, and
+    the distances needed by later steps are computed on demand.
     """
 
     distance_penalty: float = 10000.0
     metric: str = "euclidean"
+    sparse: bool = False
 
 
 class DistanceMatrix:
-    """Class to wrap a distance matrix saved in a np.memmap."""
+    """Class to wrap a distance matrix saved in a np.memmap.
+
+    In sparse mode (see :class:`PenalizeReportYearDistanceConfig`) no distance matrix
+    is stored. The feature matrix and report years are kept instead, and the methods
+    below compute only the distances each step of the model actually needs, applying
+    the same year penalty as the dense matrix.
+    """
 
     def __init__(
         self,
-        feature_matrix: np.ndarray,
+        feature_matrix: np.ndarray | scipy.sparse.csr_matrix,
         original_df: pd.DataFrame,
         config: PenalizeReportYearDistanceConfig,
     ):
         """Compute distance matrix from feature_matrix and write to memmap."""
+        self.config = config
+        self.feature_matrix = feature_matrix
+        self.year_codes = pd.factorize(original_df["report_year"])[0]
+        self.distance_matrix = None
+        if config.sparse:
+            return
+
         self.file_buffer = TemporaryDirectory()
 
         filename = Path(self.file_buffer.name) / "distance_matrix.dat"
@@ -77,6 +97,165 @@ class DistanceMatrix:
             shape=(feature_matrix.shape[0], feature_matrix.shape[0]),
         )
 
+    def _penalized_distances(
+        self, row_inds: np.ndarray, col_inds: np.ndarray
+    ) -> np.ndarray:
+        """Compute the penalized distances between two sets of records."""
+        distances = pairwise_distances(
+            self.feature_matrix[row_inds],
+            self.feature_matrix[col_inds],
+            metric=self.config.metric,
+        ).astype("float32")
+        same_year = (
+            self.year_codes[row_inds][:, np.newaxis]
+            == self.year_codes[col_inds][np.newaxis, :]
+        )
+        distances[same_year] = self.config.distance_penalty
+        distances[row_inds[:, np.newaxis] == col_inds[np.newaxis, :]] = 0
+        return distances
+
+    def radius_neighbors_graph(self, eps: float) -> scipy.sparse.csr_matrix:
+        """Return a sparse graph of the distances between records within ``eps``.
+
+        Records are not included as their own neighbors. In sparse mode, the graph is
+        found with a neighbor index over the feature matrix, and edges between records
+        from the same report year are penalized after the fact, so they are dropped
+        unless the penalty itself falls within ``eps``.
+        """
+        if self.distance_matrix is not None:
+            neighbor_computer = NearestNeighbors(radius=eps, metric="precomputed")
+            neighbor_computer.fit(self.distance_matrix)
+            return neighbor_computer.radius_neighbors_graph(mode="distance")
+
+        # Pad the radius so float32 rounding below matches the dense matrix
+        neighbor_computer = NearestNeighbors(
+            radius=eps * (1 + 1e-6), metric=self.config.metric
+        )
+        neighbor_computer.fit(self.feature_matrix)
+        graph = neighbor_computer.radius_neighbors_graph(mode="distance").tocoo()
+
+        # Match the precision of the dense float32 distance matrix
+        data = graph.data.astype("float32")
+        same_year = self.year_codes[graph.row] == self.year_codes[graph.col]
+        data[same_year] = self.config.distance_penalty
+        keep = data <= eps
+        # Build the graph directly so that explicit zero distances are retained
+        return scipy.sparse.csr_matrix(
+            (data[keep], (graph.row[keep], graph.col[keep])), shape=graph.shape
+        )
+
+    def cluster_distance_matrix(self, cluster_inds: np.ndarray) -> np.ndarray:
+        """Return a distance matrix with only distances within a cluster."""
+        if self.distance_matrix is not None:
+            return get_cluster_distance_matrix(self.distance_matrix, cluster_inds)
+        return self._penalized_distances(cluster_inds, cluster_inds)
+
+    def average_distance_matrix(self, cluster_groups: list[list[int]]) -> np.ndarray:
+        """Compute average distance between each pair of clusters of records.
+
+        In sparse mode, only the distances between the records in ``cluster_groups``
+        are computed, and they are summed per pair of clusters with a sparse cluster
+        membership matrix. Callers should pass in only the clusters they need, see
+        :func:`fit_predict_by_component`.
+        """
+        if self.distance_matrix is not None:
+            return get_average_distance_matrix(self.distance_matrix, cluster_groups)
+
+        n_clusters = len(cluster_groups)
+        cluster_sizes = np.array([len(group) for group in cluster_groups])
+        record_inds = np.concatenate(cluster_groups)
+        membership = scipy.sparse.csr_matrix(
+            (
+                np.ones(len(record_inds)),
+                (
+                    np.arange(len(record_inds)),
+                    np.repeat(np.arange(n_clusters), cluster_sizes),
+                ),
+            ),
+            shape=(len(record_inds), n_clusters),
+        )
+        distances = self._penalized_distances(record_inds, record_inds)
+        total_dist = membership.T @ (distances.astype("float64") @ membership)
+
+        average_dist_matrix = total_dist / (
+            cluster_sizes[:, np.newaxis] + cluster_sizes[np.newaxis, :]
+        )
+        np.fill_diagonal(average_dist_matrix, 0)
+        return average_dist_matrix
+
+    def cluster_components(
+        self, cluster_groups: list[np.ndarray], radius: float
+    ) -> np.ndarray:
+        """Find groups of clusters that are linked by records within ``radius``.
+
+        Two clusters are linked if any of their records are within ``radius`` of each
+        other. This uses the sparse ``radius`` neighbor graph, so the dense
+        records-by-records distance matrix is never materialized.
+
+        Returns:
+            The connected component of the linked clusters that each cluster is in.
+        """
+        n_clusters = len(cluster_groups)
+        record_clusters = np.empty(self.feature_matrix.shape[0], dtype=np.int64)
+        record_clusters[np.concatenate(cluster_groups)] = np.repeat(
+            np.arange(n_clusters), [len(group) for group in cluster_groups]
+        )
+        graph = self.radius_neighbors_graph(radius).tocoo()
+        cluster_graph = scipy.sparse.coo_matrix(
+            (
+                np.ones(graph.nnz, dtype=bool),
+                (record_clusters[graph.row], record_clusters[graph.col]),
+            ),
+            shape=(n_clusters, n_clusters),
+        )
+        _, components = scipy.sparse.csgraph.connected_components(
+            cluster_graph, directed=False
+        )
+        return components
+
+
+def fit_predict_by_component(
+    classifier: AgglomerativeClustering,
+    distance_matrix: DistanceMatrix,
+    cluster_groups: list[np.ndarray],
+) -> np.ndarray:
+    """Cluster groups of records with average linkage, one linked component at a time.
+
+    The average distance between two clusters is the sum of the distances between
+    their records divided by the sum of their sizes, so clusters with no records
+    within twice the classifier's distance threshold of each other are always at least
+    the threshold apart. Average linkage can then never merge clusters from different
+    components of the graph that links clusters with records within that radius.
+    Each component is clustered on its own with the exact average distances between
+    its clusters, which gives the same result as clustering all of them at once,
+    without the dense clusters-by-clusters or records-by-records distance matrices.
+
+    Returns:
+        A label for each cluster, numbered consecutively from zero.
+    """
+    components = distance_matrix.cluster_components(
+        cluster_groups, radius=2 * classifier.distance_threshold
+    )
+    component_sizes = np.bincount(components)
+    component_starts = np.concatenate([[0], np.cumsum(component_sizes)])
+    by_component = np.argsort(components, kind="stable")
+
+    sub_labels = np.zeros(len(cluster_groups), dtype=np.int64)
+    for component in np.flatnonzero(component_sizes > 1):
+        inds = by_component[
+            component_starts[component] : component_starts[component + 1]
+        ]
+        sub_labels[inds] = classifier.fit_predict(
+            distance_matrix.average_distance_matrix(
+                [cluster_groups[ind] for ind in inds]
+            )
+        )
+
+    labels, _ = pd.factorize(
+        components.astype(np.int64) * len(cluster_groups) + sub_labels
+    )
+    return labels
+
 
 def get_cluster_distance_matrix(
     distance_matrix: np.ndarray, cluster_inds: np.ndarray
@@ -122,7 +301,7 @@ def compute_distance_with_year_penalty(
     original_df: pd.DataFrame,
 ) -> DistanceMatrix:
     """Compute a distance matrix and penalize records from the same year."""
-    logger.info(f"Dist metric: {config.metric}")
+    logger.info(f"Dist metric: {config.metric}, sparse: {config.sparse}")
     return DistanceMatrix(feature_matrix.matrix, original_df, config)
 
 
@@ -143,9 +322,7 @@ def cluster_records_dbscan(
 ) -> pd.DataFrame:
     """Generate initial IDs using DBSCAN algorithm."""
     # DBSCAN is very efficient when passed a sparse radius neighbor graph
-    neighbor_computer = NearestNeighbors(radius=config.eps, metric="precomputed")
-    neighbor_computer.fit(distance_matrix.distance_matrix)
-    neighbor_graph = neighbor_computer.radius_neighbors_graph(mode="distance")
+    neighbor_graph = distance_matrix.radius_neighbors_graph(config.eps)
 
     # Classify records
     classifier = DBSCAN(metric="precomputed", eps=config.eps, min_samples=2)
@@ -218,9 +395,7 @@ def split_clusters(
         cluster_inds = id_year_df[
             id_year_df.record_label == duplicated_id
         ].index.to_numpy()
-        cluster_distances = get_cluster_distance_matrix(
-            distance_matrix.distance_matrix, cluster_inds
-        )
+        cluster_distances = distance_matrix.cluster_distance_matrix(cluster_inds)
 
         new_labels = classifier.fit_predict(cluster_distances)
         for new_label in np.unique(new_labels):
@@ -258,7 +433,8 @@ def match_orphaned_records(
     is a cluster of a single point. Then, a distance matrix is computed with the average
     distance between each cluster, and is used in a round of agglomerative clustering.
     This will match orphaned records to existing clusters, or assign them unique ID's if
-    they don't appear close enough to any existing clusters.
+    they don't appear close enough to any existing clusters. In sparse mode the clusters
+    are matched one linked component at a time, see :func:`fit_predict_by_component`.
     """
     classifier = AgglomerativeClustering(
         metric="precomputed",
@@ -270,18 +446,22 @@ def match_orphaned_records(
     cluster_inds = id_year_df.groupby("record_label").indices
 
     # Orphaned records are considered a cluster of a single record
-    cluster_groups = [List([ind]) for ind in cluster_inds.get(-1, [])]
+    cluster_groups = [np.array([ind]) for ind in cluster_inds.get(-1, [])]
 
     # Get list of all points in each assigned cluster
-    cluster_groups += [List(inds) for key, inds in cluster_inds.items() if key != -1]
-    cluster_groups = List(cluster_groups)
+    cluster_groups += [inds for key, inds in cluster_inds.items() if key != -1]
 
-    average_dist_matrix = get_average_distance_matrix(
-        distance_matrix.distance_matrix, cluster_groups
-    )
+    if distance_matrix.config.sparse:
+        new_labels = fit_predict_by_component(
+            classifier, distance_matrix, cluster_groups
+        )
+    else:
+        average_dist_matrix = distance_matrix.average_distance_matrix(
+            List([List(group) for group in cluster_groups])
+        )
+        new_labels = classifier.fit_predict(average_dist_matrix)
 
     # Assign new labels to all points
-    new_labels = classifier.fit_predict(average_dist_matrix)
     for inds, label in zip(cluster_groups, new_labels, strict=True):
         id_year_df.loc[inds, "record_label"] = label
 
@@ -6,18 +6,22 @@ the historical spatial extent of utility and balancing area territories. Output
 resulting geometries for use in other applications.
 """
 
+import hashlib
 import math
 import pathlib
 import sys
 from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
 from typing import Literal
 
 import click
 import geopandas as gpd
 import pandas as pd
+import shapely
 import sqlalchemy as sa
 from dagster import AssetsDefinition, Field, asset
 from matplotlib import pyplot as plt
+from shapely.geometry.base import BaseGeometry
 
 import pudl
 from pudl.workspace.setup import PudlPaths
@@ -122,11 +126,94 @@ def get_territory_fips(
     )
 
 
+def _county_set_hash(county_id_fips: pd.Series) -> str:
+    """Hash a sorted set of county FIPS codes."""
+    return hashlib.sha256(",".join(county_id_fips).encode()).hexdigest()
+
+
+_COUNTY_GEOMETRIES: pd.Series | None = None  # In dissolve worker processes
+
+
+def _set_county_geometries(county_geometries: pd.Series) -> None:
+    """Send the county geometries to a dissolve worker process, once."""
+    global _COUNTY_GEOMETRIES
+    _COUNTY_GEOMETRIES = county_geometries
+
+
+def _dissolve_counties(
+    county_id_fips: tuple[str, ...], county_geometries: pd.Series | None = None
+) -> BaseGeometry:
+    """Dissolve the geometries of a set of counties into a single geometry.
+
+    Args:
+        county_id_fips: County FIPS codes.
+        county_geometries: Geometry of each county, indexed by county FIPS code. By
+            default, those sent to the worker process are used.
+    """
+    if county_geometries is None:
+        county_geometries = _COUNTY_GEOMETRIES
+    return shapely.union_all(county_geometries.loc[list(county_id_fips)].to_numpy())
+
+
+def dissolve_county_sets(
+    gdf: gpd.GeoDataFrame, by: list[str], max_workers: int = 1
+) -> gpd.GeoSeries:
+    """Dissolve county geometries, once for each distinct set of counties.
+
+    Many entities are associated with exactly the same set of counties from one year
+    to the next, and many balancing authorities share a set of counties. Each group is
+    keyed by a hash of its sorted county FIPS codes, and the counties of each distinct
+    key are only dissolved once, in parallel if requested. This gives the same
+    geometries as :meth:`geopandas.GeoDataFrame.dissolve`.
+
+    Args:
+        gdf: County geometries, with a ``county_id_fips`` column and no duplicate
+            counties within a group.
+        by: The columns to group by in the dissolve.
+        max_workers: Number of processes to dissolve distinct county sets in. If 1,
+            they are dissolved serially in the current process.
+
+    Returns:
+        Dissolved geometry of each group, indexed by the sorted groups.
+    """
+    gdf = gdf.sort_values("county_id_fips", kind="stable")
+    keys = gdf.groupby(by)["county_id_fips"].agg(_county_set_hash)
+    firsts = keys.drop_duplicates()
+    # The counties of the first group having each distinct key
+    county_sets = (
+        gdf.set_index(by)
+        .loc[firsts.index, "county_id_fips"]
+        .groupby(level=by, sort=False)
+        .agg(tuple)
+    )
+    county_geometries = gdf.drop_duplicates("county_id_fips").set_index(
+        "county_id_fips"
+    )[gdf.geometry.name]
+    logger.info(
+        f"Dissolving {len(county_sets)} distinct county sets for {len(keys)} groups"
+    )
+    if max_workers == 1:
+        dissolved = [_dissolve_counties(x, county_geometries) for x in county_sets]
+    else:
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_set_county_geometries,
+            initargs=(county_geometries,),
+        ) as executor:
+            chunksize = max(1, len(county_sets) // (4 * max_workers))
+            dissolved = list(
+                executor.map(_dissolve_counties, county_sets, chunksize=chunksize)
+            )
+    geometries = dict(zip(firsts.loc[county_sets.index], dissolved, strict=True))
+    return gpd.GeoSeries(keys.map(geometries), crs=gdf.crs, name=gdf.geometry.name)
+
+
 def add_geometries(
     df: pd.DataFrame,
     census_gdf: gpd.GeoDataFrame,
     dissolve: bool = False,
     dissolve_by: list[str] = None,
+    max_workers: int = 1,
 ) -> gpd.GeoDataFrame:
     """Merge census geometries into dataframe on county_id_fips, optionally dissolving.
 
@@ -146,6 +233,8 @@ def add_geometries(
             dissolve_by=["report_date", "utility_id_eia"] might provide annual utility
             service territories, while ["report_date", "balancing_authority_id_eia"]
             would provide annual balancing authority territories.
+        max_workers: Number of processes to dissolve geometries in. See
+            :func:`dissolve_county_sets`.
 
     Returns:
         geopandas.GeoDataFrame
@@ -176,18 +265,8 @@ def add_geometries(
             out_gdf.groupby(dissolve_by)[["population", "area_km2"]].sum().reset_index()
         )
         out_gdf = (
-            out_gdf.dissolve(by=dissolve_by)
-            .drop(
-                [
-                    "county_id_fips",
-                    "county",
-                    "county_name_census",
-                    "state",
-                    "state_id_fips",
-                    "population",
-                    "area_km2",
-                ],
-                axis="columns",
+            gpd.GeoDataFrame(
+                dissolve_county_sets(out_gdf, by=dissolve_by, max_workers=max_workers)
             )
             .reset_index()
             .merge(summed)
@@ -203,6 +282,7 @@ def get_territory_geometries(
     census_gdf: gpd.GeoDataFrame,
     limit_by_state: bool = True,
     dissolve: bool = False,
+    max_workers: int = 1,
 ) -> gpd.GeoDataFrame:
     """Compile service territory geometries based on county_id_fips.
 
@@ -214,8 +294,9 @@ def get_territory_geometries(
     each combination of entity and year.
 
     Note:
-        Dissolving geometires is a costly operation, and may take half an hour or more
-        if you are processing all entities for all years. Dissolving also means that all
+        Dissolving geometires is a costly operation, even though each distinct set of
+        counties is only dissolved once (see :func:`dissolve_county_sets`), and
+        ``max_workers`` processes can be used to speed it up. Dissolving also means that all
         the per-county information will be lost, rendering the output inappropriate for
         use in many analyses. Dissolving is mostly useful for generating visualizations.
 
@@ -240,6 +321,8 @@ def get_territory_geometries(
             county-level geometries for each utility in each year will be merged
             together ("dissolved") resulting in a single geometry and record for each
             balancing_authority-year.
+        max_workers: Number of processes to dissolve geometries in. See
+            :func:`dissolve_county_sets`.
 
     Returns:
         A GeoDataFrame with service territory geometries for each entity.
@@ -255,6 +338,7 @@ def get_territory_geometries(
         census_gdf,
         dissolve=dissolve,
         dissolve_by=["report_date", assn_col],
+        max_workers=max_workers,
     )
 
 
@@ -307,6 +391,7 @@ def compile_geoms(
     dissolve: bool = False,
     limit_by_state: bool = True,
     years: list[int] = [],
+    max_workers: int = 1,
 ) -> pd.DataFrame:
     """Compile all available utility or balancing authority geometries.
 
@@ -367,6 +452,7 @@ def compile_geoms(
         census_gdf=census_counties,
         limit_by_state=limit_by_state,
         dissolve=dissolve,
+        max_workers=max_workers,
     )
     if save_format == "geoparquet":
         # TODO[dagster]: update to use IO Manager.
@@ -414,6 +500,11 @@ def service_territory_asset_factory(
                     "Format of output in PUDL. One of: geoparquet, geodataframe, dataframe."
                 ),
             ),
+            "max_workers": Field(
+                int,
+                default_value=1,
+                description="Number of processes used to dissolve geometries in parallel.",
+            ),
         },
         compute_kind="Python",
     )
@@ -447,6 +538,7 @@ def service_territory_asset_factory(
             dissolve=dissolve,
             limit_by_state=limit_by_state,
             save_format=save_format,
+            max_workers=context.op_config["max_workers"],
         )
 
     return _service_territory
@@ -625,6 +717,16 @@ def plot_all_territories(
     ),
     show_default=True,
 )
+@click.option(
+    "--max-workers",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help=(
+        "Number of processes used to dissolve geometries in parallel. Each distinct "
+        "set of counties is only dissolved once."
+    ),
+)
 @click.option(
     "--output-dir",
     "-o",
@@ -664,6 +766,7 @@ def plot_all_territories(
 def pudl_service_territories(
     entity_type: Literal["utility", "balancing_authority"],
     dissolve: bool,
+    max_workers: int,
     output_dir: pathlib.Path,
     limit_by_state: bool,
     years: list[int],
@@ -726,6 +829,7 @@ FROM
         entity_type=entity_type,
         limit_by_state=limit_by_state,
         years=years,
+        max_workers=max_workers,
     )
 
 
@@ -1,12 +1,13 @@
 """Spatial operations for demand allocation."""
 
-import itertools
 import warnings
 from collections.abc import Callable, Iterable
 from typing import Literal
 
 import geopandas as gpd
+import numpy as np
 import pandas as pd
+import shapely
 import shapely.ops
 from shapely.geometry import GeometryCollection, MultiPolygon, Polygon
 from shapely.geometry.base import BaseGeometry
@@ -139,21 +140,27 @@ def self_union(gdf: gpd.GeoDataFrame, ratios: Iterable[str] = None) -> gpd.GeoDa
     is_mpoly = gdf.geometry.geom_type == "MultiPolygon"
     if is_mpoly.any():
         raise NotImplementedError("MultiPolygon geometries are not yet supported")
-    # Calculate all pairwise intersections
+    # Calculate the intersections of all pairs of features that intersect
     # https://nbviewer.jupyter.org/gist/jorisvandenbossche/3a55a16fda9b3c37e0fb48b1d4019e65
-    pairs = itertools.combinations(gdf.geometry, 2)
-    intersections = gpd.GeoSeries([a.intersection(b) for a, b in pairs])
+    left, right = intersecting_pairs(gdf.geometry)
+    geoms = gdf.geometry.to_numpy()
+    intersections = gpd.GeoSeries(shapely.intersection(geoms[left], geoms[right]))
     # Form polygons from the boundaries of the original polygons and their intersections
     boundaries = pd.concat([gdf.geometry, intersections]).boundary.unary_union
     polygons = gpd.GeoSeries(shapely.ops.polygonize(boundaries))
     # Determine origin of each polygon by a spatial join on representative points
+    # (dropping gaps enclosed by features, which are within none of them)
     points = gpd.GeoDataFrame(geometry=polygons.representative_point())
-    oids = gpd.sjoin(
-        points,
-        gdf[["geometry"]],
-        how="left",
-        predicate="within",
-    )["index_right"]
+    oids = (
+        gpd.sjoin(
+            points,
+            gdf[["geometry"]],
+            how="left",
+            predicate="within",
+        )["index_right"]
+        .dropna()
+        .astype(int)
+    )
     # Build new dataframe
     columns = get_data_columns(gdf)
     df = gpd.GeoDataFrame(
@@ -170,6 +177,27 @@ def self_union(gdf: gpd.GeoDataFrame, ratios: Iterable[str] = None) -> gpd.GeoDa
     return df[gdf.columns]
 
 
+def intersecting_pairs(geoms: gpd.GeoSeries) -> tuple[np.ndarray, np.ndarray]:
+    """Find all pairs of geometries which intersect, using a spatial index.
+
+    Only pairs whose bounding boxes overlap (as found with a
+    :class:`shapely.STRtree`) are tested for intersection, rather than all pairs.
+
+    Args:
+        geoms: Geometries.
+
+    Returns:
+        Positions of the first and second geometry of each intersecting pair, with
+        the first less than the second, in the order of
+        :func:`itertools.combinations`.
+    """
+    left, right = geoms.sindex.query(geoms.to_numpy(), predicate="intersects")
+    keep = left < right
+    left, right = left[keep], right[keep]
+    order = np.lexsort((right, left))
+    return left[order], right[order]
+
+
 def dissolve(
     gdf: gpd.GeoDataFrame,
     by: Iterable[str],
@@ -18,7 +18,9 @@ electricity demand estimates (e.g. at the county level).
 """
 
 import datetime
-from collections.abc import Iterable
+from collections.abc import Iterable, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
 from typing import Any
 
 import geopandas as gpd
@@ -29,6 +31,7 @@ from dagster import AssetOut, Field, asset, multi_asset
 import pudl.analysis.timeseries_cleaning
 import pudl.logging_helpers
 import pudl.output.pudltabl
+import pudl.workspace.memo
 from pudl.metadata.dfs import POLITICAL_SUBDIVISIONS
 
 logger = pudl.logging_helpers.get_logger(__name__)
@@ -378,45 +381,91 @@ def filter_ferc714_hourly_demand_matrix(
     return df
 
 
+def _impute_ferc714_year(
+    year: int,
+    gdf: pd.DataFrame,
+    seed: Sequence[int],
+    initial: pd.DataFrame | None = None,
+) -> pd.DataFrame:
+    """Impute a single year of the FERC 714 hourly demand matrix.
+
+    Only the respondents reporting data in the year are included. Values from
+    ``initial`` are used to warm start the imputation where available.
+    """
+    logger.info(f"Imputing year {year}")
+    keep = gdf.columns[~gdf.isnull().all()]
+    tsi = pudl.analysis.timeseries_cleaning.Timeseries(gdf[keep])
+    if initial is not None:
+        initial = initial.reindex(index=gdf.index, columns=keep).to_numpy()
+    return tsi.to_dataframe(
+        tsi.impute(method="tnn", seed=seed, initial=initial), copy=False
+    )
+
+
 def impute_ferc714_hourly_demand_matrix(
-    df: pd.DataFrame, years: list[int]
+    df: pd.DataFrame,
+    years: list[int],
+    max_workers: int = 1,
+    seed: int = 0,
+    initial: pd.DataFrame | None = None,
 ) -> pd.DataFrame:
     """Impute null values in FERC 714 hourly demand matrix.
 
     Imputation is performed separately for each year,
     with only the respondents reporting data in that year.
+    Years can be imputed in parallel, and each year is seeded from ``seed`` and the
+    year, so the results don't depend on the number of workers.
 
     .. note::
-        Takes about 15 minutes.
+        Takes about 15 minutes when run serially.
 
     Args:
         df: FERC 714 hourly demand matrix,
           as described in :func:`load_ferc714_hourly_demand_matrix`.
         years: list of years to input
+        max_workers: Number of processes to impute years in. If 1, all years are
+            imputed serially in the current process.
+        seed: Random number generator seed.
+        initial: Previously imputed FERC 714 hourly demand matrix, e.g. from an earlier
+            run, used to warm start the imputation of each year.
 
     Returns:
         Copy of `df` with imputed values.
     """
-    results = []
     # sort here and then don't sort in the groupby so we can process
     # the newer years of data first. This is so we can see early if
     # new data causes any failures.
     df = df.sort_index(ascending=False)
-    for year, gdf in df.groupby(df.index.year, sort=False):
-        # remove the records o/s of the working years because some
-        # respondents report one record of midnight of January first
-        # of the next year (report_date.dt.year + 1). and
-        # impute_ferc714_hourly_demand_matrix chunks over years at a time
-        # and having only one record
-        if year in years:
-            logger.info(f"Imputing year {year}")
-            keep = df.columns[~gdf.isnull().all()]
-            tsi = pudl.analysis.timeseries_cleaning.Timeseries(gdf[keep])
-            result = tsi.to_dataframe(tsi.impute(method="tnn"), copy=False)
-            results.append(result)
+    # remove the records o/s of the working years because some
+    # respondents report one record of midnight of January first
+    # of the next year (report_date.dt.year + 1). and
+    # impute_ferc714_hourly_demand_matrix chunks over years at a time
+    # and having only one record
+    jobs = [
+        (
+            year,
+            gdf,
+            [seed, year],
+            None if initial is None else initial[initial.index.year == year],
+        )
+        for year, gdf in df.groupby(df.index.year, sort=False)
+        if year in years
+    ]
+    if max_workers == 1:
+        results = [_impute_ferc714_year(*job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(_impute_ferc714_year, *zip(*jobs, strict=True)))
     return pd.concat(results)
 
 
+def _imputed_demand_matrix_path() -> Path:
+    """Location of the imputed FERC 714 demand matrix used for warm starts."""
+    return pudl.workspace.memo.memo_path(
+        "ferc714", "ferc714_imputed_demand_matrix.parquet"
+    )
+
+
 def melt_ferc714_hourly_demand_matrix(
     df: pd.DataFrame, tz: pd.DataFrame
 ) -> pd.DataFrame:
@@ -490,6 +539,26 @@ def _out_ferc714__hourly_demand_matrix(
 @asset(
     compute_kind="NumPy",
     required_resource_keys={"dataset_settings"},
+    config_schema={
+        "max_workers": Field(
+            int,
+            default_value=1,
+            description="Number of processes used to impute years in parallel.",
+        ),
+        "seed": Field(
+            int,
+            default_value=0,
+            description="Random number generator seed for the imputation.",
+        ),
+        "warm_start": Field(
+            bool,
+            default_value=False,
+            description=(
+                "Warm start the imputation from the imputed demand matrix saved by a "
+                "previous run, and save the new result for the next run."
+            ),
+        ),
+    },
 )
 def _out_ferc714__hourly_imputed_demand(
     context,
@@ -500,7 +569,8 @@ def _out_ferc714__hourly_imputed_demand(
 
     Impute null values for FERC 714 hourly demand matrix, performing imputation
     separately for each year using only respondents reporting data in that year. Then,
-    melt data into a long format.
+    melt data into a long format. Years can be imputed in parallel, and warm started
+    from the result of a previous run, via the asset config.
 
     Args:
         _out_ferc714__hourly_demand_matrix: Cleaned hourly demand matrix from FERC 714.
@@ -510,7 +580,24 @@ def _out_ferc714__hourly_imputed_demand(
         df: DataFrame with imputed FERC714 hourly demand.
     """
     years = context.resources.dataset_settings.ferc714.years
-    df = impute_ferc714_hourly_demand_matrix(_out_ferc714__hourly_demand_matrix, years)
+    initial = None
+    path = _imputed_demand_matrix_path()
+    if (
+        context.op_config["warm_start"]
+        and (previous := pudl.workspace.memo.read_memo(path)) is not None
+    ):
+        logger.info(f"Warm starting imputation from {path}")
+        # Parquet requires string column names, but respondent IDs are integers
+        initial = previous.rename(columns=int)
+    df = impute_ferc714_hourly_demand_matrix(
+        _out_ferc714__hourly_demand_matrix,
+        years,
+        max_workers=context.op_config["max_workers"],
+        seed=context.op_config["seed"],
+        initial=initial,
+    )
+    if context.op_config["warm_start"]:
+        pudl.workspace.memo.write_memo(df.rename(columns=str), path)
     df = melt_ferc714_hourly_demand_matrix(df, _out_ferc714__utc_offset)
     return df
 
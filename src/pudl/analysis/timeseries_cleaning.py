@@ -30,14 +30,19 @@ And described at:
 """
 
 import functools
-import warnings
-from collections.abc import Iterable, Sequence
-from typing import Any
+from collections.abc import Callable, Iterable, Sequence
+from typing import Any, Literal
 
 import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
 import scipy.stats
+from numba import njit
+from sklearn.utils.extmath import randomized_svd
+
+import pudl.logging_helpers
+
+logger = pudl.logging_helpers.get_logger(__name__)
 
 # ---- Helpers ---- #
 
@@ -304,8 +309,74 @@ def _ten2mat(tensor: np.ndarray, mode: int) -> np.ndarray:
     )
 
 
-def _svt_tnn(matrix: np.ndarray, tau: float, theta: int) -> np.ndarray:
+def _svd_gram(
+    matrix: np.ndarray, tau: float
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Singular triplets above ``tau`` from an eigendecomposition of the Gram matrix.
+
+    The Gram matrix is formed along the smaller dimension of ``matrix``, so this is
+    much faster than a full SVD when one dimension is small (e.g. the number of hours
+    in a day, or of respondents), at the cost of some precision in the smallest
+    singular values.
+    """
+    if matrix.shape[0] > matrix.shape[1]:
+        v, s, ut = _svd_gram(matrix.T, tau)
+        return ut.T, s, v.T
+    # Strided views (e.g. tensor slices) make the matrix product much slower
+    matrix = np.ascontiguousarray(matrix)
+    w, u = np.linalg.eigh(matrix @ matrix.T)
+    s = np.sqrt(np.clip(w[::-1], 0, None))
+    u = u[:, ::-1]
+    r = np.sum(s > tau)
+    u, s = u[:, :r], s[:r]
+    return u, s, (u.T @ matrix) / s[:, np.newaxis]
+
+
+def _svd_randomized(
+    matrix: np.ndarray, tau: float, rank: int = 16
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Singular triplets above ``tau`` from a randomized truncated SVD.
+
+    The rank of the truncated SVD starts at ``rank`` and is doubled until the smallest
+    singular value found falls below ``tau``. If that requires a large fraction of the
+    full rank, the Gram matrix method is used instead.
+    """
+    full_rank = min(matrix.shape)
+    matrix = np.ascontiguousarray(matrix)
+    while 2 * rank < full_rank:
+        u, s, vt = randomized_svd(matrix, n_components=rank, random_state=0)
+        if s[-1] <= tau:
+            r = np.sum(s > tau)
+            return u[:, :r], s[:r], vt[:r, :]
+        rank *= 2
+    return _svd_gram(matrix, tau)
+
+
+SVD_KERNELS: dict[
+    str, Callable[[np.ndarray, float], tuple[np.ndarray, np.ndarray, np.ndarray]]
+] = {
+    "gram": _svd_gram,
+    "randomized": _svd_randomized,
+}
+"""Low-rank SVD kernels that can be used by the LATC imputers instead of a full SVD.
+
+Each kernel takes a matrix and a threshold, and returns the left singular vectors,
+singular values, and right singular vectors for all singular values above the
+threshold.
+"""
+
+SvdKernel = Literal["exact", "gram", "randomized"]
+
+
+def _svt_tnn(
+    matrix: np.ndarray, tau: float, theta: int, svd: SvdKernel = "exact"
+) -> np.ndarray:
     """Singular value thresholding (SVT) truncated nuclear norm (TNN) minimization."""
+    if svd != "exact":
+        u, s, vt = SVD_KERNELS[svd](matrix, tau)
+        vec = s.copy()
+        vec[theta:] = s[theta:] - tau
+        return (u * vec) @ vt
     [m, n] = matrix.shape
     if 2 * m < n:
         u, s, v = np.linalg.svd(matrix @ matrix.T, full_matrices=0)
@@ -324,6 +395,21 @@ def _svt_tnn(matrix: np.ndarray, tau: float, theta: int) -> np.ndarray:
     return u[:, :idx] @ np.diag(vec) @ v[:idx, :]
 
 
+def _initial_missing_values(
+    mat: np.ndarray, pos_missing: tuple[np.ndarray, ...], initial: np.ndarray | None
+) -> np.ndarray:
+    """Initial guesses for the missing values in an unfolded tensor.
+
+    Missing values start out as the mean of the observed values, unless a warm start
+    tensor is provided, in which case its non-null values are used instead.
+    """
+    values = np.full(len(pos_missing[0]), np.mean(mat[mat != 0]))
+    if initial is not None:
+        warm = _ten2mat(initial, mode=0)[pos_missing]
+        values = np.where(np.isnan(warm), values, warm)
+    return values
+
+
 def impute_latc_tnn(
     tensor: np.ndarray,
     lags: Sequence[int] = [1],
@@ -333,6 +419,9 @@ def impute_latc_tnn(
     theta: int = 20,
     epsilon: float = 1e-7,
     maxiter: int = 300,
+    seed: int | Sequence[int] | None = None,
+    initial: np.ndarray | None = None,
+    svd: SvdKernel = "exact",
 ) -> np.ndarray:
     """Impute tensor values with LATC-TNN method by Chen and Sun (2020).
 
@@ -352,11 +441,18 @@ def impute_latc_tnn(
         theta:
         epsilon: Convergence criterion. A smaller number will result in more iterations.
         maxiter: Maximum number of iterations.
+        seed: Random number generator seed to ensure deterministic results.
+        initial: Tensor of the same shape as `tensor` with initial guesses for the
+            missing values (e.g. the result of a previous imputation), which can
+            reduce the number of iterations needed to converge. Null values are
+            ignored.
+        svd: Singular value decomposition to use in each iteration. Either ``exact``
+            for a full SVD, or one of the low-rank :data:`SVD_KERNELS`.
 
     Returns:
         Tensor with missing values in `tensor` replaced by imputed values.
     """
-    rng = np.random.default_rng()
+    rng = np.random.default_rng(seed)
     tensor = np.where(np.isnan(tensor), 0, tensor)
     dim = np.array(tensor.shape)
     dim_time = int(np.prod(dim) / dim[0])
@@ -367,7 +463,7 @@ def impute_latc_tnn(
     x = np.zeros(np.insert(dim, 0, len(dim)))
     t = np.zeros(np.insert(dim, 0, len(dim)))
     z = mat.copy()
-    z[pos_missing] = np.mean(mat[mat != 0])
+    z[pos_missing] = _initial_missing_values(mat, pos_missing, initial)
     a = 0.001 * rng.random(dim[0] * d).reshape([dim[0], d])
     it = 0
     ind = np.zeros((d, dim_time - max_lag), dtype=int)
@@ -384,6 +480,7 @@ def impute_latc_tnn(
                     _ten2mat(_mat2ten(z, shape=dim, mode=0) - t[k] / rho, mode=k),
                     tau=alpha[k] / rho,
                     theta=theta,
+                    svd=svd,
                 ),
                 shape=dim,
                 mode=k,
@@ -410,19 +507,25 @@ def impute_latc_tnn(
         tol = np.linalg.norm((mat_hat - last_mat), "fro") / snorm
         last_mat = mat_hat.copy()
         it += 1
-        print(f"Iteration: {it}", end="\r")
+        logger.debug(f"LATC-TNN iteration {it}: relative change {tol:.3e}")
         if tol < epsilon or it >= maxiter:
             break
-    print(f"Iteration: {it}")
+    logger.info(f"LATC-TNN stopped after {it} iterations (relative change {tol:.3e})")
     return tensor_hat
 
 
-def _tsvt(tensor: np.ndarray, phi: np.ndarray, tau: float) -> np.ndarray:
+def _tsvt(
+    tensor: np.ndarray, phi: np.ndarray, tau: float, svd: SvdKernel = "exact"
+) -> np.ndarray:
     """Tensor singular value thresholding (TSVT)."""
     dim = tensor.shape
     x = np.zeros(dim)
     tensor = np.einsum("kt, ijk -> ijt", phi, tensor)
     for t in range(dim[2]):
+        if svd != "exact":
+            u, s, v = SVD_KERNELS[svd](tensor[:, :, t], tau)
+            x[:, :, t] = (u * (s - tau)) @ v
+            continue
         u, s, v = np.linalg.svd(tensor[:, :, t], full_matrices=False)
         r = len(np.where(s > tau)[0])
         if r >= 1:
@@ -439,6 +542,9 @@ def impute_latc_tubal(  # noqa: C901
     lambda0: float = 2e-7,
     epsilon: float = 1e-7,
     maxiter: int = 300,
+    seed: int | Sequence[int] | None = None,
+    initial: np.ndarray | None = None,
+    svd: SvdKernel = "exact",
 ) -> np.ndarray:
     """Impute tensor values with LATC-Tubal method by Chen, Chen and Sun (2020).
 
@@ -457,11 +563,18 @@ def impute_latc_tubal(  # noqa: C901
         lambda0:
         epsilon: Convergence criterion. A smaller number will result in more iterations.
         maxiter: Maximum number of iterations.
+        seed: Random number generator seed to ensure deterministic results.
+        initial: Tensor of the same shape as `tensor` with initial guesses for the
+            missing values (e.g. the result of a previous imputation), which can
+            reduce the number of iterations needed to converge. Null values are
+            ignored.
+        svd: Singular value decomposition to use in each iteration. Either ``exact``
+            for a full SVD, or one of the low-rank :data:`SVD_KERNELS`.
 
     Returns:
         Tensor with missing values in `tensor` replaced by imputed values.
     """
-    rng = np.random.default_rng()
+    rng = np.random.default_rng(seed)
     tensor = np.where(np.isnan(tensor), 0, tensor)
     dim = np.array(tensor.shape)
     dim_time = int(np.prod(dim) / dim[0])
@@ -471,7 +584,7 @@ def impute_latc_tubal(  # noqa: C901
     pos_missing = np.where(mat == 0)
     t = np.zeros(dim)
     z = mat.copy()
-    z[pos_missing] = np.mean(mat[mat != 0])
+    z[pos_missing] = _initial_missing_values(mat, pos_missing, initial)
     a = 0.001 * rng.random(dim[0] * d).reshape([dim[0], d])
     it = 0
     ind = np.zeros((d, dim_time - max_lag), dtype=np.int_)
@@ -489,7 +602,7 @@ def impute_latc_tubal(  # noqa: C901
         sample_rate = 0.1
     while True:
         rho = min(rho * 1.05, 1e5)
-        x = _tsvt(_mat2ten(z, dim, 0) - t / rho, phi, 1 / rho)
+        x = _tsvt(_mat2ten(z, dim, 0) - t / rho, phi, 1 / rho, svd=svd)
         mat_hat = _ten2mat(x, 0)
         mat0 = np.zeros((dim[0], dim_time - max_lag))
         temp2 = _ten2mat(rho * x + t, 0)
@@ -522,16 +635,154 @@ def impute_latc_tubal(  # noqa: C901
             temp1 = _ten2mat(_mat2ten(z, dim, 0) - t / rho, 2)
             _, phi = np.linalg.eig(temp1 @ temp1.T)
             del temp1
-        print(f"Iteration: {it}", end="\r")
+        logger.debug(f"LATC-Tubal iteration {it}: relative change {tol:.3e}")
         if tol < epsilon or it >= maxiter:
             break
-    print(f"Iteration: {it}")
+    logger.info(f"LATC-Tubal stopped after {it} iterations (relative change {tol:.3e})")
     return x
 
 
 # ---- Anomaly detection ---- #
 
 
+@njit(cache=True)
+def _insert_sorted(window: np.ndarray, count: int, value: float) -> int:
+    """Insert a value into the sorted head of a window buffer, returning the count."""
+    i = count
+    while i > 0 and window[i - 1] > value:
+        window[i] = window[i - 1]
+        i -= 1
+    window[i] = value
+    return count + 1
+
+
+@njit(cache=True)
+def _remove_sorted(window: np.ndarray, count: int, value: float) -> int:
+    """Remove a value from the sorted head of a window buffer, returning the count."""
+    i = np.searchsorted(window[:count], value)
+    for j in range(i, count - 1):
+        window[j] = window[j + 1]
+    return count - 1
+
+
+@njit(cache=True)
+def _replace_sorted(window: np.ndarray, count: int, old: float, new: float) -> None:
+    """Replace a value in the sorted head of a window buffer with another value."""
+    i = np.searchsorted(window[:count], old)
+    if new > old:
+        while i + 1 < count and window[i + 1] < new:
+            window[i] = window[i + 1]
+            i += 1
+    else:
+        while i > 0 and window[i - 1] > new:
+            window[i] = window[i - 1]
+            i -= 1
+    window[i] = new
+
+
+@njit(cache=True)
+def _sorted_quantile(window: np.ndarray, count: int, quantile: float) -> float:
+    """Quantile of the sorted head of a window buffer.
+
+    Matches the linear interpolation of :meth:`pandas.core.window.Rolling.quantile`,
+    except that `quantile=0.5` is the mean of the two middle values, as in
+    :meth:`pandas.core.window.Rolling.median` and :func:`numpy.nanmedian`.
+    """
+    if count == 0:
+        return np.nan
+    if quantile == 0.5:
+        mid = count // 2
+        if count % 2:
+            return window[mid]
+        return (window[mid] + window[mid - 1]) / 2
+    position = quantile * (count - 1)
+    i = int(position)
+    if position == i:
+        return window[i]
+    low = window[i]
+    return low + (window[i + 1] - low) * (position - i)
+
+
+@njit(cache=True)
+def _rolling_quantiles(x: np.ndarray, window: int, quantiles: np.ndarray) -> np.ndarray:
+    """Centered rolling quantiles of the columns of a matrix, ignoring nulls.
+
+    Equivalent to `df.rolling(window, min_periods=1, center=True).quantile(q)` for
+    each quantile `q`, but computes all quantiles from a single sorted window that
+    is updated incrementally as it slides down each column.
+
+    Args:
+        x: Matrix with shape (m observations, n variables).
+        window: Number of values in the moving window.
+        quantiles: Quantiles to compute (see :func:`_sorted_quantile`).
+
+    Returns:
+        Array with shape (len(`quantiles`), m, n).
+    """
+    nrows, ncols = x.shape
+    result = np.empty((len(quantiles), nrows, ncols))
+    # Window of row i spans [i + offset + 1 - window, i + offset + 1), as in pandas
+    offset = (window - 1) // 2
+    buffer = np.empty(window + 1)
+    for col in range(ncols):
+        values = np.ascontiguousarray(x[:, col])
+        count = 0
+        start, end = 0, 0
+        for row in range(nrows):
+            new_end = min(row + offset + 1, nrows)
+            new_start = max(row + offset + 1 - window, 0)
+            # Slide a full window by replacing the value leaving with the value entering
+            while (
+                end < new_end
+                and start < new_start
+                and not np.isnan(values[end])
+                and not np.isnan(values[start])
+            ):
+                _replace_sorted(buffer, count, values[start], values[end])
+                start += 1
+                end += 1
+            while end < new_end:
+                if not np.isnan(values[end]):
+                    count = _insert_sorted(buffer, count, values[end])
+                end += 1
+            while start < new_start:
+                if not np.isnan(values[start]):
+                    count = _remove_sorted(buffer, count, values[start])
+                start += 1
+            for k in range(len(quantiles)):
+                result[k, row, col] = _sorted_quantile(buffer, count, quantiles[k])
+    return result
+
+
+@njit(cache=True)
+def _median_of_shifts(x: np.ndarray, shifts: np.ndarray) -> np.ndarray:
+    """Median of the columns of a matrix shifted by different numbers of rows.
+
+    Equivalent to taking :func:`numpy.nanmedian` over a stack of copies of `x`
+    shifted (as in :meth:`pandas.DataFrame.shift`) by each of `shifts`,
+    without materializing the stack.
+
+    Args:
+        x: Matrix with shape (m observations, n variables).
+        shifts: Number of rows to shift `x` by.
+
+    Returns:
+        Array with shape (m, n). Positions with no non-null shifted values are null.
+    """
+    nrows, ncols = x.shape
+    result = np.empty((nrows, ncols))
+    buffer = np.empty(len(shifts))
+    for row in range(nrows):
+        for col in range(ncols):
+            count = 0
+            for shift in shifts:
+                source = row - shift
+                if 0 <= source < nrows and not np.isnan(x[source, col]):
+                    count = _insert_sorted(buffer, count, x[source, col])
+            result[row, col] = _sorted_quantile(buffer, count, 0.5)
+    return result
+
+
 class Timeseries:
     """Multivariate timeseries for anomaly detection and imputation."""
 
@@ -680,8 +931,7 @@ class Timeseries:
             window: Number of values in the moving window.
         """
         # RUGGLES: rollingDem, rollingDemLong (window=480)
-        df = pd.DataFrame(self.x, copy=False)
-        return df.rolling(window, min_periods=1, center=True).median().to_numpy()
+        return _rolling_quantiles(self.x, window, np.array([0.5]))[0]
 
     def rolling_median_offset(self, window: int = 48) -> np.ndarray:
         """Values minus the rolling median.
@@ -709,23 +959,7 @@ class Timeseries:
         """
         # RUGGLES: vals_dem_minus_rolling
         offset = self.rolling_median_offset(window=window)
-        # Fast numpy implementation of pd.DataFrame.shift
-        shifted = np.empty([len(shifts), *offset.shape], dtype=float)
-        for i, shift in enumerate(shifts):
-            if shift > 0:
-                shifted[i, :shift] = np.nan
-                shifted[i, shift:] = offset[:-shift]
-            elif shift < 0:
-                shifted[i, shift:] = np.nan
-                shifted[i, :shift] = offset[-shift:]
-            else:
-                shifted[i, :] = offset
-        # Ignore warning for rows with all null values
-        with warnings.catch_warnings():
-            warnings.filterwarnings(
-                "ignore", category=RuntimeWarning, message="All-NaN slice encountered"
-            )
-            return np.nanmedian(shifted, axis=0)
+        return _median_of_shifts(offset, np.asarray(shifts, dtype=np.int64))
 
     def rolling_iqr_of_rolling_median_offset(
         self, window: int = 48, iqr_window: int = 240
@@ -740,9 +974,8 @@ class Timeseries:
         """
         # RUGGLES: dem_minus_rolling_IQR
         offset = self.rolling_median_offset(window=window)
-        df = pd.DataFrame(offset, copy=False)
-        rolling = df.rolling(iqr_window, min_periods=1, center=True)
-        return (rolling.quantile(0.75) - rolling.quantile(0.25)).to_numpy()
+        q3, q1 = _rolling_quantiles(offset, iqr_window, np.array([0.75, 0.25]))
+        return q3 - q1
 
     def median_prediction(
         self,
@@ -826,9 +1059,8 @@ class Timeseries:
         """
         # RUGGLES: delta_rolling_iqr
         diff = self.diff(shift=shift)
-        df = pd.DataFrame(diff, copy=False)
-        rolling = df.rolling(window, min_periods=1, center=True)
-        return (rolling.quantile(0.75) - rolling.quantile(0.25)).to_numpy()
+        q3, q1 = _rolling_quantiles(diff, window, np.array([0.75, 0.25]))
+        return q3 - q1
 
     def flag_double_delta(self, iqr_window: int = 240, multiplier: float = 2) -> None:
         """Flag values very different from neighbors on either side (DOUBLE_DELTA).
@@ -1225,6 +1457,7 @@ class Timeseries:
         periods: int = 24,
         blocks: int = 1,
         method: str = "tubal",
+        initial: np.ndarray | None = None,
         **kwargs: Any,
     ) -> np.ndarray:
         """Impute null values.
@@ -1242,6 +1475,8 @@ class Timeseries:
                 This has been found to reduce processing time for `method='tnn'`.
             method: Imputation method to use
                 ('tubal': :func:`impute_latc_tubal`, 'tnn': :func:`impute_latc_tnn`).
+            initial: Array of same shape as :attr:`x` with initial guesses for the
+                values to impute, used to warm start `method`.
             kwargs: Optional arguments to `method`.
 
         Returns:
@@ -1256,12 +1491,16 @@ class Timeseries:
         if (x == 0).any():
             raise ValueError("Zero values present. Replace with very small value.")
         tensor = self.fold_tensor(x, periods=periods)
+        if initial is not None:
+            initial = self.fold_tensor(initial, periods=periods)
         n = tensor.shape[1]
         ends = [*range(0, n, int(np.ceil(n / blocks))), n]
         for i in range(blocks):
             if blocks > 1:
-                print(f"Block: {i}")
+                logger.info(f"Imputing block {i}")
             idx = slice(None), slice(ends[i], ends[i + 1]), slice(None)
+            if initial is not None:
+                kwargs["initial"] = initial[idx]
             tensor[idx] = imputer(tensor[idx], **kwargs)
         return self.unfold_tensor(tensor)
 
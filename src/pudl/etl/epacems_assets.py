@@ -10,16 +10,21 @@ see: https://docs.dagster.io/concepts/ops-jobs-graphs/dynamic-graphs and https:/
 """
 
 from collections import namedtuple
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import dask.dataframe as dd
+import numpy as np
 import pandas as pd
 import pyarrow as pa
+import pyarrow.compute as pc
 import pyarrow.parquet as pq
 from dagster import (
     AssetIn,
     DynamicOut,
     DynamicOutput,
+    Field,
     asset,
     graph_asset,
     op,
@@ -65,6 +70,24 @@ def get_years_from_settings(context):
 
 @op(
     required_resource_keys={"datastore", "dataset_settings"},
+    config_schema={
+        "chunksize": Field(
+            int,
+            default_value=100_000,
+            description=(
+                "Number of CSV rows to extract, transform and write at a time. Peak "
+                "memory use is bounded by this rather than by the size of a quarter."
+            ),
+        ),
+        "arrow_native": Field(
+            bool,
+            default_value=False,
+            description=(
+                "If True, parse the CSVs straight into Arrow and transform them with "
+                "Arrow compute kernels, without ever converting the data to pandas."
+            ),
+        ),
+    },
     tags={"memory-use": "high"},
 )
 def process_single_year(
@@ -75,6 +98,13 @@ def process_single_year(
 ) -> YearPartitions:
     """Process a single year of EPA CEMS data.
 
+    Each quarter is streamed through extraction, transformation and the partitioned
+    parquet writer one chunk at a time, so memory use scales with the configured
+    ``chunksize`` rather than the size of the quarter. With ``arrow_native`` set, the
+    pandas extract and transform steps are replaced by their Arrow-native equivalents
+    :func:`pudl.extract.epacems.extract_arrow` and
+    :func:`pudl.transform.epacems.transform_arrow`.
+
     Args:
         context: dagster keyword that provides access to resources and config.
         year: Year of data to process.
@@ -96,29 +126,170 @@ def process_single_year(
 
     for year_quarter in year_quarters_in_year:
         logger.info(f"Processing EPA CEMS hourly data for {year_quarter}")
-        df = pudl.extract.epacems.extract(year_quarter=year_quarter, ds=ds)
-        if not df.empty:  # If state-year combination has data
-            df = pudl.transform.epacems.transform(
-                df, core_epa__assn_eia_epacamd, core_eia__entity_plants
+        if context.op_config["arrow_native"]:
+            tables = pudl.transform.epacems.transform_arrow(
+                pudl.extract.epacems.extract_arrow(year_quarter=year_quarter, ds=ds),
+                core_epa__assn_eia_epacamd,
+                core_eia__entity_plants,
+            )
+        else:
+            tables = (
+                pa.Table.from_pandas(df, schema=schema, preserve_index=False)
+                for df in pudl.transform.epacems.transform_chunks(
+                    pudl.extract.epacems.extract_chunks(
+                        year_quarter=year_quarter,
+                        ds=ds,
+                        chunksize=context.op_config["chunksize"],
+                    ),
+                    core_epa__assn_eia_epacamd,
+                    core_eia__entity_plants,
+                )
             )
-        table = pa.Table.from_pandas(df, schema=schema, preserve_index=False)
 
-        # Write to a directory of partitioned parquet files
+        # Write to a directory of partitioned parquet files, one row group per chunk
         with pq.ParquetWriter(
             where=partitioned_path / f"epacems-{year_quarter}.parquet",
             schema=schema,
             compression="snappy",
             version="2.6",
         ) as partitioned_writer:
-            partitioned_writer.write_table(table)
+            for table in tables:
+                partitioned_writer.write_table(table)
 
     return YearPartitions(year_quarters_in_year)
 
 
-@op
+def _state_codes(state: pa.ChunkedArray, states: list[str]) -> np.ndarray:
+    """Map each row's state to its position in ``states``, or -1 if it isn't there.
+
+    The state column is dictionary encoded, so the lookup is done once against each
+    chunk's small dictionary and then broadcast to the rows via the dictionary indices.
+    """
+    value_set = pa.array(states)
+    codes = []
+    for chunk in state.chunks:
+        if pa.types.is_dictionary(chunk.type):
+            chunk_codes = pc.take(
+                pc.index_in(chunk.dictionary, value_set=value_set), chunk.indices
+            )
+        else:
+            chunk_codes = pc.index_in(chunk, value_set=value_set)
+        codes.append(
+            chunk_codes.fill_null(-1).to_numpy(zero_copy_only=False).astype(np.int16)
+        )
+    if not codes:
+        return np.empty(0, dtype=np.int16)
+    return np.concatenate(codes)
+
+
+def _bucket_by_state(table: pa.Table, states: list[str]) -> list[pa.Table]:
+    """Split a table up into one table per state.
+
+    The rows are bucketed with a single stable sort on small integer state codes (a
+    linear time radix sort in numpy), so within each state they keep their original
+    order. Each state's rows are copied into their own table, rather than sliced out
+    of a sorted copy of the whole table, so that holding on to one state's table
+    doesn't keep all of the other states' rows in memory too. Rows with states that
+    are not in ``states`` are dropped.
+    """
+    codes = _state_codes(table["state"], states)
+    order = np.argsort(codes, kind="stable")
+    # Shift codes by one so that unknown states (-1) land in bucket zero.
+    offsets = np.concatenate(
+        [[0], np.cumsum(np.bincount(codes + 1, minlength=len(states) + 1))]
+    )
+    return [
+        table.take(order[offsets[i + 1] : offsets[i + 2]]) for i in range(len(states))
+    ]
+
+
+def _read_year_by_state(
+    partitioned_path: Path,
+    year_partition: YearPartitions,
+    schema: pa.Schema,
+    states: list[str],
+) -> list[pa.Table]:
+    """Read every quarter of a year once and split the rows up by state.
+
+    Each quarterly partition is read exactly once and bucketed by state on its own, so
+    apart from the year's bucketed quarters only one unsorted quarter is ever in
+    memory. Each state's table is made up of its rows from every quarter, without
+    copying them again, so within each state the rows keep their original quarter and
+    row order.
+
+    Returns:
+        One table per state, in the same order as ``states``. Rows with states that
+        are not in ``states`` are dropped.
+    """
+    quarters = [
+        _bucket_by_state(
+            pq.read_table(
+                source=partitioned_path / f"epacems-{year_quarter}.parquet",
+                schema=schema,
+            ),
+            states,
+        )
+        for year_quarter in sorted(year_partition.year_quarters)
+    ]
+    return [
+        pa.concat_tables(state_slices) for state_slices in zip(*quarters, strict=True)
+    ]
+
+
+def _iter_year_state_tables(
+    partitioned_path: Path,
+    partitions: list[YearPartitions],
+    schema: pa.Schema,
+    states: list[str],
+    prefetch: bool = False,
+) -> Iterator[pa.Table]:
+    """Yield year-state tables, one year of partitions at a time.
+
+    Roughly one year of data plus the quarter being read is held in memory at once.
+    With ``prefetch``, the next year's partitions are read and bucketed by state in a
+    background thread while the caller writes out the current year, so reading and
+    writing overlap, but up to about two years of data are held in memory.
+    """
+    if not prefetch:
+        for year_partition in partitions:
+            yield from _read_year_by_state(
+                partitioned_path, year_partition, schema, states
+            )
+        return
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        pending = None
+        for year_partition in partitions:
+            upcoming = executor.submit(
+                _read_year_by_state, partitioned_path, year_partition, schema, states
+            )
+            if pending is not None:
+                yield from pending.result()
+            pending = upcoming
+        if pending is not None:
+            yield from pending.result()
+
+
+@op(
+    config_schema={
+        "prefetch_next_year": Field(
+            bool,
+            default_value=False,
+            description=(
+                "If True, read the next year of partitions while the current one is "
+                "written. This overlaps reading and writing, but roughly doubles peak "
+                "memory use."
+            ),
+        ),
+    },
+    tags={"memory-use": "high"},
+)
 def consolidate_partitions(context, partitions: list[YearPartitions]) -> None:
     """Read partitions into memory and write to a single monolithic output.
 
+    Each quarterly partition is read only once, and its rows are bucketed by state so
+    that the monolithic output is made up of year-state row groups.
+
     Args:
         context: dagster keyword that provides access to resources and config.
         partitions: Year and state combinations in the output database.
@@ -132,23 +303,14 @@ def consolidate_partitions(context, partitions: list[YearPartitions]) -> None:
     with pq.ParquetWriter(
         where=monolithic_path, schema=schema, compression="snappy", version="2.6"
     ) as monolithic_writer:
-        for year_partition in partitions:
-            for state in EPACEMS_STATES:
-                monolithic_writer.write_table(
-                    # Concat a slice of each state's data from all quarters in a year
-                    # and write to parquet to create year-state row groups
-                    pa.concat_tables(
-                        [
-                            pq.read_table(
-                                source=partitioned_path
-                                / f"epacems-{year_quarter}.parquet",
-                                filters=[[("state", "=", state.upper())]],
-                                schema=schema,
-                            )
-                            for year_quarter in year_partition.year_quarters
-                        ]
-                    )
-                )
+        for year_state_table in _iter_year_state_tables(
+            partitioned_path,
+            partitions,
+            schema=schema,
+            states=sorted(state.upper() for state in EPACEMS_STATES),
+            prefetch=context.op_config["prefetch_next_year"],
+        ):
+            monolithic_writer.write_table(year_state_table)
 
 
 @graph_asset
@@ -20,10 +20,14 @@ Hence, we've called it `plant_id_epa` until it gets transformed into `plant_id_e
 during the transform process with help from the crosswalk.
 """
 
+import itertools
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Annotated
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
 from pydantic import BaseModel, StringConstraints
 
 import pudl.logging_helpers
@@ -136,6 +140,19 @@ API_DTYPE_DICT = {
     "Program Code": pd.CategoricalDtype(),
 }
 
+API_ARROW_TYPE_DICT = {
+    col: (
+        pa.dictionary(pa.int32(), pa.string())
+        if isinstance(dtype, pd.CategoricalDtype)
+        else pa.string()
+        if isinstance(dtype, pd.StringDtype)
+        else pa.from_numpy_dtype(dtype.numpy_dtype)
+    )
+    for col, dtype in API_DTYPE_DICT.items()
+} | {"Date": pa.date32()}
+"""Dict: The PyArrow equivalents of :data:`API_DTYPE_DICT`, used by the Arrow-native
+CSV reader. Categorical columns are dictionary encoded as they are read."""
+
 
 class EpaCemsPartition(BaseModel):
     """Represents EpaCems partition identifying unique resource file."""
@@ -188,6 +205,97 @@ class EpaCemsDatastore:
             )
         return df
 
+    def get_data_frame_chunks(
+        self, partition: EpaCemsPartition, chunksize: int = 100_000
+    ) -> Iterator[pd.DataFrame]:
+        """Yield dataframes of at most ``chunksize`` rows for a given partition.
+
+        Unlike :meth:`get_data_frame`, the whole quarter is never held in memory at
+        once, so peak memory use is bounded by the chunk size rather than the size of
+        the quarterly CSV.
+        """
+        with (
+            self.datastore.get_zipfile_resource(
+                "epacems", **partition.get_filters()
+            ) as zf,
+            zf.open(str(partition.get_quarterly_file()), "r") as csv_file,
+        ):
+            yield from self._csv_to_dataframe_chunks(
+                csv_file,
+                ignore_cols=API_IGNORE_COLS,
+                rename_dict=API_RENAME_DICT,
+                dtype_dict=API_DTYPE_DICT,
+                chunksize=chunksize,
+            )
+
+    def get_arrow_batches(
+        self, partition: EpaCemsPartition, block_size: int = 64 * 2**20
+    ) -> Iterator[pa.Table]:
+        """Yield Arrow tables parsed straight from the CSV for a given partition.
+
+        The CSV is parsed by PyArrow's streaming CSV reader directly into the column
+        types in :data:`API_ARROW_TYPE_DICT`, and columns are renamed using
+        :data:`API_RENAME_DICT`. No intermediate :class:`pandas.DataFrame` is created.
+
+        Args:
+            partition: The year_quarter partition to read.
+            block_size: Approximate number of bytes of CSV to parse into each table.
+        """
+        with (
+            self.datastore.get_zipfile_resource(
+                "epacems", **partition.get_filters()
+            ) as zf,
+            zf.open(str(partition.get_quarterly_file()), "r") as csv_file,
+        ):
+            yield from self._csv_to_arrow_batches(csv_file, block_size=block_size)
+
+    def _csv_to_arrow_batches(
+        self, csv_path: Path, block_size: int = 64 * 2**20
+    ) -> Iterator[pa.Table]:
+        """Parse a CEMS csv file into an iterator of renamed Arrow tables.
+
+        Args:
+            csv_path: Path to CSV file containing data to read.
+            block_size: Approximate number of bytes of CSV to parse into each table.
+
+        Yields:
+            Arrow tables containing the filtered and typed contents of the CSV file.
+        """
+        include_columns = [col for col in API_RENAME_DICT if col not in API_IGNORE_COLS]
+        reader = pacsv.open_csv(
+            csv_path,
+            read_options=pacsv.ReadOptions(block_size=block_size),
+            convert_options=pacsv.ConvertOptions(
+                column_types={col: API_ARROW_TYPE_DICT[col] for col in include_columns},
+                include_columns=include_columns,
+                include_missing_columns=True,
+                # Match pandas, which reads empty strings as nulls
+                strings_can_be_null=True,
+            ),
+        )
+        for batch in reader:
+            yield pa.Table.from_batches([batch]).rename_columns(
+                [API_RENAME_DICT[col] for col in batch.schema.names]
+            )
+
+    def _read_csv_chunks(
+        self,
+        csv_path: Path,
+        ignore_cols: dict[str, str],
+        dtype_dict: dict[str, type],
+        chunksize: int,
+    ) -> Iterator[pd.DataFrame]:
+        """Read a CEMS csv file as an iterator of raw, un-renamed chunks."""
+        return pd.read_csv(
+            csv_path,
+            index_col=False,
+            usecols=lambda col: col not in ignore_cols,
+            dtype=dtype_dict,
+            chunksize=chunksize,
+            low_memory=True,
+            parse_dates=["Date"],
+        )
+
     def _csv_to_dataframe(
         self,
         csv_path: Path,
@@ -204,19 +312,43 @@ class EpaCemsDatastore:
         Returns:
             A DataFrame containing the filtered and dtyped contents of the CSV file.
         """
-        chunk_iter = pd.read_csv(
-            csv_path,
-            index_col=False,
-            usecols=lambda col: col not in ignore_cols,
-            dtype=dtype_dict,
-            chunksize=chunksize,
-            low_memory=True,
-            parse_dates=["Date"],
+        df = pd.concat(
+            self._read_csv_chunks(
+                csv_path,
+                ignore_cols=ignore_cols,
+                dtype_dict=dtype_dict,
+                chunksize=chunksize,
+            )
         )
-        df = pd.concat(chunk_iter)
         dtypes = {k: v for k, v in dtype_dict.items() if k in df.columns}
         return df.astype(dtypes).rename(columns=rename_dict)
 
+    def _csv_to_dataframe_chunks(
+        self,
+        csv_path: Path,
+        ignore_cols: dict[str, str],
+        rename_dict: dict[str, str],
+        dtype_dict: dict[str, type],
+        chunksize: int = 100_000,
+    ) -> Iterator[pd.DataFrame]:
+        """Convert a CEMS csv file into an iterator of :class:`pandas.DataFrame` chunks.
+
+        Args:
+            csv_path: Path to CSV file containing data to read.
+            chunksize: Maximum number of rows in each yielded dataframe.
+
+        Yields:
+            DataFrames containing the filtered and dtyped contents of the CSV file.
+        """
+        for chunk in self._read_csv_chunks(
+            csv_path,
+            ignore_cols=ignore_cols,
+            dtype_dict=dtype_dict,
+            chunksize=chunksize,
+        ):
+            dtypes = {k: v for k, v in dtype_dict.items() if k in chunk.columns}
+            yield chunk.astype(dtypes).rename(columns=rename_dict)
+
 
 def extract(year_quarter: str, ds: Datastore) -> pd.DataFrame:
     """Coordinate the extraction of EPA CEMS hourly DataFrames.
@@ -240,3 +372,71 @@ def extract(year_quarter: str, ds: Datastore) -> pd.DataFrame:
         res = Resource.from_id("core_epacems__hourly_emissions")
         df = res.format_df(pd.DataFrame())
     return df
+
+
+def extract_chunks(
+    year_quarter: str, ds: Datastore, chunksize: int = 100_000
+) -> Iterator[pd.DataFrame]:
+    """Extract a quarter of EPA CEMS hourly data one chunk at a time.
+
+    This is the streaming counterpart of :func:`extract`. Only one chunk of the
+    quarterly CSV is held in memory at a time.
+
+    Args:
+        year_quarter: report year and quarter of the data to extract
+        ds: Initialized datastore
+        chunksize: Maximum number of rows in each yielded dataframe.
+
+    Yields:
+        Consecutive chunks of a single quarter of EPA CEMS hourly emissions data.
+    """
+    ds = EpaCemsDatastore(ds)
+    partition = EpaCemsPartition(year_quarter=year_quarter)
+    year = partition.year
+    logger.info(f"Extracting data frame chunks for {year_quarter}")
+    chunks = ds.get_data_frame_chunks(partition, chunksize=chunksize)
+    try:
+        # Opening the archive and CSV happens lazily on the first chunk, which is
+        # where a missing partition will show up.
+        first_chunk = next(chunks)
+    # If the requested quarter is not found, yield an empty df with expected columns:
+    except (KeyError, StopIteration):
+        logger.warning(f"No data found for {year_quarter}. Returning empty dataframe.")
+        res = Resource.from_id("core_epacems__hourly_emissions")
+        yield res.format_df(pd.DataFrame())
+        return
+    yield first_chunk.assign(year=year)
+    for chunk in chunks:
+        yield chunk.assign(year=year)
+
+
+def extract_arrow(
+    year_quarter: str, ds: Datastore, block_size: int = 64 * 2**20
+) -> Iterator[pa.Table]:
+    """Extract a quarter of EPA CEMS hourly data as a stream of Arrow tables.
+
+    This is the Arrow-native counterpart of :func:`extract_chunks`. If the requested
+    quarter isn't available, nothing is yielded.
+
+    Args:
+        year_quarter: report year and quarter of the data to extract
+        ds: Initialized datastore
+        block_size: Approximate number of bytes of CSV to parse into each table.
+
+    Yields:
+        Consecutive Arrow tables of a single quarter of EPA CEMS hourly emissions data.
+    """
+    ds = EpaCemsDatastore(ds)
+    partition = EpaCemsPartition(year_quarter=year_quarter)
+    year = partition.year
+    logger.info(f"Extracting Arrow tables for {year_quarter}")
+    batches = ds.get_arrow_batches(partition, block_size=block_size)
+    try:
+        first_batch = next(batches)
+    except (KeyError, StopIteration):
+        logger.warning(f"No data found for {year_quarter}. Returning no tables.")
+        return
+    for batch in itertools.chain([first_batch], batches):
+        yield batch.append_column(
+            "year", pa.repeat(pa.scalar(year, type=pa.int32()), batch.num_rows)
+        )
@@ -1,6 +1,7 @@
 """Dagster IO Managers."""
 
 import re
+from collections.abc import Iterator
 from pathlib import Path
 from sqlite3 import sqlite_version
 from typing import Any
@@ -33,6 +34,13 @@ logger = pudl.logging_helpers.get_logger(__name__)
 
 MINIMUM_SQLITE_VERSION = "3.32.0"
 
+BULK_LOAD_PRAGMAS: dict[str, str | int] = {
+    "journal_mode": "MEMORY",
+    "synchronous": "OFF",
+    "cache_size": -262_144,
+}
+"""SQLite PRAGMAs applied while bulk loading a table (cache_size is in KiB)."""
+
 
 def get_table_name_from_context(context: OutputContext) -> str:
     """Retrieves the table name from the context object."""
@@ -66,7 +74,13 @@ class PudlMixedFormatIOManager(IOManager):
     read_from_parquet: bool
     """If true, data will be read from parquet files instead of sqlite."""
 
-    def __init__(self, write_to_parquet: bool = False, read_from_parquet: bool = False):
+    def __init__(
+        self,
+        write_to_parquet: bool = False,
+        read_from_parquet: bool = False,
+        bulk_load_sqlite: bool = False,
+        trusted_parquet_read: bool = False,
+    ):
         """Creates new instance of mixed format pudl IO manager.
 
         By default, data is written and read from sqlite, but experimental
@@ -81,6 +95,11 @@ class PudlMixedFormatIOManager(IOManager):
                 read from the sqlite database. Reading from parquet provides
                 performance increases as well as better datatype handling, so
                 this option is encouraged.
+            bulk_load_sqlite: if True, tables are written to sqlite using the
+                fast bulk loading path of :class:`PudlSQLiteIOManager`.
+            trusted_parquet_read: if True, the schema checks which already passed
+                when writing the parquet files are not repeated when reading them.
+                See :class:`PudlParquetIOManager`.
         """
         if read_from_parquet and not write_to_parquet:
             raise RuntimeError(
@@ -91,8 +110,11 @@ class PudlMixedFormatIOManager(IOManager):
         self._sqlite_io_manager = PudlSQLiteIOManager(
             base_dir=PudlPaths().output_dir,
             db_name="pudl",
+            bulk_load=bulk_load_sqlite,
+        )
+        self._parquet_io_manager = PudlParquetIOManager(
+            trusted_read=trusted_parquet_read
         )
-        self._parquet_io_manager = PudlParquetIOManager()
         if self.write_to_parquet or self.read_from_parquet:
             logger.warning(
                 f"pudl_io_manager: experimental support for parquet enabled. "
@@ -319,8 +341,41 @@ class SQLiteIOManager(IOManager):
             return df
 
 
+def _parquet_types_mapper(
+    arrow_type: pa.DataType,
+) -> pd.api.extensions.ExtensionDtype | None:
+    """Map Arrow types directly to the nullable pandas types PUDL uses."""
+    if pa.types.is_integer(arrow_type):
+        return pd.Int64Dtype()
+    if pa.types.is_boolean(arrow_type):
+        return pd.BooleanDtype()
+    if pa.types.is_string(arrow_type):
+        return pd.StringDtype()
+    return None
+
+
 class PudlParquetIOManager(IOManager):
-    """IOManager that writes pudl tables to pyarrow parquet files."""
+    """IOManager that writes pudl tables to pyarrow parquet files.
+
+    Downstream assets can limit what gets read from the parquet files by adding
+    ``columns`` and/or ``filters`` to the metadata of their inputs, e.g.
+    ``AssetIn(metadata={"columns": [...], "filters": [("state", "in", ["CO"])]})``.
+    Both are passed straight to :func:`pyarrow.parquet.read_table`, so filters are
+    expressed in disjunctive normal form and must use values of the same type as the
+    column, e.g. :class:`datetime.date` for ``report_date``. Only the selected row
+    groups, pages and columns are then read from disk.
+    """
+
+    def __init__(self, trusted_read: bool = False):
+        """Creates a new parquet IO manager.
+
+        Args:
+            trusted_read: if True, tables are assumed to have been written by this IO
+                manager, so the schema checks (primary key uniqueness etc.) which
+                already passed on write are skipped on read, and only the pandas
+                dtypes are applied.
+        """
+        self.trusted_read = trusted_read
 
     def handle_output(self, context: OutputContext, df: Any) -> None:
         """Writes pudl dataframe to parquet file."""
@@ -343,12 +398,69 @@ class PudlParquetIOManager(IOManager):
             )
 
     def load_input(self, context: InputContext) -> pd.DataFrame:
-        """Loads pudl table from parquet file."""
+        """Loads pudl table from parquet file.
+
+        If only some of the columns were requested the table level checks in
+        :meth:`pudl.metadata.classes.Resource.enforce_schema` can't be applied, so as
+        in the trusted read mode only the column dtypes are enforced.
+        """
         table_name = get_table_name_from_context(context)
         parquet_path = PudlPaths().parquet_path(table_name)
         res = Resource.from_id(table_name)
-        df = pq.read_table(source=parquet_path, schema=res.to_pyarrow()).to_pandas()
-        return res.enforce_schema(df)
+        metadata = context.definition_metadata or {}
+        columns = metadata.get("columns")
+        table = pq.read_table(
+            source=parquet_path,
+            schema=res.to_pyarrow(),
+            columns=columns,
+            filters=metadata.get("filters"),
+        )
+        if columns is None and not self.trusted_read:
+            return res.enforce_schema(table.to_pandas())
+        df = table.to_pandas(date_as_object=False, types_mapper=_parquet_types_mapper)
+        dtypes = res.to_pandas_dtypes()
+        return df.astype(
+            {col: dtypes[col] for col in df.columns if df[col].dtype != dtypes[col]}
+        )
+
+
+def _sqlite_row_chunks(
+    df: pd.DataFrame,
+    sa_table: sa.Table,
+    dialect: sa.Dialect,
+    chunksize: int = 100_000,
+) -> Iterator[list[tuple]]:
+    """Convert a dataframe into chunks of rows ready to be inserted into SQLite.
+
+    Each column is converted as a whole into a list of Python objects, with missing
+    values replaced by ``None``, and then passed through the SQLAlchemy type's bind
+    processor. This mirrors what :meth:`pandas.DataFrame.to_sql` does, so the stored
+    values are the same, without binding every value separately through SQLAlchemy.
+
+    Args:
+        df: dataframe containing (at least) all of the columns in ``sa_table``.
+        sa_table: the table which the rows will be inserted into.
+        dialect: the SQLAlchemy dialect used to look up the bind processors.
+        chunksize: maximum number of rows in each chunk.
+
+    Yields:
+        Lists of row tuples with values in the order of the ``sa_table`` columns.
+    """
+    for start in range(0, len(df), chunksize):
+        chunk = df.iloc[start : start + chunksize]
+        columns = []
+        for column in sa_table.columns:
+            col = chunk[column.name]
+            if pd.api.types.is_datetime64_any_dtype(col):
+                values = col.array.to_pydatetime()
+            else:
+                values = col.to_numpy(dtype=object)
+            values[col.isna().to_numpy()] = None
+            processor = column.type.dialect_impl(dialect).bind_processor(dialect)
+            if processor is not None:
+                values = [processor(value) for value in values]
+            columns.append(values)
+        yield list(zip(*columns, strict=True))
 
 
 class PudlSQLiteIOManager(SQLiteIOManager):
@@ -364,6 +476,7 @@ class PudlSQLiteIOManager(SQLiteIOManager):
         db_name: str,
         package: Package | None = None,
         timeout: float = 1_000.0,
+        bulk_load: bool = False,
     ):
         """Initialize PudlSQLiteIOManager.
 
@@ -390,7 +503,10 @@ class PudlSQLiteIOManager(SQLiteIOManager):
                 exception, if the database is locked by another connection.  If another
                 connection opens a transaction to modify the database, it will be locked
                 until that transaction is committed.
+            bulk_load: if True, write tables with :meth:`_bulk_load_dataframe` rather
+                than :meth:`pandas.DataFrame.to_sql`.
         """
+        self.bulk_load = bulk_load
         if package is None:
             package = PUDL_PACKAGE
         self.package = package
@@ -452,6 +568,9 @@ class PudlSQLiteIOManager(SQLiteIOManager):
         res = self.package.get_resource(table_name)
 
         df = res.enforce_schema(df)
+        if self.bulk_load:
+            self._bulk_load_dataframe(sa_table, df)
+            return
         with self.engine.begin() as con:
             # Remove old table records before loading to db
             con.execute(sa_table.delete())
@@ -465,6 +584,49 @@ class PudlSQLiteIOManager(SQLiteIOManager):
                 dtype={c.name: c.type for c in sa_table.columns},
             )
 
+    def _bulk_load_dataframe(self, sa_table: sa.Table, df: pd.DataFrame) -> None:
+        """Replace the contents of a table using the raw sqlite3 ``executemany``.
+
+        The table must already exist, so the schema is left untouched. The old
+        records are deleted and the new ones inserted in a single transaction, just
+        like the ``to_sql`` path, but with the values converted a column at a time
+        (see :func:`_sqlite_row_chunks`) and the :data:`BULK_LOAD_PRAGMAS` applied to
+        the connection. The previous PRAGMA values are restored afterwards, since
+        the connection is returned to the engine's pool.
+
+        Args:
+            sa_table: the table to load the data into.
+            df: dataframe which conforms to the table's schema.
+        """
+        dialect = self.engine.dialect
+        delete = str(sa_table.delete().compile(dialect=dialect))
+        # With the qmark paramstyle the values are bound in the order of the columns.
+        insert = str(sa_table.insert().compile(dialect=dialect))
+
+        raw_con = self.engine.raw_connection()
+        try:
+            con = raw_con.driver_connection
+            old_pragmas = {
+                pragma: con.execute(f"PRAGMA {pragma}").fetchone()[0]
+                for pragma in BULK_LOAD_PRAGMAS
+            }
+            for pragma, value in BULK_LOAD_PRAGMAS.items():
+                con.execute(f"PRAGMA {pragma} = {value}")
+            try:
+                con.execute("BEGIN")
+                con.execute(delete)
+                for rows in _sqlite_row_chunks(df, sa_table, dialect):
+                    con.executemany(insert, rows)
+                con.commit()
+            except BaseException:
+                con.rollback()
+                raise
+            finally:
+                for pragma, value in old_pragmas.items():
+                    con.execute(f"PRAGMA {pragma} = {value}")
+        finally:
+            raw_con.close()
+
     def load_input(self, context: InputContext) -> pd.DataFrame:
         """Load a dataframe from a sqlite database.
 
@@ -525,6 +687,19 @@ class PudlSQLiteIOManager(SQLiteIOManager):
                 SQLite database.""",
             default_value=True,
         ),
+        "bulk_load_sqlite": Field(
+            bool,
+            description="""If True, tables will be written to the SQLite database
+                using the raw sqlite3 executemany with tuned PRAGMAs, which is much
+                faster than going through SQLAlchemy.""",
+            default_value=False,
+        ),
+        "trusted_parquet_read": Field(
+            bool,
+            description="""If True, the schema checks which already passed when the
+                parquet files were written are skipped when reading them.""",
+            default_value=False,
+        ),
     }
 )
 def pudl_mixed_format_io_manager(init_context: InitResourceContext) -> IOManager:
@@ -532,13 +707,26 @@ def pudl_mixed_format_io_manager(init_context: InitResourceContext) -> IOManager
     return PudlMixedFormatIOManager(
         write_to_parquet=init_context.resource_config["write_to_parquet"],
         read_from_parquet=init_context.resource_config["read_from_parquet"],
+        bulk_load_sqlite=init_context.resource_config["bulk_load_sqlite"],
+        trusted_parquet_read=init_context.resource_config["trusted_parquet_read"],
     )
 
 
-@io_manager
+@io_manager(
+    config_schema={
+        "trusted_read": Field(
+            bool,
+            description="""If True, the schema checks which already passed when the
+                parquet files were written are skipped when reading them.""",
+            default_value=False,
+        ),
+    }
+)
 def parquet_io_manager(init_context: InitResourceContext) -> IOManager:
     """Create a Parquet only IO manager."""
-    return PudlParquetIOManager()
+    return PudlParquetIOManager(
+        trusted_read=init_context.resource_config["trusted_read"]
+    )
 
 
 class FercSQLiteIOManager(SQLiteIOManager):
@@ -7,7 +7,7 @@ import re
 import sys
 import warnings
 from collections.abc import Callable, Iterable
-from functools import cached_property, lru_cache
+from functools import cache, cached_property, lru_cache
 from pathlib import Path
 from typing import Annotated, Any, Literal, Self, TypeVar
 
@@ -1444,8 +1444,15 @@ class Resource(PudlMeta):
         return obj
 
     @classmethod
+    @cache
     def from_id(cls, x: str) -> "Resource":
-        """Construct from PUDL identifier (`resource.name`)."""
+        """Construct from PUDL identifier (`resource.name`).
+
+        The result is cached, since the same resources are looked up over and over
+        again while processing and loading each table. Every caller gets the same
+        instance, along with its cached PyArrow schema, pandas data types and
+        SQLAlchemy table, so it must be treated as immutable.
+        """
         return cls(**cls.dict_from_id(x))
 
     def get_field(self, name: str) -> Field:
@@ -1465,9 +1472,18 @@ class Resource(PudlMeta):
         check_types: bool = True,
         check_values: bool = True,
     ) -> sa.Table:
-        """Return equivalent SQL Table."""
+        """Return equivalent SQL Table.
+
+        If no `metadata` is given, the table is attached to its own
+        :class:`sqlalchemy.MetaData` and cached, so it must not be modified.
+        """
         if metadata is None:
-            metadata = sa.MetaData()
+            key = (check_types, check_values)
+            if key not in self._sql_tables:
+                self._sql_tables[key] = self.to_sql(
+                    sa.MetaData(), check_types=check_types, check_values=check_values
+                )
+            return self._sql_tables[key]
         columns = [
             f.to_sql(
                 check_types=check_types,
@@ -1482,21 +1498,46 @@ class Resource(PudlMeta):
             constraints.append(key.to_sql())
         return sa.Table(self.name, metadata, *columns, *constraints)
 
-    def to_pyarrow(self) -> pa.Schema:
-        """Construct a PyArrow schema for the resource."""
+    @cached_property
+    def _sql_tables(self) -> dict[tuple[bool, bool], sa.Table]:
+        """Standalone SQL tables, by whether they check types and values."""
+        return {}
+
+    @cached_property
+    def _pyarrow_schema(self) -> pa.Schema:
+        """PyArrow schema of the resource, constructed on first use."""
         fields = [field.to_pyarrow() for field in self.schema.fields]
         metadata = {"description": self.description}
         if self.schema.primary_key is not None:
             metadata |= {"primary_key": ",".join(self.schema.primary_key)}
         return pa.schema(fields=fields, metadata=metadata)
 
+    def to_pyarrow(self) -> pa.Schema:
+        """Construct a PyArrow schema for the resource.
+
+        The schema is only constructed once per resource.
+        """
+        return self._pyarrow_schema
+
+    @cached_property
+    def _pandas_dtypes(self) -> dict[tuple, dict[str, str | pd.CategoricalDtype]]:
+        """Pandas data types of each field, by arguments to :meth:`to_pandas_dtypes`."""
+        return {}
+
     def to_pandas_dtypes(self, **kwargs: Any) -> dict[str, str | pd.CategoricalDtype]:
         """Return Pandas data type of each field by field name.
 
+        The data types are only looked up once per resource and set of arguments.
+
         Args:
             kwargs: Arguments to :meth:`Field.to_pandas_dtype`.
         """
-        return {f.name: f.to_pandas_dtype(**kwargs) for f in self.schema.fields}
+        key = tuple(sorted(kwargs.items()))
+        if key not in self._pandas_dtypes:
+            self._pandas_dtypes[key] = {
+                f.name: f.to_pandas_dtype(**kwargs) for f in self.schema.fields
+            }
+        return dict(self._pandas_dtypes[key])
 
     def match_primary_key(self, names: Iterable[str]) -> dict[str, str] | None:
         """Match primary key fields to input field names.
@@ -2024,7 +2065,14 @@ class Package(PudlMeta):
         check_types: bool = True,
         check_values: bool = True,
     ) -> sa.MetaData:
-        """Return equivalent SQL MetaData."""
+        """Return equivalent SQL MetaData.
+
+        The metadata is cached, since it is needed by every PUDL SQLite IO manager,
+        so it must not be modified.
+        """
+        key = (check_types, check_values)
+        if key in self._sql_metadata:
+            return self._sql_metadata[key]
         metadata = sa.MetaData(
             naming_convention={
                 "ix": "ix_%(column_0_label)s",
@@ -2041,8 +2089,14 @@ class Package(PudlMeta):
                     check_types=check_types,
                     check_values=check_values,
                 )
+        self._sql_metadata[key] = metadata
         return metadata
 
+    @cached_property
+    def _sql_metadata(self) -> dict[tuple[bool, bool], sa.MetaData]:
+        """SQL MetaData, by whether it checks types and values."""
+        return {}
+
     def get_sorted_resources(self) -> StrictList[Resource]:
         """Get a list of sorted Resources.
 
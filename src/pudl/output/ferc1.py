@@ -1,9 +1,10 @@
 """A collection of denormalized FERC assets and helper functions."""
 
+import hashlib
 import importlib
 import re
 from copy import deepcopy
-from functools import cached_property
+from functools import cached_property, lru_cache
 from typing import Any, Literal, NamedTuple, Self
 
 import networkx as nx
@@ -1674,6 +1675,45 @@ class Exploder:
 ################################################################################
 # XBRL Calculation Forests
 ################################################################################
+def _forest_fingerprint(forest: nx.DiGraph) -> str:
+    """Hash the structure, edge weights and node tags of an annotated forest."""
+    edges = sorted(
+        repr((parent, child, data.get("weight")))
+        for parent, child, data in forest.edges(data=True)
+    )
+    nodes = sorted(
+        repr((node, sorted(data.get("tags", {}).items())))
+        for node, data in forest.nodes(data=True)
+    )
+    return hashlib.sha256("\n".join(edges + nodes).encode()).hexdigest()
+
+
+class _LeafyMetaKey:
+    """Hashable key of the leafy metadata of an annotated forest.
+
+    Keys are equal if their forests have the same :func:`_forest_fingerprint` and
+    their ``calc_cols`` are the same. The forest itself is only kept to compile the
+    metadata the first time it is needed.
+    """
+
+    def __init__(self: Self, forest: nx.DiGraph, calc_cols: list[str]):
+        self.forest = forest
+        self.calc_cols = list(calc_cols)
+        self._key = (_forest_fingerprint(forest), tuple(calc_cols))
+
+    def __hash__(self: Self) -> int:
+        return hash(self._key)
+
+    def __eq__(self: Self, other: object) -> bool:
+        return isinstance(other, _LeafyMetaKey) and self._key == other._key
+
+
+@lru_cache(maxsize=8)
+def _leafy_meta(key: _LeafyMetaKey) -> pd.DataFrame:
+    """Leafy metadata of recently seen forests, so tables sharing one compute it once."""
+    return XbrlCalculationForestFerc1._compile_leafy_meta(key.forest, key.calc_cols)
+
+
 class XbrlCalculationForestFerc1(BaseModel):
     """A class for manipulating groups of hierarchically nested XBRL calculations.
 
@@ -2210,13 +2250,6 @@ class XbrlCalculationForestFerc1(BaseModel):
             stepparents = stepparents.union(graph.predecessors(stepchild))
         return list(stepparents)
 
-    def _get_path_weight(self, path: list[NodeId], graph: nx.DiGraph) -> float:
-        """Multiply all weights along a path together."""
-        leaf_weight = 1.0
-        for parent, child in zip(path, path[1:], strict=False):
-            leaf_weight *= graph.get_edge_data(parent, child)["weight"]
-        return leaf_weight
-
     @cached_property
     def leafy_meta(self: Self) -> pd.DataFrame:
         """Identify leaf facts and compile their metadata.
@@ -2227,6 +2260,11 @@ class XbrlCalculationForestFerc1(BaseModel):
         - Set leaf node tags to be the union of all the tags associated
           with all of their ancestors.
 
+        Roots, weights and tags are propagated from the roots to the leaves in a single
+        topological traversal of the annotated forest. The results for the most
+        recently used forests are cached, so that other exploded tables built on the
+        same forest can reuse them.
+
         Leafy metadata in the output dataframe includes:
 
         - The ID of the leaf node itself (this is the index).
@@ -2235,60 +2273,65 @@ class XbrlCalculationForestFerc1(BaseModel):
         - The leaf node's xbrl_factoid_original
         - The weight associated with the leaf, in relation to its root.
         """
-        # Construct a dataframe that links the leaf node IDs to their root nodes:
-        leaves = self.forest_leaves
-        roots = self.forest_roots
-        leaf_to_root_map = {
-            leaf: root
-            for leaf in leaves
-            for root in roots
-            if leaf in nx.descendants(self.annotated_forest, root)
+        return _leafy_meta(_LeafyMetaKey(self.annotated_forest, self.calc_cols)).copy()
+
+    @staticmethod
+    def _compile_leafy_meta(forest: nx.DiGraph, calc_cols: list[str]) -> pd.DataFrame:
+        """Propagate root IDs, path weights and tags to the leaves of a forest.
+
+        For every node we track the set of distinct path weights from each root that
+        it descends from, and the union of the tags of all its ancestors, with the tags
+        of nearer ancestors taking precedence. Each leaf is assigned to the last of the
+        roots it descends from.
+
+        Raises:
+            ValueError: if paths from a leaf's root to the leaf have different weights.
+        """
+        root_order = {
+            root: i for i, root in enumerate(XbrlCalculationForestFerc1.roots(forest))
         }
-        leaves_df = pd.DataFrame(list(leaf_to_root_map.keys()))
-        roots_df = pd.DataFrame(list(leaf_to_root_map.values())).rename(
-            columns={col: col + "_root" for col in self.calc_cols}
-        )
-        leafy_meta = pd.concat([roots_df, leaves_df], axis="columns")
-
-        # Propagate tags and weights to leaf nodes
-        leaf_rows = []
-        for leaf in leaves:
-            leaf_tags = {}
-            ancestors = list(nx.ancestors(self.annotated_forest, leaf)) + [leaf]
-            for node in ancestors:
-                leaf_tags |= self.annotated_forest.nodes[node].get("tags", {})
-            all_leaf_weights = {
-                self._get_path_weight(path, self.annotated_forest)
-                for path in nx.all_simple_paths(
-                    self.annotated_forest, leaf_to_root_map[leaf], leaf
-                )
-            }
+        path_weights: dict[NodeId, dict[NodeId, set[float]]] = {}
+        inherited_tags: dict[NodeId, dict[str, str]] = {}
+        for node in nx.topological_sort(forest):
+            parents = list(forest.predecessors(node))
+            weights = {node: {1.0}} if node in root_order else {}
+            tags = {}
+            for parent in parents:
+                edge_weight = forest.edges[parent, node]["weight"]
+                for root, parent_weights in path_weights[parent].items():
+                    weights.setdefault(root, set()).update(
+                        weight * edge_weight for weight in parent_weights
+                    )
+                tags |= inherited_tags[parent]
+            path_weights[node] = weights
+            inherited_tags[node] = tags | forest.nodes[node].get("tags", {})
+
+        roots, leaf_rows = [], []
+        for leaf in XbrlCalculationForestFerc1.leaves(forest):
+            leaf_roots = [root for root in path_weights[leaf] if root != leaf]
+            if not leaf_roots:
+                continue
+            root = max(leaf_roots, key=root_order.get)
+            all_leaf_weights = path_weights[leaf][root]
             if len(all_leaf_weights) != 1:
                 raise ValueError(
-                    f"Paths from {leaf_to_root_map[leaf]} to {leaf} have "
-                    f"different weights: {all_leaf_weights}"
+                    f"Paths from {root} to {leaf} have different weights: "
+                    f"{all_leaf_weights}"
                 )
-            leaf_weight = all_leaf_weights.pop()
-
-            # Construct a dictionary describing the leaf node and convert it into a
-            # single row DataFrame. This makes adding arbitrary tags easy.
-            leaf_attrs = {
-                "table_name": leaf.table_name,
-                "xbrl_factoid": leaf.xbrl_factoid,
-                "utility_type": leaf.utility_type,
-                "plant_status": leaf.plant_status,
-                "plant_function": leaf.plant_function,
-                "weight": leaf_weight,
-                "tags": leaf_tags,
-            }
-            leaf_rows.append(pd.json_normalize(leaf_attrs, sep="_"))
+            roots.append(root)
+            # Describe each leaf with a dictionary, which makes adding arbitrary tags
+            # easy when it is normalized into a dataframe.
+            leaf_rows.append(
+                leaf._asdict()
+                | {"weight": next(iter(all_leaf_weights)), "tags": inherited_tags[leaf]}
+            )
 
-        # Combine the two dataframes we've constructed above:
-        return (
-            pd.merge(leafy_meta, pd.concat(leaf_rows), validate="one_to_one")
-            .reset_index(drop=True)
-            .convert_dtypes()
+        roots_df = pd.DataFrame(roots, columns=calc_cols).rename(
+            columns={col: col + "_root" for col in calc_cols}
         )
+        return pd.concat(
+            [roots_df, pd.json_normalize(leaf_rows, sep="_")], axis="columns"
+        ).convert_dtypes()
 
     @cached_property
     def root_calculations(self: Self) -> pd.DataFrame:
@@ -22,10 +22,13 @@ data products that we might want to be able to provide to users a la carte.
 from collections import defaultdict
 from datetime import date, datetime
 from functools import partial
+from pathlib import Path
 from typing import Literal, Self
 
 # Useful high-level external modules.
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 import sqlalchemy as sa
 
 import pudl
@@ -54,6 +57,7 @@ class PudlTabl:
         fill_net_gen: bool = False,
         fill_tech_desc: bool = True,
         unit_ids: bool = False,
+        parquet_dir: str | Path | None = None,
     ) -> Self:
         """Initialize the PUDL output object.
 
@@ -88,6 +92,10 @@ class PudlTabl:
                 code.
             unit_ids: If True, use several heuristics to assign
                 individual generators to functional units. EXPERIMENTAL.
+            parquet_dir: Directory of PUDL parquet outputs, e.g.
+                ``PudlPaths().parquet_path()``. If given, tables with a parquet file
+                in this directory are read from it instead of the PUDL DB, with the
+                date filter applied to the parquet row groups as they are read.
         """
         logger.warning(
             "PudlTabl is deprecated and will be removed from the pudl package "
@@ -126,9 +134,17 @@ class PudlTabl:
         self.fill_net_gen: bool = fill_net_gen
         self.fill_tech_desc = fill_tech_desc  # only for eia860 table.
         self.unit_ids = unit_ids
+        self.parquet_dir: Path | None = (
+            None if parquet_dir is None else Path(parquet_dir)
+        )
 
         # Used to persist the output tables. Returns None if they don't exist.
         self._dfs = defaultdict(lambda: None)
+        # Tables reflected from the PUDL DB, accumulated as they are first requested.
+        self._metadata = sa.MetaData()
+        # Table metadata and date-filtered selects, built once per table.
+        self._resources: dict[str, Resource] = {}
+        self._selects: dict[tuple, sa.sql.expression.Select] = {}
 
         self._register_output_methods()
 
@@ -305,18 +321,30 @@ class PudlTabl:
             "pudl.sqlite. To access the data returned by this method, "
             f"use the {table_name} table in the pudl.sqlite database."
         )
-        resource = Resource.from_id(table_name)
-        return pd.concat(
-            [
-                resource.enforce_schema(df)
-                for df in pd.read_sql(
+        resource = self._get_resource(table_name)
+        if (
+            self.parquet_dir is not None
+            and (parquet_path := self.parquet_dir / f"{table_name}.parquet").exists()
+        ):
+            return resource.enforce_schema(
+                self._read_parquet_between_dates(parquet_path, resource)
+            )
+        return resource.enforce_schema(
+            pd.concat(
+                pd.read_sql(
                     self._select_between_dates(table_name),
                     self.pudl_engine,
                     chunksize=100_000,
                 )
-            ]
+            )
         )
 
+    def _get_resource(self: Self, table_name: str) -> Resource:
+        """Look up the metadata of a table, building it only on first use."""
+        if table_name not in self._resources:
+            self._resources[table_name] = Resource.from_id(table_name)
+        return self._resources[table_name]
+
     def _agg_table_name(self: Self, table_name: str) -> str:
         """Substitute appropriate frequency in aggregated table names.
 
@@ -349,33 +377,85 @@ class PudlTabl:
             ``report_date`` or ``report_year``) to lie between ``self.start_date`` and
             ``self.end_date`` (inclusive).
         """
-        md = sa.MetaData()
-        md.reflect(self.pudl_engine)
-        try:
-            tbl = md.tables[f"{table}"]
-        except KeyError:
-            print(f"{table} not found in the metadata.")
+        key = (table, self.start_date, self.end_date)
+        if key in self._selects:
+            return self._selects[key]
+        if table not in self._metadata.tables:
+            try:
+                self._metadata.reflect(self.pudl_engine, only=[table])
+            except sa.exc.InvalidRequestError as err:
+                raise ValueError(f"{table} not found in the PUDL DB.") from err
+        tbl = self._metadata.tables[table]
         tbl_select = sa.sql.select(tbl)
 
-        start_date = pd.to_datetime(self.start_date)
-        end_date = pd.to_datetime(self.end_date)
-
-        if "report_date" in tbl.columns:  # Date format
-            date_col = tbl.c.report_date
-        elif "report_year" in tbl.columns:  # Integer format
-            date_col = tbl.c.report_year
-            if self.start_date is not None:
-                start_date = pd.to_datetime(self.start_date).year
-            if self.end_date is not None:
-                end_date = pd.to_datetime(self.end_date).year
-        else:
-            date_col = None
-        if self.start_date and date_col is not None:
-            tbl_select = tbl_select.where(date_col >= start_date)
-        if self.end_date and date_col is not None:
-            tbl_select = tbl_select.where(date_col <= end_date)
+        date_col, start_date, end_date = self._date_bounds(tbl.columns.keys())
+        if start_date is not None:
+            tbl_select = tbl_select.where(tbl.c[date_col] >= start_date)
+        if end_date is not None:
+            tbl_select = tbl_select.where(tbl.c[date_col] <= end_date)
+        self._selects[key] = tbl_select
         return tbl_select
 
+    def _date_bounds(
+        self: Self, columns: list[str]
+    ) -> tuple[str | None, pd.Timestamp | int | None, pd.Timestamp | int | None]:
+        """Choose the date column of a table and the bounds to filter it by.
+
+        ``report_date`` is compared against the ``start_date`` and ``end_date``
+        timestamps, and ``report_year`` against their years. If neither column is
+        present, or a date is not set, the corresponding bound is None.
+
+        Args:
+            columns: names of the columns in the table.
+
+        Returns:
+            The name of the date column and its lower and upper (inclusive) bounds.
+        """
+        start_date = (
+            None if self.start_date is None else pd.to_datetime(self.start_date)
+        )
+        end_date = None if self.end_date is None else pd.to_datetime(self.end_date)
+        if "report_date" in columns:  # Date format
+            return "report_date", start_date, end_date
+        if "report_year" in columns:  # Integer format
+            return (
+                "report_year",
+                None if start_date is None else start_date.year,
+                None if end_date is None else end_date.year,
+            )
+        return None, None, None
+
+    def _read_parquet_between_dates(
+        self: Self, parquet_path: Path, resource: Resource
+    ) -> pd.DataFrame:
+        """Read a table from parquet, only keeping records between the dates.
+
+        The date bounds (see :meth:`_date_bounds`) are passed to
+        :func:`pyarrow.parquet.read_table` as filters, so row groups whose statistics
+        fall entirely outside of them are skipped rather than read and discarded.
+
+        Args:
+            parquet_path: path to the parquet file containing the table.
+            resource: metadata describing the table.
+
+        Returns:
+            The records with a date between ``start_date`` and ``end_date``
+            (inclusive), before the table schema is enforced.
+        """
+        schema = resource.to_pyarrow()
+        date_col, start_date, end_date = self._date_bounds(schema.names)
+        if date_col is not None and pa.types.is_date(schema.field(date_col).type):
+            start_date = None if start_date is None else start_date.date()
+            end_date = None if end_date is None else end_date.date()
+        filters = [
+            (date_col, op, bound)
+            for op, bound in ((">=", start_date), ("<=", end_date))
+            if bound is not None
+        ]
+        return pq.read_table(
+            parquet_path, schema=schema, filters=filters or None
+        ).to_pandas()
+
     ###########################################################################
     # Tables requiring special treatment:
     ###########################################################################
@@ -408,7 +488,7 @@ class PudlTabl:
                 "out_eia923__AGG_generation_fuel_by_generator"
             )
             gen_df = self._get_table_from_db(table_name)
-            resource = Resource.from_id(table_name)
+            resource = self._get_resource(table_name)
             gen_df = gen_df.loc[:, resource.get_field_names()]
         else:
             table_name = self._agg_table_name("out_eia923__AGG_generation")
@@ -46,6 +46,15 @@ def ferc_to_sqlite_settings(init_context) -> FercToSqliteSettings:
             description="If enabled, the local file cache for datastore will be used.",
             default_value=True,
         ),
+        "local_cache_max_size_gb": Field(
+            float,
+            description=(
+                "Maximum size of the local cache in GB. Least recently used resources "
+                "outside of the currently configured archives are evicted to stay "
+                "within it. Zero means unbounded."
+            ),
+            default_value=0.0,
+        ),
     },
 )
 def datastore(init_context) -> Datastore:
@@ -57,4 +66,6 @@ def datastore(init_context) -> Datastore:
         # TODO(rousik): we could also just use PudlPaths().input_dir here, because
         # it should be initialized to the right values.
         ds_kwargs["local_cache_path"] = PudlPaths().input_dir
+        if max_size_gb := init_context.resource_config["local_cache_max_size_gb"]:
+            ds_kwargs["local_cache_max_size"] = int(max_size_gb * 1e9)
     return Datastore(**ds_kwargs)
@@ -16,9 +16,11 @@ provided by the EIA 860, and expands on it using several methods which can be
 found in :func:`pudl.transform.eia._boiler_generator_assn`.
 """
 
+import importlib.metadata
 import importlib.resources
 from collections import namedtuple
 from enum import StrEnum, auto
+from pathlib import Path
 
 import networkx as nx
 import numpy as np
@@ -48,6 +50,9 @@ logger = pudl.logging_helpers.get_logger(__name__)
 TZ_FINDER = timezonefinder.TimezoneFinder()
 """A global TimezoneFinder to cache geographies in memory for faster access."""
 
+TIMEZONE_COORDINATE_DECIMALS = 5
+"""Decimal places (roughly 1 meter) to round coordinates to when looking up timezones."""
+
 
 class EiaEntity(StrEnum):
     """Enum for the different types of EIA entities."""
@@ -179,6 +184,122 @@ def occurrence_consistency(
     return col_df
 
 
+def _harvest_consistent_values(
+    compiled_df: pd.DataFrame,
+    cols_to_consit: list[str],
+    strictness: dict[str, float],
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Find the consistently reported value of many columns in one pass.
+
+    This computes the same thing as calling :func:`occurrence_consistency` for each
+    column and keeping the consistent records, but for all of the columns at once.
+    Each column is encoded as integer codes, the codes of all columns are stacked
+    into one long array, and the occurrences of each entity and of each of its
+    values are counted with a single grouped pass over it.
+
+    A value can only be consistent if it makes up more than half of an entity's
+    records, so this requires all strictness values to be at least 0.5. Otherwise
+    more than one value could be consistent and :func:`occurrence_consistency` is
+    needed to pick between them.
+
+    Args:
+        compiled_df: a dataframe with every instance of the columns we are trying to
+            harvest.
+        cols_to_consit: the columns which identify the entity (or entity-year)
+            whose records should be consistent.
+        strictness: the strictness to use for each of the columns to harvest.
+
+    Returns:
+        A dataframe with one row per distinct ``cols_to_consit`` and one column per
+        harvested column, which is null when there is no consistent value, and a
+        dataframe indexed by column with the number of entities which have any value
+        (``total``) and a consistent value (``consistent``).
+    """
+    if min(strictness.values(), default=0.5) < 0.5:
+        raise ValueError("Single pass harvesting requires a strictness of >= 0.5.")
+    # Like occurrence_consistency, ignore records with no report_date.
+    key_codes = (
+        compiled_df.groupby(cols_to_consit, sort=False, dropna=True)
+        .ngroup()
+        .fillna(-1)
+        .to_numpy(dtype=int)
+    )
+    key_codes[compiled_df["report_date"].isna().to_numpy()] = -1
+    n_keys = key_codes.max(initial=-1) + 1
+    dtypes = get_pudl_dtypes(group="eia")
+
+    cols = list(strictness)
+    empty = np.array([], dtype=int)
+    col_codes, key_parts, value_parts, uniques = [empty], [empty], [empty], []
+    for i, col in enumerate(cols):
+        values = compiled_df[col]
+        if dtypes[col] == "string":
+            values = values.mask((values == "nan").fillna(False))
+        codes, col_uniques = pd.factorize(values)
+        valid = (codes >= 0) & (key_codes >= 0)
+        col_codes.append(np.full(valid.sum(), i))
+        key_parts.append(key_codes[valid])
+        value_parts.append(codes[valid])
+        uniques.append(col_uniques)
+    long_df = pd.DataFrame(
+        {
+            "col": np.concatenate(col_codes),
+            "key": np.concatenate(key_parts),
+            "value": np.concatenate(value_parts),
+        }
+    )
+
+    records = long_df.value_counts(sort=False).rename("record_occurences")
+    records = records.reset_index()
+    entity_occurences = np.bincount(
+        long_df["col"] * n_keys + long_df["key"], minlength=len(cols) * n_keys
+    )
+    records["entity_occurences"] = entity_occurences[
+        records["col"] * n_keys + records["key"]
+    ]
+    col_strictness = np.array([strictness[col] for col in cols])
+    is_consistent = (
+        records["record_occurences"] / records["entity_occurences"]
+        > col_strictness[records["col"]]
+    )
+    consistent = records[is_consistent]
+
+    # One row per entity, in the order of the entity codes.
+    valid_rows = np.flatnonzero(key_codes >= 0)
+    present_keys, first_rows = np.unique(key_codes[valid_rows], return_index=True)
+    harvested = (
+        compiled_df[cols_to_consit].iloc[valid_rows[first_rows]].reset_index(drop=True)
+    )
+    for i, col in enumerate(cols):
+        col_consistent = consistent[consistent["col"] == i]
+        if col_consistent.empty:
+            # Matches merging in an empty frame of consistent records.
+            harvested[col] = pd.Series(np.nan, index=harvested.index, dtype=object)
+            continue
+        value_codes = np.full(n_keys, -1)
+        value_codes[col_consistent["key"]] = col_consistent["value"]
+        # Codes of -1 aren't in the index, so they become nulls (as in a merge).
+        harvested[col] = (
+            pd.Series(uniques[i])
+            .reindex(value_codes[present_keys])
+            .reset_index(drop=True)
+        )
+
+    stats = (
+        pd.DataFrame(
+            {
+                "total": records.groupby("col")["key"].nunique(),
+                "consistent": consistent.groupby("col")["key"].nunique(),
+            }
+        )
+        .reindex(range(len(cols)))
+        .fillna(0)
+        .astype(int)
+        .set_axis(pd.Index(cols, name="column"))
+    )
+    return harvested, stats
+
+
 def _lat_long(
     dirty_df: pd.DataFrame,
     clean_df: pd.DataFrame,
@@ -301,23 +422,86 @@ def _last_operating_date(
     return op_clean_df
 
 
-def _add_timezone(plants_entity: pd.DataFrame) -> pd.DataFrame:
+def _timezone_memo_path() -> Path:
+    """Location of the on-disk memo of timezones found by :func:`_add_timezone`.
+
+    The memo is specific to the installed version of timezonefinder, since the
+    timezone boundaries it uses change between versions.
+    """
+    version = importlib.metadata.version("timezonefinder")
+    return pudl.workspace.memo.memo_path("timezones", f"timezones-tzf{version}.parquet")
+
+
+def _read_timezone_memo(memo_path: Path | None) -> pd.DataFrame:
+    """Read the memo of previously looked up timezones, if there is one."""
+    memo = pd.DataFrame(
+        {
+            "latitude": pd.Series(dtype=float),
+            "longitude": pd.Series(dtype=float),
+            "timezone": pd.Series(dtype=object),
+        }
+    )
+    memo_df = pudl.workspace.memo.read_memo(memo_path)
+    if memo_df is not None and set(memo.columns).issubset(memo_df.columns):
+        memo = memo_df[list(memo.columns)]
+    return memo
+
+
+def _add_timezone(
+    plants_entity: pd.DataFrame, memo_path: Path | None = None
+) -> pd.DataFrame:
     """Add plant IANA timezone based on lat/lon or state if lat/lon is unavailable.
 
+    Coordinates are rounded to :data:`TIMEZONE_COORDINATE_DECIMALS` places and each
+    distinct location is only looked up once. The timezones found are stored in an
+    on-disk memo, so later runs only need to look up the locations of new plants.
+    Plants without valid coordinates get the approximate timezone of their state.
+
     Args:
         plants_entity: Plant entity table, including columns named "latitude",
             "longitude", and optionally "state"
+        memo_path: Parquet file in which timezones are memoized by (latitude,
+            longitude). If None, nothing is memoized between runs.
 
     Returns:
         A DataFrame containing the same table, with a "timezone" column added.
         Timezone may be missing if lat / lon is missing or invalid.
     """
-    plants_entity["timezone"] = plants_entity.apply(
-        lambda row: find_timezone(
-            lng=row["longitude"], lat=row["latitude"], state=row["state"], strict=False
-        ),
-        axis=1,
+    coords = pd.DataFrame(
+        {
+            "latitude": pd.to_numeric(plants_entity["latitude"]).astype(float),
+            "longitude": pd.to_numeric(plants_entity["longitude"]).astype(float),
+        },
+        index=plants_entity.index,
+    ).round(TIMEZONE_COORDINATE_DECIMALS)
+    valid = coords.latitude.between(-90, 90) & coords.longitude.between(-180, 180)
+
+    memo = _read_timezone_memo(memo_path)
+    new_coords = (
+        coords[valid]
+        .drop_duplicates()
+        .merge(memo, on=["latitude", "longitude"], how="left", indicator=True)
+        .query("_merge == 'left_only'")[["latitude", "longitude"]]
     )
+    if not new_coords.empty:
+        logger.info(f"Looking up timezones for {len(new_coords)} new plant locations.")
+        new_coords["timezone"] = [
+            find_timezone(lng=lng, lat=lat)
+            for lat, lng in zip(new_coords.latitude, new_coords.longitude, strict=True)
+        ]
+        memo = pd.concat([memo, new_coords], ignore_index=True)
+        pudl.workspace.memo.write_memo(memo, memo_path)
+
+    by_coords = coords.merge(memo, on=["latitude", "longitude"], how="left")
+    by_state = (
+        plants_entity["state"].map(APPROXIMATE_TIMEZONES)
+        if "state" in plants_entity
+        else pd.Series(None, index=plants_entity.index)
+    )
+    timezone = pd.Series(
+        np.where(valid, by_coords["timezone"], by_state), index=plants_entity.index
+    )
+    plants_entity["timezone"] = timezone.where(timezone.notna(), None)
     return plants_entity
 
 
@@ -452,6 +636,83 @@ def _manage_strictness(col: str, eia860m: bool) -> float:
     return strictness_cols.get(col, strictness_default)
 
 
+def _merge_consistent_records(
+    col_df: pd.DataFrame,
+    col: str,
+    entity_df: pd.DataFrame,
+    annual_df: pd.DataFrame,
+    entity_id_df: pd.DataFrame,
+    annual_id_df: pd.DataFrame,
+    id_cols: list[str],
+    cols_to_consit: list[str],
+    static_cols: list[str],
+    annual_cols: list[str],
+    special_case_cols: dict[str, dict],
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Merge the consistent values of a column into the entity or annual table.
+
+    Args:
+        col_df: the output of :func:`occurrence_consistency` for the column.
+        col: the column being harvested.
+        entity_df: the entity table harvested so far.
+        annual_df: the annual table harvested so far.
+        entity_id_df: a dataframe with a complete set of possible entity ids.
+        annual_id_df: a dataframe with a complete set of entity ids and report dates.
+        id_cols: the id(s) for the entity.
+        cols_to_consit: the columns used to determine consistency.
+        static_cols: the static columns of the entity.
+        annual_cols: the annual columns of the entity.
+        special_case_cols: the special methods to harvest some of the columns.
+
+    Returns:
+        The updated entity and annual tables.
+    """
+    # pull the correct values out of the df and merge w/ the plant ids
+    col_correct_df = col_df[col_df[f"{col}_is_consistent"]].drop_duplicates(
+        subset=(cols_to_consit + [f"{col}_is_consistent"])
+    )
+
+    # we need this to be an empty df w/ columns bc we are going to use it
+    if col_correct_df.empty:
+        col_correct_df = pd.DataFrame(columns=col_df.columns)
+
+    if col in static_cols:
+        clean_df = entity_id_df.merge(col_correct_df, on=id_cols, how="left")
+        clean_df = clean_df[id_cols + [col]]
+        entity_df = entity_df.merge(clean_df, on=id_cols)
+
+    if col in annual_cols:
+        clean_df = annual_id_df.merge(
+            col_correct_df, on=(id_cols + ["report_date"]), how="left"
+        )
+        clean_df = clean_df[id_cols + ["report_date", col]]
+        annual_df = annual_df.merge(clean_df, on=(id_cols + ["report_date"]))
+
+    # get the still dirty records by using the cleaned ids w/null values
+    # we need the plants that have no 'correct' value so
+    # we can't just use the col_df records when the consistency is not True
+    dirty_df = col_df.merge(clean_df[clean_df[col].isnull()][id_cols])
+
+    if col in special_case_cols:
+        clean_df = special_case_cols[col]["method"](
+            dirty_df,
+            clean_df,
+            entity_id_df,
+            id_cols,
+            col,
+            cols_to_consit,
+            **special_case_cols[col],
+        )
+        if col in static_cols:
+            clean_df = clean_df[id_cols + [col]]
+            entity_df = entity_df.drop(columns=[col]).merge(clean_df, on=id_cols)
+        elif col in annual_cols:
+            raise AssertionError(
+                "Method currenty not configured to work with annual values."
+            )
+    return entity_df, annual_df
+
+
 def harvest_entity_tables(  # noqa: C901
     entity: EiaEntity,
     clean_dfs: dict[str, pd.DataFrame],
@@ -553,6 +814,42 @@ def harvest_entity_tables(  # noqa: C901
         columns=["column", "consistent_ratio", "wrongos", "total"]
     )
     col_dfs = {}
+    strictness = {
+        col: _manage_strictness(col, eia_settings.eia860.eia860m)
+        for col in static_cols + annual_cols
+    }
+    # Most columns only need their consistent values, which can be found for all of
+    # them in a single pass. The rest need the record level consistency info, so
+    # they are harvested one by one with occurrence_consistency(): the special case
+    # columns, columns where more than one value can be consistent, and all of the
+    # columns when debugging.
+    single_pass_cols = {}
+    if not debug:
+        single_pass_cols = {
+            col: col_strictness
+            for col, col_strictness in strictness.items()
+            if col_strictness >= 0.5
+            and col not in special_case_cols
+            and not (col in static_cols and col in annual_cols)
+        }
+    single_pass_static = {
+        col: single_pass_cols[col] for col in static_cols if col in single_pass_cols
+    }
+    single_pass_annual = {
+        col: single_pass_cols[col] for col in annual_cols if col in single_pass_cols
+    }
+    harvested_static, static_stats = _harvest_consistent_values(
+        compiled_df, id_cols, single_pass_static
+    )
+    harvested_annual, annual_stats = _harvest_consistent_values(
+        compiled_df, id_cols + ["report_date"], single_pass_annual
+    )
+    single_pass_stats = pd.concat([static_stats, annual_stats])
+    entity_df = entity_df.merge(harvested_static, on=id_cols, how="left")
+    annual_df = annual_df.merge(
+        harvested_annual, on=(id_cols + ["report_date"]), how="left"
+    )
+
     # determine how many times each of the columns occur
     for col in static_cols + annual_cols:
         if col in annual_cols:
@@ -560,74 +857,43 @@ def harvest_entity_tables(  # noqa: C901
         if col in static_cols:
             cols_to_consit = id_cols
 
-        strictness = _manage_strictness(col, eia_settings.eia860.eia860m)
-        col_df = occurrence_consistency(
-            id_cols, compiled_df, col, cols_to_consit, strictness=strictness
-        )
-
-        # pull the correct values out of the df and merge w/ the plant ids
-        col_correct_df = col_df[col_df[f"{col}_is_consistent"]].drop_duplicates(
-            subset=(cols_to_consit + [f"{col}_is_consistent"])
-        )
-
-        # we need this to be an empty df w/ columns bc we are going to use it
-        if col_correct_df.empty:
-            col_correct_df = pd.DataFrame(columns=col_df.columns)
-
-        if col in static_cols:
-            clean_df = entity_id_df.merge(col_correct_df, on=id_cols, how="left")
-            clean_df = clean_df[id_cols + [col]]
-            entity_df = entity_df.merge(clean_df, on=id_cols)
-
-        if col in annual_cols:
-            clean_df = annual_id_df.merge(
-                col_correct_df, on=(id_cols + ["report_date"]), how="left"
+        if col in single_pass_cols:
+            total = single_pass_stats.loc[col, "total"]
+            num_consistent = single_pass_stats.loc[col, "consistent"]
+        else:
+            col_df = occurrence_consistency(
+                id_cols, compiled_df, col, cols_to_consit, strictness=strictness[col]
             )
-            clean_df = clean_df[id_cols + ["report_date", col]]
-            annual_df = annual_df.merge(clean_df, on=(id_cols + ["report_date"]))
-
-        # get the still dirty records by using the cleaned ids w/null values
-        # we need the plants that have no 'correct' value so
-        # we can't just use the col_df records when the consistency is not True
-        dirty_df = col_df.merge(clean_df[clean_df[col].isnull()][id_cols])
-
-        if col in special_case_cols:
-            clean_df = special_case_cols[col]["method"](
-                dirty_df,
-                clean_df,
-                entity_id_df,
-                id_cols,
-                col,
-                cols_to_consit,
-                **special_case_cols[col],
+            entity_df, annual_df = _merge_consistent_records(
+                col_df=col_df,
+                col=col,
+                entity_df=entity_df,
+                annual_df=annual_df,
+                entity_id_df=entity_id_df,
+                annual_id_df=annual_id_df,
+                id_cols=id_cols,
+                cols_to_consit=cols_to_consit,
+                static_cols=static_cols,
+                annual_cols=annual_cols,
+                special_case_cols=special_case_cols,
             )
-            if col in static_cols:
-                clean_df = clean_df[id_cols + [col]]
-                entity_df = entity_df.drop(columns=[col]).merge(clean_df, on=id_cols)
-            elif col in annual_cols:
-                raise AssertionError(
-                    "Method currenty not configured to work with annual values."
+            if debug:
+                col_dfs[col] = col_df
+            total = len(col_df.drop_duplicates(subset=cols_to_consit))
+            num_consistent = len(
+                col_df[(col_df[f"{col}_is_consistent"])].drop_duplicates(
+                    subset=cols_to_consit
                 )
-
-        if debug:
-            col_dfs[col] = col_df
+            )
         # this next section is used to print and test whether the harvested
         # records are consistent enough
-        total = len(col_df.drop_duplicates(subset=cols_to_consit))
         # if the total is 0, the ratio will error, so assign null values.
         if total == 0:
             ratio = np.nan
             wrongos = np.nan
             logger.debug(f"       Zero records found for {col}")
         if total > 0:
-            ratio = (
-                len(
-                    col_df[(col_df[f"{col}_is_consistent"])].drop_duplicates(
-                        subset=cols_to_consit
-                    )
-                )
-                / total
-            )
+            ratio = num_consistent / total
             wrongos = (1 - ratio) * total
             logger.debug(
                 f"       Ratio: {ratio:.3}  "
@@ -657,12 +923,17 @@ def harvest_entity_tables(  # noqa: C901
             ],
             ignore_index=True,
         )
+    # Put the columns in the same order regardless of how they were harvested.
+    entity_df = entity_df[list(entity_id_df.columns) + static_cols]
+    annual_df = annual_df[list(annual_id_df.columns) + annual_cols]
     mcs = consistency["consistent_ratio"].mean()
     logger.info(f"Average consistency of static {entity.value} values is {mcs:.2%}")
 
     if entity == EiaEntity.PLANTS:
         # Post-processing specific to the plants entity tables
-        entity_df = _add_additional_epacems_plants(entity_df).pipe(_add_timezone)
+        entity_df = _add_additional_epacems_plants(entity_df).pipe(
+            _add_timezone, memo_path=_timezone_memo_path()
+        )
         annual_df = fillna_balancing_authority_codes_via_names(annual_df).pipe(
             fix_balancing_authority_codes_with_state, plants_entity=entity_df
         )
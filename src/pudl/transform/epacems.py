@@ -1,12 +1,16 @@
 """Module to perform data cleaning functions on EPA CEMS data tables."""
 
 import datetime
+from collections.abc import Iterable, Iterator
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 import pytz
 
 import pudl.logging_helpers
 from pudl.helpers import remove_leading_zeros_from_numeric_strings
+from pudl.metadata.classes import Resource
 from pudl.metadata.fields import apply_pudl_dtypes
 
 logger = pudl.logging_helpers.get_logger(__name__)
@@ -48,6 +52,18 @@ def harmonize_eia_epa_orispl(
     Returns:
         The same data, with the ORISPL plant codes corrected to match the EIA plant IDs.
     """
+    return _merge_crosswalk(df, _unique_crosswalk(crosswalk_df))
+
+
+def _unique_crosswalk(crosswalk_df: pd.DataFrame) -> pd.DataFrame:
+    """Check and deduplicate the crosswalk used in :func:`harmonize_eia_epa_orispl`.
+
+    Args:
+        crosswalk_df: The core_epa__assn_eia_epacamd dataframe from the database.
+
+    Returns:
+        The unique plant_id_eia, plant_id_epa and emissions_unit_id_epa combinations.
+    """
     # Make sure the crosswalk does not have multiple plant_id_eia values for each
     # plant_id_epa and emissions_unit_id_epa value before reassigning IDs.
     one_to_many = crosswalk_df.groupby(
@@ -60,10 +76,13 @@ def harmonize_eia_epa_orispl(
             "The core_epa__assn_eia_epacamd crosswalk has more than one plant_id_eia value per "
             "plant_id_epa and emissions_unit_id_epa group"
         )
-    crosswalk_df = crosswalk_df[
+    return crosswalk_df[
         ["plant_id_eia", "plant_id_epa", "emissions_unit_id_epa"]
     ].drop_duplicates()
 
+
+def _merge_crosswalk(df: pd.DataFrame, crosswalk_df: pd.DataFrame) -> pd.DataFrame:
+    """Merge CEMS with an already deduplicated crosswalk to get plant_id_eia."""
     # Merge CEMS with Crosswalk to get correct EIA ORISPL code and fill in all unmapped
     # values with old plant_id_epa value.
     df_merged = pd.merge(
@@ -186,16 +205,195 @@ def transform(
     Returns:
         A single year_quarter of EPA CEMS data
     """
-    # Create all the table inputs used for the subtransform functions below
+    return _transform_chunk(
+        raw_df,
+        crosswalk_df=_unique_crosswalk(core_epa__assn_eia_epacamd),
+        plant_utc_offset=_load_plant_utc_offset(core_eia__entity_plants),
+    )
+
+
+def transform_chunks(
+    raw_chunks: Iterable[pd.DataFrame],
+    core_epa__assn_eia_epacamd: pd.DataFrame,
+    core_eia__entity_plants: pd.DataFrame,
+) -> Iterator[pd.DataFrame]:
+    """Transform EPA CEMS hourly data one chunk at a time.
+
+    The crosswalk and plant UTC offsets are prepared once and reused for every chunk,
+    so the cost of streaming a quarter is the same as transforming it in one piece,
+    but only one chunk is ever held in memory. Empty chunks are passed through
+    untouched.
 
+    Args:
+        raw_chunks: Extracted but not yet transformed chunks of EPA CEMS data.
+        core_epa__assn_eia_epacamd: The EPA EIA crosswalk table used for harmonizing
+            the ORISPL code with EIA.
+        core_eia__entity_plants: The EIA Plant entities used for aligning timezones.
+
+    Yields:
+        Transformed chunks of EPA CEMS data.
+    """
+    crosswalk_df = _unique_crosswalk(core_epa__assn_eia_epacamd)
+    plant_utc_offset = _load_plant_utc_offset(core_eia__entity_plants)
+    for raw_df in raw_chunks:
+        if raw_df.empty:
+            yield raw_df
+            continue
+        yield _transform_chunk(
+            raw_df, crosswalk_df=crosswalk_df, plant_utc_offset=plant_utc_offset
+        )
+
+
+def _transform_chunk(
+    raw_df: pd.DataFrame,
+    crosswalk_df: pd.DataFrame,
+    plant_utc_offset: pd.DataFrame,
+) -> pd.DataFrame:
+    """Apply the EPA CEMS transformations using pre-computed lookup tables."""
     return (
         raw_df.pipe(apply_pudl_dtypes, group="epacems")
         .pipe(remove_leading_zeros_from_numeric_strings, "emissions_unit_id_epa")
-        .pipe(harmonize_eia_epa_orispl, core_epa__assn_eia_epacamd)
-        .pipe(
-            convert_to_utc,
-            plant_utc_offset=_load_plant_utc_offset(core_eia__entity_plants),
-        )
+        .pipe(_merge_crosswalk, crosswalk_df)
+        .pipe(convert_to_utc, plant_utc_offset=plant_utc_offset)
         .pipe(correct_gross_load_mw)
         .pipe(apply_pudl_dtypes, group="epacems")
     )
+
+
+###############################################################################
+# ARROW-NATIVE TRANSFORM FUNCTIONS
+###############################################################################
+def transform_arrow(
+    raw_tables: Iterable[pa.Table],
+    core_epa__assn_eia_epacamd: pd.DataFrame,
+    core_eia__entity_plants: pd.DataFrame,
+) -> Iterator[pa.Table]:
+    """Transform EPA CEMS hourly data entirely with Arrow compute kernels.
+
+    This is the Arrow-native counterpart of :func:`transform_chunks`, meant to
+    consume the output of :func:`pudl.extract.epacems.extract_arrow`. The (small)
+    crosswalk and plant timezone tables are turned into Arrow lookup arrays once, and
+    then each table of CEMS data goes through the same steps as :func:`transform`
+    without ever being converted to pandas:
+
+    * numeric ``emissions_unit_id_epa`` values have their leading zeros removed.
+    * ``plant_id_eia`` is looked up from the crosswalk, falling back to
+      ``plant_id_epa``.
+    * ``operating_datetime_utc`` is computed from the local date, hour and the plant's
+      UTC offset.
+    * gross load values that are wrong by orders of magnitude are corrected.
+    * the result is cast to the ``core_epacems__hourly_emissions`` schema.
+
+    Args:
+        raw_tables: Extracted but not yet transformed Arrow tables of EPA CEMS data.
+        core_epa__assn_eia_epacamd: The EPA EIA crosswalk table used for harmonizing
+            the ORISPL code with EIA.
+        core_eia__entity_plants: The EIA Plant entities used for aligning timezones.
+
+    Yields:
+        Transformed Arrow tables conforming to the EPA CEMS PyArrow schema.
+    """
+    schema = Resource.from_id("core_epacems__hourly_emissions").to_pyarrow()
+    crosswalk = _arrow_crosswalk(_unique_crosswalk(core_epa__assn_eia_epacamd))
+    plant_utc_offset = _load_plant_utc_offset(core_eia__entity_plants)
+    offset_plant_ids = pa.array(plant_utc_offset["plant_id_eia"], type=pa.int32())
+    offset_seconds = pa.array(
+        plant_utc_offset["utc_offset"].dt.total_seconds(), type=pa.int64()
+    )
+
+    for table in raw_tables:
+        # Remove leading zeros from purely numeric unit IDs, like
+        # remove_leading_zeros_from_numeric_strings()
+        unit_id = table["emissions_unit_id_epa"]
+        unit_id = pc.if_else(
+            pc.match_substring_regex(unit_id, r"^0+\d+$"),
+            pc.replace_substring_regex(unit_id, r"^0+", ""),
+            unit_id,
+        )
+        plant_id_eia = _arrow_plant_id_eia(table["plant_id_epa"], unit_id, crosswalk)
+        # Shift local standard time to UTC, like convert_to_utc()
+        offset_idx = pc.index_in(plant_id_eia, value_set=offset_plant_ids)
+        utc_offset = pc.take(offset_seconds, offset_idx)
+        if utc_offset.null_count > 0:
+            missing_plants = pc.unique(
+                pc.filter(plant_id_eia, pc.is_null(utc_offset))
+            ).to_pylist()
+            raise ValueError(
+                f"utc_offset should never be missing for CEMS plants, but was "
+                f"missing for these: {missing_plants!s}"
+            )
+        local_seconds = pc.add(
+            pc.multiply(
+                pc.cast(pc.cast(table["op_date"], pa.int32()), pa.int64()), 86400
+            ),
+            pc.multiply(pc.cast(table["op_hour"], pa.int64()), 3600),
+        )
+        operating_datetime_utc = pc.cast(
+            pc.subtract(local_seconds, utc_offset), pa.timestamp("s")
+        )
+        # Fix gross load reported in kW instead of MW, like correct_gross_load_mw()
+        gross_load_mw = table["gross_load_mw"]
+        gross_load_mw = pc.if_else(
+            pc.greater(gross_load_mw, 2000),
+            pc.divide(gross_load_mw, pa.scalar(1000, type=gross_load_mw.type)),
+            gross_load_mw,
+        )
+
+        columns = {
+            name: table[name] for name in schema.names if name in table.column_names
+        } | {
+            "plant_id_eia": plant_id_eia,
+            "emissions_unit_id_epa": unit_id,
+            "operating_datetime_utc": operating_datetime_utc,
+            "gross_load_mw": gross_load_mw,
+        }
+        yield pa.table(
+            [columns[name] for name in schema.names], names=schema.names
+        ).cast(schema)
+
+
+def _arrow_crosswalk_keys(plant_id_epa: pa.Array, unit_id: pa.Array) -> pa.Array:
+    """Combine plant and unit IDs into a single string key for Arrow lookups.
+
+    The key of a null unit ID is just the plant ID, without the separator, so like in
+    the pandas merge it only matches a null unit ID at the same plant.
+    """
+    plant_id = pc.cast(plant_id_epa, pa.string())
+    return pc.if_else(
+        pc.is_null(unit_id),
+        plant_id,
+        pc.binary_join_element_wise(plant_id, unit_id, "|"),
+    )
+
+
+def _arrow_crosswalk(crosswalk_df: pd.DataFrame) -> tuple[pa.Array, pa.Array]:
+    """Keys and plant_id_eia values of the deduplicated crosswalk for Arrow lookups."""
+    keys = _arrow_crosswalk_keys(
+        pa.array(crosswalk_df["plant_id_epa"], type=pa.int32()),
+        pa.array(crosswalk_df["emissions_unit_id_epa"], type=pa.string()),
+    )
+    return keys, pa.array(crosswalk_df["plant_id_eia"], type=pa.int32())
+
+
+def _arrow_plant_id_eia(
+    plant_id_epa: pa.Array, unit_id: pa.Array, crosswalk: tuple[pa.Array, pa.Array]
+) -> pa.Array:
+    """Look up plant_id_eia in the crosswalk, like :func:`harmonize_eia_epa_orispl`.
+
+    Args:
+        plant_id_epa: EPA plant IDs of the CEMS records.
+        unit_id: emissions unit IDs of the CEMS records, with the leading zeros
+            already removed from numeric IDs.
+        crosswalk: keys and plant_id_eia values from :func:`_arrow_crosswalk`.
+
+    Returns:
+        The plant_id_eia of each record, falling back to its plant_id_epa.
+    """
+    crosswalk_keys, crosswalk_plant_ids = crosswalk
+    plant_id_epa = pc.cast(plant_id_epa, pa.int32())
+    crosswalk_idx = pc.index_in(
+        _arrow_crosswalk_keys(plant_id_epa, unit_id),
+        value_set=crosswalk_keys,
+        skip_nulls=True,
+    )
+    return pc.coalesce(pc.take(crosswalk_plant_ids, crosswalk_idx), plant_id_epa)
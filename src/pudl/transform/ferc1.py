@@ -1274,52 +1274,116 @@ def check_calculation_metrics_by_group(
     three for each test: the test mertic that is the same name as the test (ex:
     error_frequency), the tolerance for that group/test and a boolean indicating
     whether or not that metric failed to meet the tolerance.
+
+    The per-record quantities that each metric is built from are computed once, and
+    then all of the metrics for each group are calculated from a single grouped sum.
     """
+    metric_checkers = {
+        group_name: [
+            _error_metric_checker(
+                metric_name=metric_name,
+                group_name=group_name,
+                group_metric_checks=group_metric_checks,
+            )
+            for metric_name in group_metric_checks.group_metric_tolerances.model_dump()[
+                group_name
+            ]
+            if metric_name in group_metric_checks.metrics_to_check
+        ]
+        for group_name in group_metric_checks.groups_to_check
+    }
+    # The metric components don't depend on the grouping, only on the metric itself
+    metric_components = {}
+    for checkers in metric_checkers.values():
+        for checker in checkers:
+            checker.has_required_cols(calculated_df)
+            metric_name = checker._snake_case_metric_name()
+            if metric_name not in metric_components:
+                metric_components[metric_name] = checker.metric_components(
+                    calculated_df
+                ).add_prefix(f"{metric_name}__")
+    components = pd.concat(
+        [calculated_df[ErrorMetric.group_cols()].assign(ungrouped="ungrouped")]
+        + list(metric_components.values()),
+        axis="columns",
+    )
+
     results_dfs = {}
-    # for each groupby grouping: calculate metrics for each test
-    # then check if each test is within acceptable tolerance levels
-    for group_name in group_metric_checks.groups_to_check:
+    for group_name, checkers in metric_checkers.items():
+        if not checkers:
+            continue
+        metric_names = {checker._snake_case_metric_name() for checker in checkers}
+        group_sums = _grouped_sums(
+            components[
+                [col for col in components if col.split("__")[0] in metric_names]
+            ],
+            by=[components[col] for col in checkers[0].groupby_cols()],
+        )
         group_metrics = {}
-        for (
-            metric_name,
-            metric_tolerance,
-        ) in group_metric_checks.group_metric_tolerances.model_dump()[
-            group_name
-        ].items():
-            if metric_name in group_metric_checks.metrics_to_check:
-                # this feels icky. the param name for the metrics are all snake_case while
-                # the metric classes are all TitleCase. So we convert to TitleCase
-                title_case_test = metric_name.title().replace("_", "")
-                group_metric_checker = globals()[title_case_test](
-                    by=group_name,
-                    is_close_tolerance=group_metric_checks.is_close_tolerance.model_dump()[
-                        metric_name
-                    ],
-                    metric_tolerance=metric_tolerance,
-                )
-                group_metric = group_metric_checker.check(
-                    calculated_df=calculated_df
-                ).rename(columns={group_name: "group_value"})
-                # we want to set the index values as the same for all groups, but both the
-                # ungrouped and table_name group require a special exception because we need
-                # to add table_name into the columns
-                if group_name == "ungrouped":
-                    group_metric = group_metric.assign(table_name="ungrouped")
-                if group_name == "table_name":
-                    # we end up having two columns w/ table_name values in order to keep all the
-                    # outputs having the same indexes.
-                    group_metric = group_metric.assign(
-                        table_name=lambda x: x["group_value"]
-                    )
-                # make a uniform multi-index w/ group name and group values
-                group_metrics[metric_name] = group_metric.set_index(
-                    ["group", "table_name", "group_value"]
+        for checker in checkers:
+            metric_name = checker._snake_case_metric_name()
+            metric_sums = group_sums.filter(like=f"{metric_name}__").rename(
+                columns=lambda x, prefix=f"{metric_name}__": x.removeprefix(prefix)
+            )
+            group_metric = checker.format_metric(
+                checker.reduce_metric(metric_sums)
+            ).rename(columns={group_name: "group_value"})
+            # we want to set the index values as the same for all groups, but both the
+            # ungrouped and table_name group require a special exception because we need
+            # to add table_name into the columns
+            if group_name == "ungrouped":
+                group_metric = group_metric.assign(table_name="ungrouped")
+            if group_name == "table_name":
+                # we end up having two columns w/ table_name values in order to keep all the
+                # outputs having the same indexes.
+                group_metric = group_metric.assign(
+                    table_name=lambda x: x["group_value"]
                 )
+            # make a uniform multi-index w/ group name and group values
+            group_metrics[metric_name] = group_metric.set_index(
+                ["group", "table_name", "group_value"]
+            )
         results_dfs[group_name] = pd.concat(group_metrics.values(), axis="columns")
     results = pd.concat(results_dfs.values(), axis="index")
     return results
 
 
+def _grouped_sums(components: pd.DataFrame, by: list[pd.Series]) -> pd.DataFrame:
+    """Sum each column of components within groups, skipping nulls.
+
+    All of the columns are summed in a single vectorized grouped reduction. Groups in
+    which every value of a column is null get a null sum. Records with null group keys
+    and unobserved categories are dropped.
+
+    pandas' grouped sums use compensated summation, so they can differ from applying
+    ``Series.sum()`` to each group in the last few bits. That is far below any of the
+    metric tolerances, and not worth a Python loop over every group.
+    """
+    return (
+        components.astype("float64")
+        .groupby(by, observed=True, dropna=True)
+        .sum(min_count=1)
+    )
+
+
+def _error_metric_checker(
+    metric_name: str, group_name: str, group_metric_checks: GroupMetricChecks
+) -> "ErrorMetric":
+    """Instantiate the :class:`ErrorMetric` for a metric and group from its params."""
+    # this feels icky. the param name for the metrics are all snake_case while
+    # the metric classes are all TitleCase. So we convert to TitleCase
+    title_case_test = metric_name.title().replace("_", "")
+    return globals()[title_case_test](
+        by=group_name,
+        is_close_tolerance=group_metric_checks.is_close_tolerance.model_dump()[
+            metric_name
+        ],
+        metric_tolerance=group_metric_checks.group_metric_tolerances.model_dump()[
+            group_name
+        ][metric_name],
+    )
+
+
 def check_calculation_metrics(
     calculated_df: pd.DataFrame,
     group_metric_checks: GroupMetricChecks,
@@ -1339,8 +1403,9 @@ def check_calculation_metrics(
 
 ########################################################################################
 # Calculation Error Checking Functions
-# - These functions all take a dataframe and return a float.
-# - They are intended to be used in GroupBy.apply() (or on a whole dataframe).
+# - Each metric is split into per-record components and a reduction of the grouped
+#   sums of those components, so that all of the metrics can be calculated with
+#   vectorized grouped reductions rather than GroupBy.apply().
 # - They require a uniform `reported_value` column so that they can all have the same
 #   call signature, which allows us to iterate over all of them in a matrix.
 ########################################################################################
@@ -1393,10 +1458,28 @@ class ErrorMetric(BaseModel):
         return True
 
     @abstractmethod
-    def metric(self: Self, gb: DataFrameGroupBy) -> pd.Series:
-        """Metric function that will be applied to each group of values being checked."""
+    def metric_components(self: Self, df: pd.DataFrame) -> pd.DataFrame:
+        """Per-record values whose grouped sums the metric is calculated from.
+
+        Every metric includes a ``records`` component counting the records that are
+        part of the metric's groups. Groups without any such records are dropped.
+        """
+        ...
+
+    @abstractmethod
+    def metric(self: Self, sums: pd.DataFrame) -> pd.Series:
+        """Calculate the metric for each group from the grouped component sums.
+
+        Sums of float components are null if all of the summed values were null.
+        """
         ...
 
+    def reduce_metric(self: Self, sums: pd.DataFrame) -> pd.Series:
+        """Calculate the metric for all groups that contain records to check."""
+        sums = sums[sums["records"] > 0]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return self.metric(sums).astype("float64")
+
     def is_not_close(self, df: pd.DataFrame) -> pd.Series:
         """Flag records where reported and calculated values differ significantly.
 
@@ -1414,6 +1497,11 @@ class ErrorMetric(BaseModel):
             & df["abs_diff"].notnull()
         )
 
+    @staticmethod
+    def group_cols() -> list[str]:
+        """All of the columns that the metrics may be grouped by."""
+        return ["table_name", "xbrl_factoid", "utility_id_ferc1", "report_year"]
+
     def groupby_cols(self: Self) -> list[str]:
         """The list of columns to group by.
 
@@ -1426,35 +1514,22 @@ class ErrorMetric(BaseModel):
         return gb_by
 
     def apply_metric(self: Self, df: pd.DataFrame) -> pd.Series:
-        """Generate the metric values within each group through an apply method.
-
-        This method adds a column ``is_not_close`` into the df before the groupby
-        because that column is used in many of the :meth:`metric`.
-        """
-        # return a df instead of a series
-        df["is_not_close"] = self.is_not_close(df)
-        return df.groupby(by=self.groupby_cols()).apply(
-            self.metric, include_groups=False
+        """Generate the metric values within each group using grouped sums."""
+        sums = _grouped_sums(
+            self.metric_components(df), by=[df[col] for col in self.groupby_cols()]
         )
+        return self.reduce_metric(sums)
 
     def _snake_case_metric_name(self: Self) -> str:
         """Convert the TitleCase class name to a snake_case string."""
         class_name = self.__class__.__name__
         return re.sub("(?!^)([A-Z]+)", r"_\1", class_name).lower()
 
-    def check(self: Self, calculated_df) -> pd.DataFrame:
+    def format_metric(self: Self, metric_values: pd.Series) -> pd.DataFrame:
         """Make a df w/ the metric, tolerance and is_error columns."""
-        self.has_required_cols(calculated_df)
-        # ungrouped is special because the rest of the stock group names are column
-        # names.
-        if self.by == "ungrouped":
-            calculated_df = calculated_df.assign(
-                ungrouped="ungrouped",
-            )
-
         metric_name = self._snake_case_metric_name()
-        df = (
-            pd.DataFrame(self.apply_metric(calculated_df), columns=[metric_name])
+        return (
+            metric_values.to_frame(name=metric_name)
             .assign(
                 **{  # totolerance_ is just for reporting so you can know of off you are
                     f"tolerance_{metric_name}": self.metric_tolerance,
@@ -1465,36 +1540,55 @@ class ErrorMetric(BaseModel):
             .assign(group=self.by)
             .reset_index()
         )
-        return df
+
+    def check(self: Self, calculated_df) -> pd.DataFrame:
+        """Make a df w/ the metric, tolerance and is_error columns."""
+        self.has_required_cols(calculated_df)
+        # ungrouped is special because the rest of the stock group names are column
+        # names.
+        if self.by == "ungrouped":
+            calculated_df = calculated_df.assign(
+                ungrouped="ungrouped",
+            )
+        return self.format_metric(self.apply_metric(calculated_df))
 
 
 class ErrorFrequency(ErrorMetric):
     """Check error frequency in XBRL calculations."""
 
-    def metric(self: Self, gb: DataFrameGroupBy) -> pd.Series:
+    def metric_components(self: Self, df: pd.DataFrame) -> pd.DataFrame:
+        """Count the records that are tagged as errors."""
+        return pd.DataFrame(
+            {
+                "records": 1.0,
+                "is_not_close": self.is_not_close(df).astype("float64"),
+            },
+            index=df.index,
+        )
+
+    def metric(self: Self, sums: pd.DataFrame) -> pd.Series:
         """Calculate the frequency with which records are tagged as errors."""
-        try:
-            out = gb[gb.is_not_close].shape[0] / gb.shape[0]
-        except ZeroDivisionError:
-            # Will only occur if all reported values are NaN when calculated values
-            # exist, or vice versa.
-            logger.warning(
-                "Calculated values have no corresponding reported values in this table."
-            )
-            out = np.nan
-        return out
+        return sums["is_not_close"] / sums["records"]
 
 
 class RelativeErrorMagnitude(ErrorMetric):
     """Check relative magnitude of errors in XBRL calculations."""
 
-    def metric(self: Self, gb: DataFrameGroupBy) -> pd.Series:
+    def metric_components(self: Self, df: pd.DataFrame) -> pd.DataFrame:
+        """Absolute reported values and errors."""
+        return pd.DataFrame(
+            {
+                "records": 1.0,
+                "abs_reported_value": df["reported_value"].abs(),
+                "abs_diff": df["abs_diff"].abs(),
+            },
+            index=df.index,
+        )
+
+    def metric(self: Self, sums: pd.DataFrame) -> pd.Series:
         """Calculate the mangnitude of the errors relative to total reported value."""
-        gb_value = np.nan
-        denom = gb["reported_value"].abs().sum(min_count=1)
-        if np.isclose(denom, 0) | np.isnan(denom):
-            gb_value = gb.abs_diff.abs().sum(min_count=1) / denom
-        return gb_value
+        denom = sums["abs_reported_value"]
+        return (sums["abs_diff"] / denom).where(np.isclose(denom, 0) | np.isnan(denom))
 
 
 class AbsoluteErrorMagnitude(ErrorMetric):
@@ -1504,38 +1598,56 @@ class AbsoluteErrorMagnitude(ErrorMetric):
     expected errors are provided here...
     """
 
-    def metric(self: Self, gb: DataFrameGroupBy) -> pd.Series:
+    def metric_components(self: Self, df: pd.DataFrame) -> pd.DataFrame:
+        """Absolute errors."""
+        return pd.DataFrame(
+            {"records": 1.0, "abs_diff": df["abs_diff"].abs()}, index=df.index
+        )
+
+    def metric(self: Self, sums: pd.DataFrame) -> pd.Series:
         """Calculate the absolute mangnitude of XBRL calculation errors."""
-        return gb.abs_diff.abs().sum()
+        return sums["abs_diff"].fillna(0.0)
 
 
 class NullCalculatedValueFrequency(ErrorMetric):
     """Check the frequency of null calculated values."""
 
-    def apply_metric(self: Self, df: pd.DataFrame) -> pd.Series:
-        """Only apply metric to rows that contain calculated values."""
-        return (
-            df[df.row_type_xbrl == "calculated_value"]
-            .groupby(self.groupby_cols())
-            .apply(self.metric, include_groups=False)
+    def metric_components(self: Self, df: pd.DataFrame) -> pd.DataFrame:
+        """Only count rows that contain calculated values."""
+        is_calculated = df["row_type_xbrl"] == "calculated_value"
+        non_null_reported = is_calculated & df["reported_value"].notnull()
+        return pd.DataFrame(
+            {
+                "records": is_calculated.astype("float64"),
+                "non_null_reported": non_null_reported.astype("float64"),
+                "null_calculated": (
+                    non_null_reported & df["calculated_value"].isnull()
+                ).astype("float64"),
+            },
+            index=df.index,
         )
 
-    def metric(self: Self, gb: DataFrameGroupBy) -> pd.Series:
+    def metric(self: Self, sums: pd.DataFrame) -> pd.Series:
         """Fraction of non-null reported values that have null corresponding calculated values."""
-        non_null_reported = gb["reported_value"].notnull()
-        null_calculated = gb["calculated_value"].isnull()
-        try:
-            return (non_null_reported & null_calculated).sum() / non_null_reported.sum()
-        except ZeroDivisionError:
-            return np.nan
+        return sums["null_calculated"] / sums["non_null_reported"]
 
 
 class NullReportedValueFrequency(ErrorMetric):
     """Check the frequency of null reported values."""
 
-    def metric(self: Self, gb: DataFrameGroupBy) -> pd.Series:
+    def metric_components(self: Self, df: pd.DataFrame) -> pd.DataFrame:
+        """Count the records with null reported values."""
+        return pd.DataFrame(
+            {
+                "records": 1.0,
+                "null_reported": df["reported_value"].isnull().astype("float64"),
+            },
+            index=df.index,
+        )
+
+    def metric(self: Self, sums: pd.DataFrame) -> pd.Series:
         """Frequency with which the reported values are Null."""
-        return gb["reported_value"].isnull().sum() / gb.shape[0]
+        return sums["null_reported"] / sums["records"]
 
 
 def add_corrections(
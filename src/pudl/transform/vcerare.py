@@ -4,6 +4,8 @@ Wind and solar profiles are extracted separately, but concatenated into a single
 in this module, as they have exactly the same structure.
 """
 
+from collections.abc import Iterable
+
 import duckdb
 import pandas as pd
 import pyarrow as pa
@@ -11,8 +13,10 @@ import pyarrow.parquet as pq
 from dagster import (
     AssetCheckExecutionContext,
     AssetCheckResult,
+    AssetCheckSpec,
+    Failure,
     asset,
-    asset_check,
+    multi_asset_check,
 )
 
 import pudl
@@ -355,228 +359,240 @@ def _load_duckdb_table():
     return duckdb.read_parquet(parquet_path)
 
 
-@asset_check(
-    asset=out_vcerare__hourly_available_capacity_factor,
-    blocking=True,
-    description="Check that row count matches expected.",
-)
-def check_rows(context: AssetCheckExecutionContext) -> AssetCheckResult:
-    """Check rows."""
-    logger.info("Check VCE RARE hourly table is the expected length")
-
-    # Define row counts for fast/full etl
-    row_counts = {
-        "etl_full": 136437000,
-        "etl_fast": 27287400,
-    }
-
-    vce = _load_duckdb_table()  # noqa: F841
-    (length,) = duckdb.query("SELECT COUNT(*) FROM vce").fetchone()
-    if (expected_length := row_counts[context.op_execution_context.job_name]) != length:
-        return AssetCheckResult(
-            passed=False,
-            description="Table unexpected length",
-            metadata={"table_length": length, "expected_length": expected_length},
-        )
-    return AssetCheckResult(passed=True)
-
+VCE_ROW_COUNTS = {
+    "etl_full": 136437000,
+    "etl_fast": 27287400,
+}
+"""Expected length of the VCE RARE hourly table in the fast and full ETL."""
 
-@asset_check(
-    asset=out_vcerare__hourly_available_capacity_factor,
-    blocking=True,
-    description="Check for unexpected nulls.",
+# The hour() and dayofyear() functions are much faster than datepart('hr', ...)
+_HOUR_FROM_DATE_MISMATCH = (
+    "hour(datetime_utc) + (dayofyear(datetime_utc) - 1) * 24 + 1 != hour_of_year"
 )
-def check_nulls() -> AssetCheckResult:
-    """Check nulls."""
-    logger.info("Check there are no NA values in VCE RARE table (except FIPS)")
-    vce = _load_duckdb_table()
-    columns = [c for c in vce.columns if c != "county_id_fips"]
-    null_columns = []
-    for c in columns:
-        nulls = duckdb.query(f"SELECT {c} FROM vce WHERE {c} IS NULL").fetchall()  # noqa: S608
-        if len(nulls) > 0:
-            null_columns.append(c)
-
-    if len(null_columns) > 0:
-        return AssetCheckResult(
-            passed=False,
-            description=f"Found NULL values in columns {', '.join(null_columns)}",
-        )
-    return AssetCheckResult(passed=True)
-
-
-@asset_check(
-    asset=out_vcerare__hourly_available_capacity_factor,
-    blocking=True,
-    description="Check for PV capacity factor above upper bound.",
+_UNEXPECTED_COUNTIES = (
+    "county_or_lake_name = 'bedford_city' or county_or_lake_name = 'clifton_forge_city'"
 )
-def check_pv_capacity_factor_upper_bound() -> AssetCheckResult:
-    """Check pv capacity upper bound."""
-    # Make sure the capacity_factor values are below the expected value
-    # There are some solar values that are slightly over 1 due to colder
-    # than average panel temperatures.
-    logger.info("Check capacity factors in VCE RARE table are between 0 and 1.")
-    vce = _load_duckdb_table()  # noqa: F841
-    cap_oob = duckdb.query(
-        "SELECT * FROM vce WHERE capacity_factor_solar_pv > 1.02"
-    ).fetchall()
-    if len(cap_oob) > 0:
-        return AssetCheckResult(
-            passed=False,
-            description="Found PV capacity factor values greater than 1.02",
-        )
-    return AssetCheckResult(passed=True)
-
 
-@asset_check(
-    asset=out_vcerare__hourly_available_capacity_factor,
-    blocking=True,
-    description="Check for wind capacity factor above upper bound.",
+# Timestamps aren't JSON serializable, so offending rows are reported as text
+_ROWS_AS_METADATA = (
+    "SELECT * REPLACE (CAST(datetime_utc AS VARCHAR) AS datetime_utc) FROM vce"
 )
-def check_wind_capacity_factor_upper_bound() -> AssetCheckResult:
-    """Check wind capacity upper bound."""
-    vce = _load_duckdb_table()
-    columns = [c for c in vce.columns if c.endswith("wind")]
-    cap_oob_columns = []
-    for c in columns:
-        cap_oob = duckdb.query(f"SELECT {c} FROM vce WHERE {c} > 1.0").fetchall()  # noqa: S608
-        if len(cap_oob) > 0:  # noqa: S608
-            cap_oob_columns.append(c)
-
-    if len(cap_oob_columns) > 0:
-        return AssetCheckResult(
-            passed=False,
-            description=f"Found wind capacity factor values greater than 1.0 in column {', '.join(cap_oob_columns)}",
-        )
-    return AssetCheckResult(passed=True)
 
-
-@asset_check(
-    asset=out_vcerare__hourly_available_capacity_factor,
-    blocking=True,
-    description="Check capacity factors below lower bound.",
-)
-def check_capacity_factor_lower_bound() -> AssetCheckResult:
-    """Check capacity lower bound."""
-    vce = _load_duckdb_table()
-    # Make sure capacity_factor values are greater than or equal to 0
-    columns = [c for c in vce.columns if c.startswith("capacity_factor")]
-    cap_oob_columns = []
-    for c in columns:
-        cap_oob = duckdb.query(f"SELECT {c} FROM vce WHERE {c} < 0.0").fetchall()  # noqa: S608
-        if len(cap_oob) > 0:
-            cap_oob_columns.append(c)
-
-    if len(cap_oob_columns) > 0:
-        return AssetCheckResult(
-            passed=False,
-            description=f"Found capacity factor values less than 0 from column {', '.join(cap_oob_columns)}",
-        )
-    return AssetCheckResult(passed=True)
+VCE_ASSET_CHECK_SPECS = [
+    AssetCheckSpec(
+        name=name,
+        asset=out_vcerare__hourly_available_capacity_factor,
+        blocking=False,
+        description=description,
+    )
+    for name, description in {
+        "check_rows": "Check that row count matches expected.",
+        "check_nulls": "Check for unexpected nulls.",
+        "check_pv_capacity_factor_upper_bound": "Check for PV capacity factor above upper bound.",
+        "check_wind_capacity_factor_upper_bound": "Check for wind capacity factor above upper bound.",
+        "check_capacity_factor_lower_bound": "Check capacity factors below lower bound.",
+        "check_max_hour_of_year": "Check max hour of year in VCE RARE table is 8760.",
+        "check_unexpected_dates": "Check for unexpected Dec 31st, 2020 dates in VCE RARE table.",
+        "check_hour_from_date": "Check hour from date and hour of year match in VCE RARE table.",
+        "check_unexpected_counties": "Check for rows for Bedford City or Clifton Forge City in VCE RARE table.",
+        "check_duplicate_county_id_fips": "Check for duplicate county_id_fips values in VCE RARE table.",
+    }.items()
+]
+
+
+def _vce_check_query(columns: list[str]) -> str:
+    """Compile all the VCE RARE asset checks into a single aggregation query.
+
+    Every check is reduced to one or more counts (or a max) computed in the same scan
+    of the table. The aggregates are grouped by the year of ``datetime_utc`` so that
+    the distinct ``(county_id_fips, datetime_utc)`` hash tables stay year-sized, and
+    so the row counts can be reported per year. Because each timestamp falls in
+    exactly one year, summing the per-year duplicate counts is exact.
+    """
+    aggs = ["COUNT(*) AS n_rows"]
+    aggs += [
+        f'COUNT(*) - COUNT({c}) AS "null__{c}"'
+        for c in columns
+        if c != "county_id_fips"
+    ]
+    aggs.append(
+        "COUNT(*) FILTER (WHERE capacity_factor_solar_pv > 1.02) AS pv_over_upper_bound"
+    )
+    aggs += [
+        f'COUNT(*) FILTER (WHERE {c} > 1.0) AS "over_upper_bound__{c}"'
+        for c in columns
+        if c.endswith("wind")
+    ]
+    aggs += [
+        f'COUNT(*) FILTER (WHERE {c} < 0.0) AS "under_lower_bound__{c}"'
+        for c in columns
+        if c.startswith("capacity_factor")
+    ]
+    aggs += [
+        "MAX(hour_of_year) AS max_hour_of_year",
+        "COUNT(*) FILTER (WHERE datetime_utc = make_date(2020, 12, 31)) AS unexpected_dates",
+        f"COUNT(*) FILTER (WHERE {_HOUR_FROM_DATE_MISMATCH}) AS mismatched_hours",
+        f"COUNT(*) FILTER (WHERE {_UNEXPECTED_COUNTIES}) AS unexpected_counties",
+        "COUNT(county_id_fips) - COUNT(DISTINCT (county_id_fips, datetime_utc)) "
+        "FILTER (WHERE county_id_fips IS NOT NULL) AS duplicate_county_id_fips",
+    ]
+    return (
+        "SELECT year(datetime_utc) AS year, "  # noqa: S608
+        + ", ".join(aggs)
+        + " FROM vce GROUP BY ALL ORDER BY year"
+    )
 
 
-@asset_check(
-    asset=out_vcerare__hourly_available_capacity_factor,
-    blocking=True,
-    description="Check max hour of year in VCE RARE table is 8760.",
-)
-def check_max_hour_of_year() -> AssetCheckResult:
-    """Check max hour of year."""
-    vce = _load_duckdb_table()  # noqa: F841
-    logger.info("Check max hour of year in VCE RARE table is 8760.")
-    (max_hour,) = duckdb.query("SELECT MAX(hour_of_year) FROM vce").fetchone()
-    if max_hour != 8760:
+def _check_result(
+    check_name: str,
+    failed: bool,
+    description: str,
+    metadata: dict | None = None,
+) -> AssetCheckResult:
+    """Report a failed check with its description and metadata, or a passed check."""
+    if failed:
         return AssetCheckResult(
+            check_name=check_name,
             passed=False,
-            description="Found hour_of_year values larger than 8760",
+            description=description,
+            metadata=metadata,
         )
-    return AssetCheckResult(passed=True)
-
+    return AssetCheckResult(check_name=check_name, passed=True)
 
-@asset_check(
-    asset=out_vcerare__hourly_available_capacity_factor,
-    blocking=True,
-    description="Check for unexpected Dec 31st, 2020 dates in VCE RARE table.",
-)
-def check_unexpected_dates() -> AssetCheckResult:
-    """Check unexpected dates."""
-    vce = _load_duckdb_table()  # noqa: F841
-    logger.info("Check for unexpected Dec 31st, 2020 dates in VCE RARE table.")
-    unexpected_dates = duckdb.query(
-        "SELECT datetime_utc FROM vce WHERE datetime_utc = make_date(2020, 12, 31)"
-    ).fetchall()
-    if len(unexpected_dates) > 0:
-        return AssetCheckResult(
-            passed=False,
-            description="Found rows for December 31, 2020 which should not exist",
-        )
-    return AssetCheckResult(passed=True)
 
+def _run_vce_checks(
+    vce: duckdb.DuckDBPyRelation, expected_length: int
+) -> list[AssetCheckResult]:
+    """Run all VCE RARE asset checks against the table with a single scan.
 
-@asset_check(
-    asset=out_vcerare__hourly_available_capacity_factor,
-    blocking=True,
-    description="Check hour from date and hour of year match in VCE RARE table.",
-)
-def check_hour_from_date() -> AssetCheckResult:
-    """Check hour from date."""
-    vce = _load_duckdb_table()  # noqa: F841
-    logger.info("Check hour from date and hour of year match in VCE RARE table.")
-    mismatched_hours = duckdb.query(
-        "SELECT * FROM vce WHERE"
-        "(datepart('hr', datetime_utc) +"
-        "((datepart('dayofyear', datetime_utc)-1)*24)+1) != hour_of_year"
-    ).fetchall()
-    if len(mismatched_hours) > 0:
-        return AssetCheckResult(
-            passed=False,
-            description="hour_of_year values don't match date values",
-            metadata={"mismatched_hours": mismatched_hours},
-        )
-    return AssetCheckResult(passed=True)
+    The offending rows are only selected in a second query for the two checks which
+    report them as metadata, and only if those checks fail.
 
+    Args:
+        vce: duckdb relation containing the VCE RARE hourly table.
+        expected_length: the number of rows the table should contain.
 
-@asset_check(
-    asset=out_vcerare__hourly_available_capacity_factor,
-    blocking=True,
-    description="Check for rows for Bedford City or Clifton Forge City in VCE RARE table.",
-)
-def check_unexpected_counties() -> AssetCheckResult:
-    """Check unexpected counties."""
-    vce = _load_duckdb_table()  # noqa: F841
-    logger.info(
-        "Check for rows for Bedford City or Clifton Forge City in VCE RARE table."
-    )
-    unexpected_counties = duckdb.query(
-        "SELECT * FROM vce "
-        "WHERE county_or_lake_name = 'bedford_city' or county_or_lake_name = 'clifton_forge_city'"
-    ).fetchall()
-    if len(unexpected_counties) > 0:
-        return AssetCheckResult(
-            passed=False,
-            description="found records for bedford_city or clifton_forge_city that shouldn't exist",
+    Returns:
+        One result for each of :data:`VCE_ASSET_CHECK_SPECS`, in the same order.
+    """
+    counts = duckdb.query(_vce_check_query(vce.columns)).df()
+    totals = counts.drop(columns=["year", "max_hour_of_year"]).sum()
+
+    def _flagged(prefix: str) -> list[str]:
+        return [
+            col.removeprefix(prefix)
+            for col, n in totals.items()
+            if col.startswith(prefix) and n > 0
+        ]
+
+    length = int(totals["n_rows"])
+    null_columns = _flagged("null__")
+    wind_oob_columns = _flagged("over_upper_bound__")
+    cap_oob_columns = _flagged("under_lower_bound__")
+    mismatched_hours = []
+    if totals["mismatched_hours"] > 0:
+        mismatched_hours = duckdb.query(
+            f"{_ROWS_AS_METADATA} WHERE {_HOUR_FROM_DATE_MISMATCH}"  # noqa: S608
+        ).fetchall()
+    unexpected_counties = []
+    if totals["unexpected_counties"] > 0:
+        unexpected_counties = duckdb.query(
+            f"{_ROWS_AS_METADATA} WHERE {_UNEXPECTED_COUNTIES}"  # noqa: S608
+        ).fetchall()
+
+    return [
+        _check_result(
+            "check_rows",
+            length != expected_length,
+            "Table unexpected length",
+            metadata={
+                "table_length": length,
+                "expected_length": expected_length,
+                "rows_per_year": dict(
+                    zip(
+                        counts["year"].astype(str),
+                        counts["n_rows"].astype(int).tolist(),
+                        strict=True,
+                    )
+                ),
+            },
+        ),
+        _check_result(
+            "check_nulls",
+            bool(null_columns),
+            f"Found NULL values in columns {', '.join(null_columns)}",
+        ),
+        # There are some solar values that are slightly over 1 due to colder
+        # than average panel temperatures.
+        _check_result(
+            "check_pv_capacity_factor_upper_bound",
+            totals["pv_over_upper_bound"] > 0,
+            "Found PV capacity factor values greater than 1.02",
+        ),
+        _check_result(
+            "check_wind_capacity_factor_upper_bound",
+            bool(wind_oob_columns),
+            "Found wind capacity factor values greater than 1.0 in column "
+            f"{', '.join(wind_oob_columns)}",
+        ),
+        _check_result(
+            "check_capacity_factor_lower_bound",
+            bool(cap_oob_columns),
+            "Found capacity factor values less than 0 from column "
+            f"{', '.join(cap_oob_columns)}",
+        ),
+        _check_result(
+            "check_max_hour_of_year",
+            counts["max_hour_of_year"].max() != 8760,
+            "Found hour_of_year values larger than 8760",
+        ),
+        _check_result(
+            "check_unexpected_dates",
+            totals["unexpected_dates"] > 0,
+            "Found rows for December 31, 2020 which should not exist",
+        ),
+        _check_result(
+            "check_hour_from_date",
+            bool(mismatched_hours),
+            "hour_of_year values don't match date values",
+            metadata={"mismatched_hours": mismatched_hours},
+        ),
+        _check_result(
+            "check_unexpected_counties",
+            bool(unexpected_counties),
+            "found records for bedford_city or clifton_forge_city that shouldn't exist",
             metadata={"unexpected_counties": unexpected_counties},
-        )
-    return AssetCheckResult(passed=True)
+        ),
+        _check_result(
+            "check_duplicate_county_id_fips",
+            totals["duplicate_county_id_fips"] > 0,
+            "Found duplicate county_id_fips values",
+        ),
+    ]
 
 
-@asset_check(
-    asset=out_vcerare__hourly_available_capacity_factor,
-    blocking=True,
-    description="Check for duplicate county_id_fips values in VCE RARE table.",
-)
-def check_duplicate_county_id_fips() -> AssetCheckResult:
-    """Check duplicate county ID."""
-    vce = _load_duckdb_table()  # noqa: F841
-    logger.info("Check for duplicate county_id_fips values in VCE RARE table.")
-    duplicate_county_ids = duckdb.query(
-        "SELECT county_id_fips, datetime_utc "
-        "FROM vce WHERE county_id_fips "
-        "IS NOT NULL GROUP BY ALL HAVING COUNT(*) > 1"
-    ).fetchall()
-    if len(duplicate_county_ids) > 0:
-        return AssetCheckResult(
-            passed=False,
-            description="Found duplicate county_id_fips values",
+@multi_asset_check(specs=VCE_ASSET_CHECK_SPECS)
+def check_vcerare_hourly_available_capacity_factor(
+    context: AssetCheckExecutionContext,
+) -> Iterable[AssetCheckResult]:
+    """Run all the VCE RARE hourly table checks in a single scan of the parquet file.
+
+    Each check is still reported individually. Dagster stops a multi-asset check at
+    the first failed blocking result, so the checks are declared non-blocking. Once
+    every result has been reported, a single :class:`dagster.Failure` lists all the
+    failed checks so that the step still fails.
+    """
+    logger.info("Running all asset checks on the VCE RARE hourly table.")
+    vce = _load_duckdb_table()
+    results = _run_vce_checks(
+        vce, expected_length=VCE_ROW_COUNTS[context.op_execution_context.job_name]
+    )
+    yield from results
+    if failed := [r for r in results if not r.passed]:
+        raise Failure(
+            description=(
+                f"{len(failed)} VCE RARE asset checks failed: "
+                + "; ".join(f"{r.check_name}: {r.description}" for r in failed)
+            ),
+            metadata={"failed_checks": [r.check_name for r in failed]},
         )
-    return AssetCheckResult(passed=True)
@@ -271,6 +271,82 @@ def check_unique_rows(
     return df
 
 
+def _weighted_quantiles(
+    data: np.ndarray, weights: np.ndarray, quantiles: np.ndarray
+) -> np.ndarray:
+    """Weighted quantiles of finite data, sorting it only once.
+
+    Args:
+        data: Finite numeric data.
+        weights: Finite weights, with the same length as data.
+        quantiles: Numbers between 0 and 1.
+
+    Returns:
+        The value of the weighted data at each quantile, or :mod:`numpy.nan` for all
+        of them if there is no data.
+    """
+    if len(data) == 0:
+        return np.full(len(quantiles), np.nan)
+    order = np.argsort(data, kind="quicksort")
+    data, weights = data[order], weights[order]
+    Sn = np.cumsum(weights)  # noqa: N806
+    Pn = (Sn - 0.5 * weights) / Sn[-1]  # noqa: N806
+    return np.interp(quantiles, Pn, data)
+
+
+def weighted_quantiles(
+    data: pd.Series,
+    weights: pd.Series,
+    quantiles: list[float],
+    by: pd.Series | None = None,
+) -> pd.DataFrame:
+    """Calculate several weighted quantiles of a column, optionally by group.
+
+    Non-finite data and weights are ignored. The data in each group is sorted only
+    once, however many quantiles are requested, so this is much faster than calling
+    :func:`weighted_quantile` for each quantile and group.
+
+    Args:
+        data: A series containing numeric data.
+        weights: Weights to use in scaling the data. Must have the same length as data.
+        quantiles: Numbers between 0 and 1, representing the quantiles at which we want
+            to find the value of the weighted data.
+        by: Labels of the groups to calculate the quantiles of separately, e.g.
+            ``report_year``. Must have the same length as data. Records with a null
+            label are ignored. If None, the quantiles of all of the data are
+            calculated.
+
+    Returns:
+        The value in the weighted data corresponding to each quantile (columns), in
+        each group (index, in order of first appearance). If there is no data in a
+        group, its values are :mod:`numpy.nan`. If ``by`` is None, the index has a
+        single value of 0.
+    """
+    quantiles = np.asarray(quantiles, dtype=float)
+    if ((quantiles < 0) | (quantiles > 1)).any():
+        raise ValueError("quantile must have a value between 0 and 1.")
+    if len(data) != len(weights):
+        raise ValueError("data and weights must have the same length")
+    data = pd.Series(data).to_numpy(dtype=float, na_value=np.nan)
+    weights = pd.Series(weights).to_numpy(dtype=float, na_value=np.nan)
+    if by is None:
+        codes, groups = np.zeros(len(data), dtype=int), pd.Index([0])
+    else:
+        if len(by) != len(data):
+            raise ValueError("data and by must have the same length")
+        codes, groups = pd.factorize(pd.Series(by))
+    # Stable sort so that each group keeps its original order
+    order = np.argsort(codes, kind="stable")
+    bounds = np.searchsorted(codes[order], np.arange(len(groups) + 1))
+    finite = np.isfinite(data) & np.isfinite(weights)
+    result = np.empty((len(groups), len(quantiles)))
+    for i in range(len(groups)):
+        rows = order[bounds[i] : bounds[i + 1]]
+        rows = rows[finite[rows]]
+        result[i] = _weighted_quantiles(data[rows], weights[rows], quantiles)
+    return pd.DataFrame(result, index=groups, columns=quantiles)
+
+
 def weighted_quantile(data: pd.Series, weights: pd.Series, quantile: float) -> float:
     """Calculate the weighted quantile of a Series or DataFrame column.
 
@@ -279,7 +355,8 @@ def weighted_quantile(data: pd.Series, weights: pd.Series, quantile: float) -> f
     other of which (weights) contains a quantity like quantity of fuel delivered which
     should be used to scale the importance of the observed value in an overall
     distribution, and calculate the values that the scaled distribution will have at
-    various quantiles.
+    various quantiles. To calculate several quantiles of the same data, use
+    :func:`weighted_quantiles` instead.
 
     Args:
         data: A series containing numeric data.
@@ -291,24 +368,47 @@ def weighted_quantile(data: pd.Series, weights: pd.Series, quantile: float) -> f
         The value in the weighted data corresponding to the given quantile. If there are
         no values in the data, return :mod:`numpy.nan`.
     """
-    if (quantile < 0) or (quantile > 1):
-        raise ValueError("quantile must have a value between 0 and 1.")
-    if len(data) != len(weights):
-        raise ValueError("data and weights must have the same length")
-    df = (
-        pd.DataFrame({"data": data, "weights": weights})
-        .replace([np.inf, -np.inf], np.nan)
-        .dropna()
-        .sort_values(by="data")
-    )
-    Sn = df.weights.cumsum()  # noqa: N806
-    # This conditional is necessary because sometimes new columns get
-    # added to the EIA data, and so they won't show up in prior years.
-    if len(Sn) > 0:
-        Pn = (Sn - 0.5 * df.weights) / Sn.iloc[-1]  # noqa: N806
-        return np.interp(quantile, Pn, df.data)
+    return weighted_quantiles(data, weights, [quantile]).iloc[0, 0]
+
+
+def _weights(df: pd.DataFrame, weight_col: str | None) -> pd.Series:
+    """Weights of a validation case, which are all 1 if there is no weight column."""
+    if weight_col is None or weight_col == "":
+        return pd.Series(1.0, index=df.index)
+    return df[weight_col]
+
+
+def _report_years(df: pd.DataFrame) -> pd.Series:
+    """Report year of each record, from either ``report_year`` or ``report_date``."""
+    if "report_year" in df.columns:
+        return df.report_year
+    return pd.to_datetime(df.report_date).dt.year
+
+
+def historical_distributions(
+    df: pd.DataFrame, data_col: str, weight_col: str, quantiles: list[float]
+) -> pd.DataFrame:
+    """Calculate historical distributions of weighted values of a column.
 
-    return np.nan
+    Like :func:`historical_distribution`, but for several quantiles at once, sorting
+    the data of each year only once.
+
+    Args:
+        df: a dataframe containing historical data, with a column named either
+            ``report_date`` or ``report_year``.
+        data_col: Label of the column containing the data of interest.
+        weight_col: Label of the column containing the weights to be used in scaling
+            the data.
+        quantiles: The quantiles to calculate.
+
+    Returns:
+        The weighted quantiles (columns) of data in each of the years (index) found in
+        the historical data of df. Values can be NaN, if there were no values in that
+        column for some years in the data.
+    """
+    return weighted_quantiles(
+        df[data_col], _weights(df, weight_col), quantiles, by=_report_years(df)
+    )
 
 
 def historical_distribution(
@@ -333,24 +433,10 @@ def historical_distribution(
         list: The weighted quantiles of data, for each of the years found in
         the historical data of df.
     """
-    if "report_year" not in df.columns:
-        df["report_year"] = pd.to_datetime(df.report_date).dt.year
-    if weight_col is None or weight_col == "":
-        df["ones"] = 1.0
-        weight_col = "ones"
-    report_years = df.report_year.unique()
-    dist = []
-    for year in report_years:
-        dist = dist + [
-            weighted_quantile(
-                df[df.report_year == year][data_col],
-                df[df.report_year == year][weight_col],
-                quantile,
-            )
-        ]
+    dist = historical_distributions(df, data_col, weight_col, [quantile]).iloc[:, 0]
     # these values can be NaN, if there were no values in that column for some
     # years in the data:
-    return [d for d in dist if not np.isnan(d)]
+    return dist.dropna().tolist()
 
 
 def vs_bounds(
@@ -383,14 +469,18 @@ def vs_bounds(
         )
 
     if query != "":
-        df = df.copy().query(query)
+        df = df.query(query)
     if title != "":
         logger.info(title)
-    if weight_col is None or weight_col == "":
-        df["ones"] = 1.0
-        weight_col = "ones"
-    if low_q >= 0 and low_bool:
-        low_test = weighted_quantile(df[data_col], df[weight_col], low_q)
+    test_low = low_q >= 0 and low_bool
+    test_hi = hi_q <= 1 and hi_bool
+    quantiles = [q for q, test in ((low_q, test_low), (hi_q, test_hi)) if test]
+    if not quantiles:
+        return
+    # Calculate both quantiles from a single sort of the data
+    values = weighted_quantiles(df[data_col], _weights(df, weight_col), quantiles)
+    if test_low:
+        low_test = values.iloc[0, 0]
         logger.info(f"{data_col} ({low_q:.0%}): {low_test:.6} >= {low_bound:.6}")
         if low_test < low_bound:
             raise ValueError(
@@ -398,8 +488,8 @@ def vs_bounds(
                 f"is below lower bound ({low_bound}) "
                 f"in validation entitled {title}"
             )
-    if hi_q <= 1 and hi_bool:
-        hi_test = weighted_quantile(df[data_col], df[weight_col], hi_q)
+    if test_hi:
+        hi_test = values.iloc[0, -1]
         logger.info(f"{data_col} ({hi_q:.0%}): {hi_test:.6} <= {hi_bound:.6}")
         if hi_test > hi_bound:
             raise ValueError(
@@ -418,9 +508,6 @@ def vs_self(
     both the ``orig_df`` and ``test_df`` are the same. Mostly it helps ensure that the
     test itself is valid for the given distribution.
     """
-    if weight_col is None or weight_col == "":
-        df["ones"] = 1.0
-        weight_col = "ones"
     vs_historical(
         df,
         df,
@@ -447,17 +534,21 @@ def vs_historical(  # noqa: C901
 ):
     """Validate aggregated distributions against original data."""
     if query != "":
-        orig_df = orig_df.copy().query(query)
-        test_df = test_df.copy().query(query)
+        orig_df = orig_df.query(query)
+        test_df = orig_df if test_df is orig_df else test_df.query(query)
     if title != "":
         logger.info(title)
-    if weight_col is None or weight_col == "":
-        orig_df["ones"] = 1.0
-        test_df["ones"] = 1.0
-        weight_col = "ones"
+    # Calculate all of the quantiles from a single sort of each year of data
+    quantiles = list(dict.fromkeys(q for q in (low_q, mid_q, hi_q) if q))
+    if not quantiles:
+        return
+    ranges = historical_distributions(orig_df, data_col, weight_col, quantiles)
+    tests = weighted_quantiles(
+        test_df[data_col], _weights(test_df, weight_col), quantiles
+    ).iloc[0]
     if low_q:
-        low_range = historical_distribution(orig_df, data_col, weight_col, low_q)
-        low_test = weighted_quantile(test_df[data_col], test_df[weight_col], low_q)
+        low_range = ranges[low_q].dropna()
+        low_test = tests[low_q]
         logger.info(f"{data_col} ({low_q:.0%}): {low_test:.6} >= {min(low_range):.6}")
         if low_test < min(low_range):
             raise ValueError(
@@ -466,8 +557,8 @@ def vs_historical(  # noqa: C901
             )
 
     if mid_q:
-        mid_range = historical_distribution(orig_df, data_col, weight_col, mid_q)
-        mid_test = weighted_quantile(test_df[data_col], test_df[weight_col], mid_q)
+        mid_range = ranges[mid_q].dropna()
+        mid_test = tests[mid_q]
         logger.info(
             f"{data_col} ({mid_q:.0%}): {min(mid_range):.6} <= {mid_test:.6} "
             f"<= {max(mid_range):.6}"
@@ -484,8 +575,8 @@ def vs_historical(  # noqa: C901
             )
 
     if hi_q:
-        hi_range = historical_distribution(orig_df, data_col, weight_col, hi_q)
-        hi_test = weighted_quantile(test_df[data_col], test_df[weight_col], hi_q)
+        hi_range = ranges[hi_q].dropna()
+        hi_test = tests[hi_q]
         logger.info(f"{data_col} ({hi_q:.0%}): {hi_test:.6} <= {max(hi_range):.6}.")
         if hi_test > max(hi_range):
             raise ValueError(
@@ -499,19 +590,19 @@ def bounds_histogram(
 ):
     """Plot a weighted histogram showing acceptable bounds/actual values."""
     if query != "":
-        df = df.copy().query(query)
-    if weight_col is None or weight_col == "":
-        df["ones"] = 1.0
-        weight_col = "ones"
+        df = df.query(query)
+    weights = _weights(df, weight_col)
     # Non-finite values screw up the plot but not the test:
-    df = df[np.isfinite(df[data_col]) & np.isfinite(df[weight_col])]
+    finite = np.isfinite(df[data_col]) & np.isfinite(weights)
+    data, weights = df.loc[finite, data_col], weights[finite]
 
-    xmin = weighted_quantile(df[data_col], df[weight_col], 0.01)
-    xmax = weighted_quantile(df[data_col], df[weight_col], 0.99)
+    xmin, xmax, low_value, hi_value = weighted_quantiles(
+        data, weights, [0.01, 0.99, low_q or 0, hi_q or 0]
+    ).iloc[0]
 
     plt.hist(
-        df[data_col],
-        weights=df[weight_col],
+        data,
+        weights=weights,
         range=(xmin, xmax),
         bins=50,
         color="black",
@@ -522,22 +613,12 @@ def bounds_histogram(
         plt.axvline(
             low_bound, lw=3, ls="--", color="red", label=f"lower bound for {low_q:.0%}"
         )
-        plt.axvline(
-            weighted_quantile(df[data_col], df[weight_col], low_q),
-            lw=3,
-            color="red",
-            label=f"actual {low_q:.0%}",
-        )
+        plt.axvline(low_value, lw=3, color="red", label=f"actual {low_q:.0%}")
     if hi_bound:
         plt.axvline(
             hi_bound, lw=3, ls="--", color="blue", label=f"upper bound for {hi_q:.0%}"
         )
-        plt.axvline(
-            weighted_quantile(df[data_col], df[weight_col], hi_q),
-            lw=3,
-            color="blue",
-            label=f"actual {hi_q:.0%}",
-        )
+        plt.axvline(hi_value, lw=3, color="blue", label=f"actual {hi_q:.0%}")
 
     plt.title(title)
     plt.xlabel(data_col)
@@ -561,30 +642,27 @@ def historical_histogram(
 ):
     """Weighted histogram comparing distribution with historical subsamples."""
     if query != "":
-        orig_df = orig_df.copy().query(query)
+        orig_df = orig_df.query(query)
 
-    if weight_col is None or weight_col == "":
-        orig_df["ones"] = 1.0
-        if test_df is not None:
-            test_df["ones"] = 1.0
-        weight_col = "ones"
-
-    orig_df = orig_df[np.isfinite(orig_df[data_col]) & np.isfinite(orig_df[weight_col])]
+    orig_weights = _weights(orig_df, weight_col)
+    finite = np.isfinite(orig_df[data_col]) & np.isfinite(orig_weights)
+    orig_df, orig_weights = orig_df[finite], orig_weights[finite]
 
     if test_df is not None:
-        test_df = test_df.copy().query(query)
-        test_df = test_df[
-            np.isfinite(test_df[data_col]) & np.isfinite(test_df[weight_col])
-        ]
+        if query != "":
+            test_df = test_df.query(query)
+        test_weights = _weights(test_df, weight_col)
+        finite = np.isfinite(test_df[data_col]) & np.isfinite(test_weights)
+        test_df, test_weights = test_df[finite], test_weights[finite]
 
-    xmin = weighted_quantile(orig_df[data_col], orig_df[weight_col], 0.01)
-    xmax = weighted_quantile(orig_df[data_col], orig_df[weight_col], 0.99)
+    limits = weighted_quantiles(orig_df[data_col], orig_weights, [0.01, 0.99])
+    xmin, xmax = limits.iloc[0]
 
     test_alpha = 1.0
     if test_df is not None:
         plt.hist(
             test_df[data_col],
-            weights=test_df[weight_col],
+            weights=test_weights,
             range=(xmin, xmax),
             bins=50,
             color="yellow",
@@ -593,10 +671,10 @@ def historical_histogram(
         )
         test_alpha = 0.5
     else:
-        test_df = orig_df
+        test_df, test_weights = orig_df, orig_weights
     plt.hist(
         orig_df[data_col],
-        weights=orig_df[weight_col],
+        weights=orig_weights,
         range=(xmin, xmax),
         bins=50,
         color="black",
@@ -604,50 +682,27 @@ def historical_histogram(
         label="Original Distribution",
     )
 
-    if low_q:
-        low_range = historical_distribution(orig_df, data_col, weight_col, low_q)
-        plt.axvspan(
-            min(low_range),
-            max(low_range),
-            color="red",
-            alpha=0.2,
-            label=f"Historical range of {low_q:.0%}",
-        )
-        plt.axvline(
-            weighted_quantile(test_df[data_col], test_df[weight_col], low_q),
-            color="red",
-            label=f"Tested {low_q:.0%}",
-        )
-
-    if mid_q:
-        mid_range = historical_distribution(orig_df, data_col, weight_col, mid_q)
-        plt.axvspan(
-            min(mid_range),
-            max(mid_range),
-            color="green",
-            alpha=0.2,
-            label=f"historical range of {mid_q:.0%}",
-        )
-        plt.axvline(
-            weighted_quantile(test_df[data_col], test_df[weight_col], mid_q),
-            color="green",
-            label=f"Tested {mid_q:.0%}",
-        )
-
-    if hi_q:
-        high_range = historical_distribution(orig_df, data_col, weight_col, hi_q)
-        plt.axvspan(
-            min(high_range),
-            max(high_range),
-            color="blue",
-            alpha=0.2,
-            label=f"Historical range of {hi_q:.0%}",
-        )
-        plt.axvline(
-            weighted_quantile(test_df[data_col], test_df[weight_col], hi_q),
-            color="blue",
-            label=f"Tested {hi_q:.0%}",
+    quantiles = list(dict.fromkeys(q for q in (low_q, mid_q, hi_q) if q))
+    if quantiles:
+        ranges = weighted_quantiles(
+            orig_df[data_col], orig_weights, quantiles, by=_report_years(orig_df)
         )
+        tests = weighted_quantiles(test_df[data_col], test_weights, quantiles).iloc[0]
+
+    for q, color, label in (
+        (low_q, "red", "Historical range"),
+        (mid_q, "green", "historical range"),
+        (hi_q, "blue", "Historical range"),
+    ):
+        if q:
+            plt.axvspan(
+                ranges[q].min(),
+                ranges[q].max(),
+                color=color,
+                alpha=0.2,
+                label=f"{label} of {q:.0%}",
+            )
+            plt.axvline(tests[q], color=color, label=f"Tested {q:.0%}")
 
     plt.title(title)
     plt.xlabel(data_col)
@@ -8,4 +8,4 @@ These tools are available both as a library module, and via a command line
 interface installed as an entrypoint script called ``pudl_datastore``.
 """
 
-from . import datastore, resource_cache, setup
+from . import datastore, memo, resource_cache, setup
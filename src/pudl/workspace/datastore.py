@@ -6,11 +6,13 @@ import json
 import pathlib
 import re
 import sys
+import time
 import zipfile
 from collections import defaultdict
 from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Annotated, Any, Self
+from typing import Annotated, Any, BinaryIO, Self
 from urllib.parse import ParseResult, urlparse
 
 import click
@@ -92,13 +94,21 @@ class DatapackageDescriptor:
 
     def validate_checksum(self, name: str, content: str) -> bool:
         """Returns True if content matches checksum for given named resource."""
-        expected_checksum = self._get_resource_metadata(name)["hash"]
         m = hashlib.md5()  # noqa: S324 Unfortunately md5 is required by Zenodo
         m.update(content)
-        if m.hexdigest() != expected_checksum:
+        self.validate_md5_hexdigest(name, m.hexdigest())
+
+    def validate_md5_hexdigest(self, name: str, hexdigest: str) -> None:
+        """Raises ChecksumMismatchError if md5 hexdigest doesn't match named resource.
+
+        This allows the checksum to be computed incrementally, e.g. while a resource
+        is being streamed to disk, rather than from its full content in memory.
+        """
+        expected_checksum = self._get_resource_metadata(name)["hash"]
+        if hexdigest != expected_checksum:
             raise ChecksumMismatchError(
                 f"Checksum for resource {name} does not match."
-                f"Expected {expected_checksum}, got {m.hexdigest()}"
+                f"Expected {expected_checksum}, got {hexdigest}"
             )
 
     def _matches(self, res: dict, **filters: Any):
@@ -269,10 +279,15 @@ class ZenodoFetcher:
             raise ValueError(f"Invalid Zenodo DOI: {doi}")
         return f"{api_root}/records/{zenodo_id}/files"
 
-    def _fetch_from_url(self: Self, url: HttpUrl) -> requests.Response:
+    def _fetch_from_url(
+        self: Self,
+        url: HttpUrl,
+        ok_codes: tuple[int, ...] = (requests.codes.ok,),
+        **kwargs: Any,
+    ) -> requests.Response:
         logger.info(f"Retrieving {url} from zenodo")
-        response = self.http.get(url, timeout=self.timeout)
-        if response.status_code == requests.codes.ok:
+        response = self.http.get(url, timeout=self.timeout, **kwargs)
+        if response.status_code in ok_codes:
             logger.debug(f"Successfully downloaded {url}")
             return response
         raise ValueError(f"Could not download {url}: {response.text}")
@@ -303,6 +318,93 @@ class ZenodoFetcher:
         desc.validate_checksum(res.name, content)
         return content
 
+    def fetch_to_file(
+        self: Self,
+        res: PudlResourceKey,
+        path: Path,
+        chunk_size: int = 2**20,
+        desc: DatapackageDescriptor | None = None,
+    ) -> int:
+        """Stream a resource from zenodo into a file, resuming partial downloads.
+
+        The content is appended to ``<path>.partial`` as it arrives, and its md5
+        checksum is computed along the way, so the resource is never held in memory.
+        If a partial file is left over from an interrupted download, only the remaining
+        bytes are requested, using an HTTP Range header. Downloads which are cut off
+        by a connection error are resumed the same way, with exponential backoff.
+        Once the download is complete and its checksum has been verified, the partial
+        file is renamed to ``path``.
+
+        Args:
+            res: the resource to download.
+            path: where the completed resource should be written.
+            chunk_size: number of bytes to read from the response at a time.
+            desc: the datapackage descriptor of the resource's dataset, if it has
+                already been loaded, e.g. from the cache. Otherwise it is fetched from
+                zenodo.
+
+        Returns:
+            The number of bytes transferred over the network.
+        """
+        if desc is None:
+            desc = self.get_descriptor(res.dataset)
+        url = desc.get_resource_path(res.name)
+        partial_path = path.with_name(f"{path.name}.partial")
+        partial_path.parent.mkdir(parents=True, exist_ok=True)
+        transferred = 0
+
+        def stream_to_partial():
+            nonlocal transferred
+            offset = 0
+            md5 = hashlib.md5()  # noqa: S324 Unfortunately md5 is required by Zenodo
+            if partial_path.exists():
+                with partial_path.open("rb") as partial:
+                    md5 = hashlib.file_digest(partial, "md5")
+                    offset = partial.tell()
+            ok_codes = (requests.codes.ok,)
+            headers = {}
+            if offset:
+                ok_codes += (
+                    requests.codes.partial_content,
+                    requests.codes.requested_range_not_satisfiable,
+                )
+                headers["Range"] = f"bytes={offset}-"
+
+            logger.info(f"Streaming {url} from zenodo starting at byte {offset}")
+            with self._fetch_from_url(
+                url, ok_codes=ok_codes, headers=headers, stream=True
+            ) as response:
+                if response.status_code == requests.codes.ok:
+                    # The server ignored our Range request, so start from scratch.
+                    mode = "wb"
+                    md5 = hashlib.md5()  # noqa: S324
+                elif response.status_code == requests.codes.partial_content:
+                    mode = "ab"
+                else:
+                    # The partial file already has all of the content.
+                    return md5
+                with partial_path.open(mode) as partial:
+                    for chunk in response.iter_content(chunk_size=chunk_size):
+                        partial.write(chunk)
+                        md5.update(chunk)
+                        transferred += len(chunk)
+            return md5
+
+        md5 = retry(
+            stream_to_partial,
+            retry_on=(
+                requests.exceptions.ConnectionError,
+                requests.exceptions.ChunkedEncodingError,
+            ),
+        )
+        try:
+            desc.validate_md5_hexdigest(res.name, md5.hexdigest())
+        except ChecksumMismatchError:
+            partial_path.unlink()
+            raise
+        partial_path.replace(path)
+        return transferred
+
 
 class Datastore:
     """Handle connections and downloading of Zenodo Source archives."""
@@ -312,6 +414,7 @@ class Datastore:
         local_cache_path: Path | None = None,
         gcs_cache_path: str | None = None,
         timeout: float = 15.0,
+        local_cache_max_size: int | None = None,
     ):
         # TODO(rousik): figure out an efficient way to configure datastore caching
         """Datastore manages file retrieval for PUDL datasets.
@@ -324,13 +427,23 @@ class Datastore:
                 format: gs://bucket[/path_prefix]
             timeout: connection timeouts (in seconds) to use when connecting
                 to Zenodo servers.
+            local_cache_max_size: if provided, the maximum size (in bytes) of the
+                local cache. Least recently used resources are evicted to stay within
+                it, except for those belonging to the currently configured DOIs.
         """
         self._cache = resource_cache.LayeredCache()
         self._datapackage_descriptors: dict[str, DatapackageDescriptor] = {}
+        self._zenodo_fetcher = ZenodoFetcher(timeout=timeout)
 
         if local_cache_path:
             logger.info(f"Adding local cache layer at {local_cache_path}")
-            self._cache.add_cache_layer(resource_cache.LocalFileCache(local_cache_path))
+            self._cache.add_cache_layer(
+                resource_cache.LocalFileCache(
+                    local_cache_path,
+                    max_size=local_cache_max_size,
+                    protected_dois=[doi for _, doi in self._zenodo_fetcher.zenodo_dois],
+                )
+            )
         if gcs_cache_path:
             try:
                 logger.info(f"Adding GCS cache layer at {gcs_cache_path}")
@@ -343,8 +456,6 @@ class Datastore:
                     f"Falling back to Zenodo if necessary. Error was: {e}"
                 )
 
-        self._zenodo_fetcher = ZenodoFetcher(timeout=timeout)
-
     def get_known_datasets(self) -> list[str]:
         """Returns list of supported datasets."""
         return self._zenodo_fetcher.get_known_datasets()
@@ -404,6 +515,50 @@ class Datastore:
                 self._cache.add(res, contents)
                 yield (res, contents)
 
+    def prefetch_resource(self, res: PudlResourceKey) -> int:
+        """Make sure a resource is optimally cached, streaming it to disk if possible.
+
+        If the closest writable cache layer is a :class:`LocalFileCache`, resources that
+        aren't in any cache layer yet are streamed from Zenodo straight into it,
+        without being held in memory. Otherwise the resource is retrieved and added to
+        the cache as in :meth:`get_resources`.
+
+        Returns:
+            The number of bytes that had to be retrieved.
+        """
+        if self._cache.is_optimally_cached(res):
+            logger.info(f"{res} is already optimally cached.")
+            return 0
+        local_cache = self._cache.get_optimal_layer()
+        if isinstance(local_cache, resource_cache.LocalFileCache) and not (
+            self._cache.contains(res)
+        ):
+            size = self._zenodo_fetcher.fetch_to_file(
+                res,
+                local_cache.get_path(res),
+                desc=self.get_datapackage_descriptor(res.dataset),
+            )
+            local_cache.enforce_max_size(keep=res)
+        else:
+            contents = (
+                self._cache.get(res)
+                if self._cache.contains(res)
+                else self._zenodo_fetcher.get_resource(res)
+            )
+            self._cache.add(res, contents)
+            size = len(contents)
+        logger.info(f"Prefetched {res} ({size} bytes).")
+        return size
+
+    def get_cache_stats(self) -> dict[str, resource_cache.CacheStats]:
+        """Returns the usage counters of each cache layer, e.g. hits and bytes read."""
+        return self._cache.get_stats()
+
+    def log_cache_stats(self) -> None:
+        """Log a summary of how each of the cache layers has been used."""
+        for layer, stats in self.get_cache_stats().items():
+            logger.info(f"Cache layer {layer}: {stats.summary()}")
+
     def remove_from_cache(self, res: PudlResourceKey) -> None:
         """Remove given resource from the associated cache."""
         self._cache.delete(res)
@@ -421,16 +576,55 @@ class Datastore:
             return content
         raise KeyError(f"Multiple resources found for {dataset}: {filters}")
 
+    def get_unique_resource_file(self, dataset: str, **filters: Any) -> BinaryIO:
+        """Returns a binary file object for the one resource that matches.
+
+        Unlike :meth:`get_unique_resource` this doesn't read the whole resource into
+        memory when it is already in the local file cache. Instead the cached file is
+        returned, and only the parts of it that are actually read get loaded. If the
+        resource isn't optimally cached yet it is first added to the cache, which is
+        also the only time its checksum is computed. The caller is responsible for
+        closing the returned file.
+        """
+        desc = self.get_datapackage_descriptor(dataset)
+        matches = list(desc.get_resources(**filters))
+        if not matches:
+            raise KeyError(f"No resources found for {dataset}: {filters}")
+        if len(matches) > 1:
+            raise KeyError(f"Multiple resources found for {dataset}: {filters}")
+        res = matches[0]
+        if not self._cache.is_optimally_cached(res):
+            if self._cache.contains(res):
+                logger.info(f"{res} was not optimally cached yet, adding.")
+                contents = self._cache.get(res)
+            else:
+                logger.info(f"Retrieved {res} from zenodo.")
+                contents = self._zenodo_fetcher.get_resource(res)
+            self._cache.add(res, contents)
+            # With no writable cache layers we can only serve the fetched content.
+            if not self._cache.contains(res):
+                return io.BytesIO(contents)
+        return self._cache.open(res)
+
     def get_zipfile_resource(self, dataset: str, **filters: Any) -> zipfile.ZipFile:
-        """Retrieves unique resource and opens it as a ZipFile."""
-        resource_bytes = self.get_unique_resource(dataset, **filters)
-        resource = io.BytesIO(resource_bytes)
-        md5sum = hashlib.file_digest(resource, "md5").hexdigest()
+        """Retrieves unique resource and opens it as a ZipFile.
+
+        The archive is opened lazily from :meth:`get_unique_resource_file`, so only
+        the central directory and the members that are actually read are loaded.
+        """
+        resource_file = self.get_unique_resource_file(dataset, **filters)
+        resource_file.seek(0, io.SEEK_END)
+        size = resource_file.tell()
+        resource_file.seek(0)
         logger.info(
-            f"Got resource {dataset=}, {filters=}, {md5sum=}, "
-            f"{len(resource_bytes)} bytes; turning into ZipFile"
+            f"Got resource {dataset=}, {filters=}, {size} bytes; turning into ZipFile"
         )
-        return retry(zipfile.ZipFile, retry_on=(zipfile.BadZipFile), file=resource)
+        # ZipFile only closes files that it opened itself, so for files in the local
+        # cache we hand it the path instead of the already open file object.
+        if isinstance(getattr(resource_file, "name", None), str):
+            resource_file.close()
+            resource_file = resource_file.name
+        return retry(zipfile.ZipFile, retry_on=(zipfile.BadZipFile), file=resource_file)
 
     def get_zipfile_resources(
         self, dataset: str, **filters: Any
@@ -512,6 +706,45 @@ def fetch_resources(
                 dstore._cache.add(res, contents)
 
 
+def prefetch_resources(
+    dstore: Datastore,
+    datasets: list[str],
+    partition: dict[str, int | str],
+    max_workers: int = 4,
+) -> None:
+    """Download all matching resources into the cache using a pool of threads.
+
+    Up to ``max_workers`` resources are downloaded at the same time. Each one is
+    streamed to disk and checksummed as it arrives (see
+    :meth:`ZenodoFetcher.fetch_to_file`) so a partially downloaded resource will be
+    resumed by the next prefetch. The total throughput is logged at the end.
+    """
+    # Load all of the descriptors up front, rather than from inside the threads. They
+    # are passed on to the fetcher, so it doesn't fetch them again from zenodo when
+    # they were read from the cache.
+    resources = [
+        res
+        for single_ds in datasets
+        for res in dstore.get_datapackage_descriptor(single_ds).get_resources(
+            **partition
+        )
+    ]
+    logger.info(
+        f"Prefetching {len(resources)} resources with up to {max_workers} workers."
+    )
+    start = time.monotonic()
+    total_bytes = 0
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(dstore.prefetch_resource, res) for res in resources]
+        for future in as_completed(futures):
+            total_bytes += future.result()
+    elapsed = time.monotonic() - start
+    logger.info(
+        f"Prefetched {total_bytes / 1e6:.1f} MB in {elapsed:.1f} seconds "
+        f"({total_bytes / 1e6 / max(elapsed, 1e-9):.1f} MB/s)."
+    )
+
+
 def _parse_key_values(
     ctx: click.core.Context,
     param: click.Option,
@@ -596,6 +829,32 @@ def _parse_key_values(
         "project to pay data egress costs."
     ),
 )
+@click.option(
+    "--prefetch",
+    is_flag=True,
+    default=False,
+    help=(
+        "Download many resources at once, streaming each one straight into the "
+        "local cache and resuming any interrupted downloads. Useful for populating "
+        "the local cache on a new machine."
+    ),
+)
+@click.option(
+    "--max-workers",
+    type=click.IntRange(min=1),
+    default=4,
+    show_default=True,
+    help="Maximum number of resources to download at once with --prefetch.",
+)
+@click.option(
+    "--max-cache-size-gb",
+    type=click.FloatRange(min=0, min_open=True),
+    default=None,
+    help=(
+        "Bound the size of the local cache, evicting the least recently used "
+        "resources that don't belong to the currently configured archives."
+    ),
+)
 @click.option(
     "--logfile",
     help="If specified, write logs to this file.",
@@ -619,6 +878,9 @@ def pudl_datastore(
     partition: dict[str, int | str],
     gcs_cache_path: str,
     bypass_local_cache: bool,
+    prefetch: bool,
+    max_workers: int,
+    max_cache_size_gb: float | None,
     logfile: pathlib.Path,
     loglevel: str,
 ):
@@ -643,6 +905,14 @@ def pudl_datastore(
     List the available partitions in the EIA-860 and EIA-923 datasets:
 
     pudl_datastore --dataset eia860 --dataset eia923 --list-partitions
+
+    Download all the raw EIA-860 and EIA-923 data, 8 resources at a time:
+
+    pudl_datastore --dataset eia860 --dataset eia923 --prefetch --max-workers 8
+
+    Download the raw EIA-860 data, keeping the local cache under 50 GB:
+
+    pudl_datastore --dataset eia860 --max-cache-size-gb 50
     """
     pudl.logging_helpers.configure_root_logger(logfile=logfile, loglevel=loglevel)
 
@@ -653,6 +923,9 @@ def pudl_datastore(
     dstore = Datastore(
         gcs_cache_path=gcs_cache_path,
         local_cache_path=cache_path,
+        local_cache_max_size=(
+            int(max_cache_size_gb * 1e9) if max_cache_size_gb is not None else None
+        ),
     )
 
     if partition:
@@ -662,6 +935,13 @@ def pudl_datastore(
         print_partitions(dstore, dataset)
     elif validate:
         validate_cache(dstore, dataset, partition)
+    elif prefetch:
+        prefetch_resources(
+            dstore=dstore,
+            datasets=dataset,
+            partition=partition,
+            max_workers=max_workers,
+        )
     else:
         fetch_resources(
             dstore=dstore,
@@ -670,6 +950,7 @@ def pudl_datastore(
             gcs_cache_path=gcs_cache_path,
             bypass_local_cache=bypass_local_cache,
         )
+    dstore.log_cache_stats()
 
     return 0
 
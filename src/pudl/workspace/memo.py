@@ -0,0 +1,80 @@
+"""On-disk memos of expensive intermediate results, kept in the local datastore cache.
+
+Some steps of the ETL memoize results which are slow to compute and rarely change
+between runs, like the timezones of plant locations. The memos are stored as Parquet
+files under ``PUDL_INPUT/_cache/<memo name>/``, alongside the cached raw inputs, so
+that they are counted (and evicted when least recently used) by the size limit of
+the :class:`pudl.workspace.resource_cache.LocalFileCache`.
+
+Memos are only ever an optimization: a memo which is missing, unreadable or can't be
+written is logged and otherwise ignored.
+"""
+
+import contextlib
+import os
+import uuid
+from pathlib import Path
+
+import pandas as pd
+
+import pudl.logging_helpers
+from pudl.workspace.setup import PudlPaths
+
+logger = pudl.logging_helpers.get_logger(__name__)
+
+
+def memo_path(name: str, filename: str) -> Path:
+    """Location of a memo file in the local datastore cache.
+
+    Args:
+        name: name of the memo, which is the directory its files are kept in.
+        filename: name of the file, e.g. including the versions of the packages
+            whose results are memoized.
+    """
+    return PudlPaths().input_dir / "_cache" / name / filename
+
+
+def read_memo(path: Path | None) -> pd.DataFrame | None:
+    """Read a memo, or return None if there isn't a readable one.
+
+    Reading a memo marks it as recently used, so it is evicted from the local
+    datastore cache after memos and resources which haven't been used for longer.
+    """
+    if path is None or not path.exists():
+        return None
+    try:
+        memo = pd.read_parquet(path)
+    except Exception as err:  # noqa: BLE001
+        logger.warning(f"Ignoring unreadable memo {path}: {err}")
+        return None
+    try:
+        os.utime(path)
+    except OSError as err:
+        logger.debug(f"Unable to update the access time of {path}: {err}")
+    return memo
+
+
+def write_memo(df: pd.DataFrame, path: Path | None) -> bool:
+    """Write a memo, if possible.
+
+    The memo is written to a uniquely named partial file which then replaces the
+    memo, so concurrent runs never read or write a partially written memo. Partial
+    files are also never evicted from the local datastore cache.
+
+    Returns:
+        Whether the memo was written. Errors, e.g. from a read-only input directory,
+        are logged as warnings rather than raised.
+    """
+    if path is None:
+        return False
+    tmp_path = path.with_name(f"{path.name}.{uuid.uuid4().hex}.partial")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        df.to_parquet(tmp_path)
+        tmp_path.replace(path)
+    except OSError as err:
+        logger.warning(f"Unable to write memo {path}: {err}")
+        with contextlib.suppress(OSError):
+            tmp_path.unlink(missing_ok=True)
+        return False
+    return True
@@ -1,8 +1,15 @@
 """Implementations of datastore resource caches."""
 
+import dataclasses
+import io
+import os
+import threading
+import time
 from abc import ABC, abstractmethod
+from collections.abc import Iterable
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, NamedTuple
+from typing import Any, BinaryIO, NamedTuple
 from urllib.parse import urlparse
 
 import google.auth
@@ -36,6 +43,11 @@ gcs_retry = Retry(
 )
 
 
+def _doi_dirname(doi: str) -> str:
+    """Returns the name of the directory in which resources of a DOI are cached."""
+    return doi.replace("/", "-")
+
+
 class PudlResourceKey(NamedTuple):
     """Uniquely identifies a specific resource."""
 
@@ -49,8 +61,37 @@ class PudlResourceKey(NamedTuple):
 
     def get_local_path(self) -> Path:
         """Returns (relative) path that should be used when caching this resource."""
-        doi_dirname = self.doi.replace("/", "-")
-        return Path(self.dataset) / doi_dirname / self.name
+        return Path(self.dataset) / _doi_dirname(self.doi) / self.name
+
+
+@dataclass
+class CacheStats:
+    """Usage counters for a single caching layer.
+
+    Hits and misses are only counted when content is requested from the layer (via
+    ``get`` or ``open``), while ``seconds`` accumulates the time spent in all calls
+    to the layer, including ``contains`` and ``add``.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    bytes_read: int = 0
+    bytes_written: int = 0
+    seconds: float = 0.0
+
+    @property
+    def hit_ratio(self) -> float:
+        """Fraction of the content requests that were served by this layer."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def summary(self) -> str:
+        """Returns a short human readable description of the counters."""
+        return (
+            f"{self.hits} hits, {self.misses} misses ({self.hit_ratio:.0%} hit ratio), "
+            f"{self.bytes_read / 1e6:.1f} MB read, "
+            f"{self.bytes_written / 1e6:.1f} MB written, {self.seconds:.2f} seconds"
+        )
 
 
 class AbstractCache(ABC):
@@ -68,6 +109,14 @@ class AbstractCache(ABC):
     def get(self, resource: PudlResourceKey) -> bytes:
         """Retrieves content of given resource or throws KeyError."""
 
+    def open(self, resource: PudlResourceKey) -> BinaryIO:
+        """Returns a seekable, readable binary file object for the given resource.
+
+        By default this wraps the output of :meth:`get`, but caches that can provide
+        the content without reading all of it into memory should override this.
+        """
+        return io.BytesIO(self.get(resource))
+
     @abstractmethod
     def add(self, resource: PudlResourceKey, content: bytes) -> None:
         """Adds resource to the cache and sets the content."""
@@ -82,21 +131,75 @@ class AbstractCache(ABC):
 
 
 class LocalFileCache(AbstractCache):
-    """Simple key-value store mapping PudlResourceKeys to ByteIO contents."""
+    """Simple key-value store mapping PudlResourceKeys to ByteIO contents.
+
+    Optionally the total size of the cache can be bounded. When ``max_size`` is set,
+    reading a resource marks it as recently used (by updating its modification time)
+    and adding a resource evicts the least recently used resources until the cache
+    fits within ``max_size`` again. Resources that belong to one of the
+    ``protected_dois`` (usually the DOIs of the currently configured archives) are
+    never evicted, so the cache may still exceed ``max_size`` if they alone are
+    larger than it.
+    """
+
+    def __init__(
+        self,
+        cache_root_dir: Path,
+        max_size: int | None = None,
+        protected_dois: Iterable[str] = (),
+        **kwargs: Any,
+    ):
+        """Constructs LocalFileCache that stores resources under cache_root_dir.
 
-    def __init__(self, cache_root_dir: Path, **kwargs: Any):
-        """Constructs LocalFileCache that stores resources under cache_root_dir."""
+        Args:
+            cache_root_dir: directory where the resources are stored.
+            max_size: if provided, the maximum total size (in bytes) of the cached
+                resources.
+            protected_dois: DOIs of the archives whose resources must never be
+                evicted.
+        """
         super().__init__(**kwargs)
-        self.cache_root_dir = cache_root_dir
+        self.cache_root_dir = Path(cache_root_dir)
+        self.max_size = max_size
+        self._protected_dirnames = {_doi_dirname(doi) for doi in protected_dois}
+        self._evict_lock = threading.Lock()
 
     def _resource_path(self, resource: PudlResourceKey) -> Path:
         return self.cache_root_dir / resource.get_local_path()
 
+    def get_path(self, resource: PudlResourceKey) -> Path:
+        """Returns the path where the given resource is (or would be) cached."""
+        return self._resource_path(resource)
+
+    def _mark_used(self, path: Path) -> None:
+        """Record that the file was just used, for least-recently-used eviction."""
+        if self.max_size is None or self.is_read_only():
+            return
+        try:
+            os.utime(path)
+        except OSError as err:
+            logger.debug(f"Unable to update the access time of {path}: {err}")
+
     def get(self, resource: PudlResourceKey) -> bytes:
         """Retrieves value associated with a given resource."""
-        with self._resource_path(resource).open("rb") as res:
+        path = self._resource_path(resource)
+        with path.open("rb") as res:
             logger.debug(f"Getting {resource} from local file cache.")
-            return res.read()
+            content = res.read()
+        self._mark_used(path)
+        return content
+
+    def open(self, resource: PudlResourceKey) -> BinaryIO:
+        """Returns the cached file associated with a resource, opened for reading.
+
+        The content is read from disk lazily, so even very large archives can be
+        opened (e.g. as a :class:`zipfile.ZipFile`) without holding the whole file in
+        memory. The caller is responsible for closing the returned file.
+        """
+        logger.debug(f"Opening {resource} from local file cache.")
+        path = self._resource_path(resource)
+        self._mark_used(path)
+        return path.open("rb")
 
     def add(self, resource: PudlResourceKey, content: bytes):
         """Adds (or updates) resource to the cache with given value."""
@@ -108,6 +211,51 @@ class LocalFileCache(AbstractCache):
         path.parent.mkdir(parents=True, exist_ok=True)
         with path.open("wb") as file:
             file.write(content)
+        self.enforce_max_size(keep=resource)
+
+    def enforce_max_size(self, keep: PudlResourceKey | None = None) -> int:
+        """Evict least recently used resources until the cache fits in max_size.
+
+        Only files laid out like cached resources (``dataset/doi/name``) are
+        considered. Resources from protected DOIs, the ``keep`` resource and
+        partially downloaded files are never evicted.
+
+        Args:
+            keep: a resource which must not be evicted, e.g. the one just added.
+
+        Returns:
+            The number of bytes that were evicted.
+        """
+        if self.max_size is None or self.is_read_only():
+            return 0
+        # Resources may be added from several threads at once, e.g. when prefetching.
+        with self._evict_lock:
+            keep_path = self._resource_path(keep) if keep is not None else None
+            total_size = 0
+            candidates = []
+            for path in self.cache_root_dir.glob("*/*/*"):
+                if not path.is_file() or path.suffix == ".partial":
+                    continue
+                stat = path.stat()
+                total_size += stat.st_size
+                if path.parent.name in self._protected_dirnames or path == keep_path:
+                    continue
+                candidates.append((stat.st_mtime, stat.st_size, path))
+            evicted = 0
+            for _, size, path in sorted(candidates):
+                if total_size - evicted <= self.max_size:
+                    break
+                logger.info(
+                    f"Evicting {path} ({size} bytes) from the local file cache."
+                )
+                path.unlink(missing_ok=True)
+                evicted += size
+            if total_size - evicted > self.max_size:
+                logger.warning(
+                    f"Local file cache holds {total_size - evicted} bytes which exceeds "
+                    f"max_size={self.max_size}, but the rest can't be evicted."
+                )
+            return evicted
 
     def delete(self, resource: PudlResourceKey):
         """Deletes resource from the cache."""
@@ -187,6 +335,8 @@ class LayeredCache(AbstractCache):
         """
         super().__init__(**kwargs)
         self._caches: list[AbstractCache] = list(caches)
+        self._stats: list[CacheStats] = [CacheStats() for _ in self._caches]
+        self._stats_lock = threading.Lock()
 
     def add_cache_layer(self, cache: AbstractCache):
         """Adds caching layer.
@@ -194,6 +344,37 @@ class LayeredCache(AbstractCache):
         The priority is below all other.
         """
         self._caches.append(cache)
+        self._stats.append(CacheStats())
+
+    def _record(self, layer: int, start: float, **counts: int) -> None:
+        """Add the elapsed time since start and the given counts to a layer's stats."""
+        elapsed = time.monotonic() - start
+        with self._stats_lock:
+            stats = self._stats[layer]
+            stats.seconds += elapsed
+            for name, count in counts.items():
+                setattr(stats, name, getattr(stats, name) + count)
+
+    def _layer_contains(self, layer: int, resource: PudlResourceKey) -> bool:
+        """Returns True if the given layer contains the resource, timing the call."""
+        start = time.monotonic()
+        found = self._caches[layer].contains(resource)
+        self._record(layer, start)
+        return found
+
+    def get_stats(self) -> dict[str, CacheStats]:
+        """Returns a snapshot of the usage counters for each of the caching layers.
+
+        The keys identify the layers by their position and class name, e.g.
+        ``0:LocalFileCache``.
+        """
+        with self._stats_lock:
+            return {
+                f"{i}:{cache.__class__.__name__}": dataclasses.replace(stats)
+                for i, (cache, stats) in enumerate(
+                    zip(self._caches, self._stats, strict=True)
+                )
+            }
 
     def num_layers(self):
         """Returns number of caching layers that are in this LayeredCache."""
@@ -202,24 +383,48 @@ class LayeredCache(AbstractCache):
     def get(self, resource: PudlResourceKey) -> bytes:
         """Returns content of a given resource."""
         for i, cache in enumerate(self._caches):
-            if cache.contains(resource):
+            if self._layer_contains(i, resource):
                 logger.debug(
                     f"get:{resource} found in {i}-th layer ({cache.__class__.__name__})."
                 )
-                return cache.get(resource)
+                start = time.monotonic()
+                content = cache.get(resource)
+                self._record(i, start, hits=1, bytes_read=len(content))
+                return content
+            self._record(i, time.monotonic(), misses=1)
         logger.debug(f"get:{resource} not found in the layered cache.")
         raise KeyError(f"{resource} not found in the layered cache")
 
+    def open(self, resource: PudlResourceKey) -> BinaryIO:
+        """Returns a binary file object for a resource from the first layer with it."""
+        for i, cache in enumerate(self._caches):
+            if self._layer_contains(i, resource):
+                logger.debug(
+                    f"open:{resource} found in {i}-th layer ({cache.__class__.__name__})."
+                )
+                start = time.monotonic()
+                file = cache.open(resource)
+                # Count the full size of the opened resource as served by this layer.
+                size = file.seek(0, io.SEEK_END)
+                file.seek(0)
+                self._record(i, start, hits=1, bytes_read=size)
+                return file
+            self._record(i, time.monotonic(), misses=1)
+        logger.debug(f"open:{resource} not found in the layered cache.")
+        raise KeyError(f"{resource} not found in the layered cache")
+
     def add(self, resource: PudlResourceKey, value):
         """Adds (or replaces) resource into the cache with given value."""
         if self.is_read_only():
             logger.debug(f"Read only cache: ignoring set({resource})")
             return
-        for cache_layer in self._caches:
+        for i, cache_layer in enumerate(self._caches):
             if cache_layer.is_read_only():
                 continue
             logger.debug(f"Adding {resource} to cache {cache_layer.__class__.__name__}")
+            start = time.monotonic()
             cache_layer.add(resource, value)
+            self._record(i, start, bytes_written=len(value))
             logger.debug(
                 f"Added {resource} to cache layer {cache_layer.__class__.__name__})"
             )
@@ -239,7 +444,7 @@ class LayeredCache(AbstractCache):
     def contains(self, resource: PudlResourceKey) -> bool:
         """Returns True if resource is present in the cache."""
         for i, cache in enumerate(self._caches):
-            if cache.contains(resource):
+            if self._layer_contains(i, resource):
                 logger.debug(
                     f"contains: {resource} found in {i}-th layer ({cache.__class__.__name__})."
                 )
@@ -247,13 +452,22 @@ class LayeredCache(AbstractCache):
         logger.debug(f"contains: {resource} not found in layered cache.")
         return False
 
+    def get_optimal_layer(self) -> AbstractCache | None:
+        """Return the closest write-enabled layer, if there is one."""
+        if self.is_read_only():
+            return None
+        for cache_layer in self._caches:
+            if not cache_layer.is_read_only():
+                return cache_layer
+        return None
+
     def is_optimally_cached(self, resource: PudlResourceKey) -> bool:
         """Return True if resource is contained in the closest write-enabled layer."""
-        for cache_layer in self._caches:
+        for i, cache_layer in enumerate(self._caches):
             if cache_layer.is_read_only():
                 continue
             logger.debug(
                 f"{resource} optimally cached in {cache_layer.__class__.__name__}"
             )
-            return cache_layer.contains(resource)
+            return self._layer_contains(i, resource)
         return False
@@ -0,0 +1,39 @@
+"""Unit tests for the EIA-FERC1 record linkage helpers."""
+
+import jellyfish
+import pandas as pd
+
+from pudl.analysis.record_linkage import eia_ferc1_record_linkage
+
+
+def test_get_metaphones_encodes_unique_names_with_memo(tmp_path, mocker):
+    """Metaphones match row-wise encoding, and memoized names aren't re-encoded."""
+    names = pd.Series(
+        ["big bend", None, "crystal river", "big bend", "gaston", "crystal river"],
+        index=[5, 3, 8, 1, 2, 9],
+    )
+    expected = pd.Series(
+        [None if name is None else jellyfish.metaphone(name) for name in names],
+        index=names.index,
+        dtype=object,
+    )
+    more_names = pd.Series(["gaston", "barry", None])
+    more_expected = [jellyfish.metaphone("gaston"), jellyfish.metaphone("barry"), None]
+    memo_path = tmp_path / "metaphones.parquet"
+    metaphone = mocker.spy(eia_ferc1_record_linkage.jellyfish, "metaphone")
+
+    result = eia_ferc1_record_linkage.get_metaphones(names, memo_path=memo_path)
+    pd.testing.assert_series_equal(result, expected)
+    assert metaphone.call_count == 3
+    assert memo_path.exists()
+
+    result = eia_ferc1_record_linkage.get_metaphones(more_names, memo_path=memo_path)
+    assert result.tolist() == more_expected
+    # Only the new name is encoded
+    assert metaphone.call_count == 4
+
+    # A memo that can't be written doesn't stop the names from being encoded.
+    result = eia_ferc1_record_linkage.get_metaphones(
+        more_names, memo_path=memo_path / "unwritable.parquet"
+    )
+    assert result.tolist() == more_expected
@@ -0,0 +1,109 @@
+"""Tests for the cross year record linkage model."""
+
+import numpy as np
+import pandas as pd
+import pytest
+import scipy.sparse
+from numba.typed import List
+
+from pudl.analysis.ml_tools.experiment_tracking import (
+    ExperimentTracker,
+    ExperimentTrackerConfig,
+)
+from pudl.analysis.record_linkage.link_cross_year import (
+    DBSCANConfig,
+    DistanceMatrix,
+    MatchOrphanedRecordsConfig,
+    PenalizeReportYearDistanceConfig,
+    SplitClustersConfig,
+    cluster_records_dbscan,
+    match_orphaned_records,
+    split_clusters,
+)
+
+
+@pytest.fixture(params=[0.1, 0.25], ids=["clean", "orphans"])
+def plant_records(request):
+    """Noisy copies of a set of plants reported across several years.
+
+    With more noise, many records are orphaned by DBSCAN and have to be matched by
+    :func:`match_orphaned_records`.
+    """
+    rng = np.random.default_rng(7)
+    n_plants, years = 40, range(2010, 2016)
+    centers = rng.uniform(0, 10, size=(n_plants, 4))
+    features = np.vstack(
+        [centers + rng.normal(0, request.param, size=centers.shape) for _ in years]
+    )
+    # Add an exact duplicate record to check zero distances are kept
+    features[1] = features[0]
+    original_df = pd.DataFrame({"report_year": np.repeat(list(years), n_plants)})
+    return features, original_df
+
+
+@pytest.mark.parametrize("feature_format", ["dense", "csr"])
+def test_sparse_distance_matrix_matches_dense(plant_records, feature_format):
+    """The sparse mode should produce the same labels as the dense distance matrix."""
+    features, original_df = plant_records
+    if feature_format == "csr":
+        features = scipy.sparse.csr_matrix(features)
+    tracker = ExperimentTracker(
+        tracker_config=ExperimentTrackerConfig(),
+        run_id="test",
+        experiment_name="test",
+    )
+
+    def _run(sparse: bool) -> tuple[DistanceMatrix, pd.DataFrame]:
+        distance_matrix = DistanceMatrix(
+            features,
+            original_df,
+            PenalizeReportYearDistanceConfig(sparse=sparse),
+        )
+        id_year_df = cluster_records_dbscan(
+            DBSCANConfig(eps=0.5), distance_matrix, original_df, tracker
+        )
+        id_year_df = split_clusters(
+            SplitClustersConfig(distance_threshold=0.5),
+            distance_matrix,
+            id_year_df,
+            tracker,
+        )
+        id_year_df = match_orphaned_records(
+            MatchOrphanedRecordsConfig(distance_threshold=0.5),
+            distance_matrix,
+            id_year_df,
+            tracker,
+        )
+        return distance_matrix, id_year_df
+
+    dense, dense_labels = _run(sparse=False)
+    sparse, sparse_labels = _run(sparse=True)
+    assert sparse.distance_matrix is None
+
+    dense_graph = dense.radius_neighbors_graph(0.5)
+    sparse_graph = sparse.radius_neighbors_graph(0.5)
+    assert (dense_graph != sparse_graph).nnz == 0
+    assert dense_graph.nnz == sparse_graph.nnz
+
+    cluster_inds = np.array([0, 1, 40, 80, 81])
+    np.testing.assert_allclose(
+        sparse.cluster_distance_matrix(cluster_inds),
+        dense.cluster_distance_matrix(cluster_inds),
+        rtol=1e-6,
+    )
+    cluster_groups = [np.array([0, 1]), np.array([40]), np.array([2, 42, 82])]
+    np.testing.assert_allclose(
+        sparse.average_distance_matrix(cluster_groups),
+        dense.average_distance_matrix(List([List(g) for g in cluster_groups])),
+        rtol=1e-6,
+    )
+
+    # Sparse mode matches orphans one linked component at a time, so the labels are
+    # numbered differently, but the records must be grouped the same way.
+    pd.testing.assert_series_equal(
+        sparse_labels["report_year"], dense_labels["report_year"]
+    )
+    np.testing.assert_array_equal(
+        pd.factorize(sparse_labels["record_label"])[0],
+        pd.factorize(dense_labels["record_label"])[0],
+    )
@@ -2,6 +2,7 @@
 
 from importlib import resources
 
+import numpy as np
 import pandas as pd
 
 import pudl
@@ -153,6 +154,90 @@ def test_plant_gen_ag():
     pd.testing.assert_frame_equal(plant_gen_ag_out, plant_gen_ag_expected)
 
 
+def test_add_record_id():
+    """Test that record ids are built once per distinct id and mapped to records."""
+    part_df = pd.DataFrame(
+        {
+            "plant_id_eia": [1, 1, 1, 1],
+            "generator_id": ["a", "b", "a", "a"],
+            "report_date": ["2020-01-01", "2020-01-01", "2021-01-01", "2020-01-01"],
+            "plant_part": "plant_gen",
+            "ownership_record_type": ["total", "total", "total", "total"],
+            "utility_id_eia": [111, 111, 111, 111],
+            "operational_status_pudl": [
+                "operating",
+                "retired",
+                "operating",
+                "operating",
+            ],
+        }
+    ).astype({"report_date": "datetime64[s]"})
+    out = pudl.analysis.plant_parts_eia.add_record_id(
+        part_df, id_cols=["plant_id_eia", "generator_id"]
+    ).pipe(
+        pudl.analysis.plant_parts_eia.add_record_id,
+        id_cols=["plant_id_eia", "generator_id"],
+        year=False,
+    )
+    expected = part_df.assign(
+        record_id_eia=pd.array(
+            [
+                "1_a_2020_plant_gen_total_111",
+                "1_b_2020_plant_gen_total_111_retired",
+                "1_a_2021_plant_gen_total_111",
+                "1_a_2020_plant_gen_total_111",
+            ],
+            dtype="string",
+        ),
+        plant_part_id_eia=pd.array(
+            [
+                "1_a_plant_gen_total_111",
+                "1_b_plant_gen_total_111_retired",
+                "1_a_plant_gen_total_111",
+                "1_a_plant_gen_total_111",
+            ],
+            dtype="string",
+        ),
+    )
+    pd.testing.assert_frame_equal(out, expected)
+
+
+def test_get_combo_codes():
+    """Test that groups with the same combination of members get the same code."""
+    groups = np.array([0, 0, 1, 1, 2, 3, 3, 4, 9, 7, 9, 7, 7])
+    members = np.array([5, 6, 6, 5, 5, 5, 5, 6, -1, 6, 5, 5, -1])
+    combos = pudl.analysis.plant_parts_eia.get_combo_codes(groups, members)
+    np.testing.assert_array_equal(combos, [0, 0, 0, 0, 1, 2, 2, 3, 4, 5, 4, 5, 5])
+
+
+def test_add_consistent_attributes():
+    """Test that only attributes which are consistent within a plant part are added."""
+    gens_mega = GENS_MEGA.assign(
+        plant_id_eia=[1, 1, 2, 2],
+        unit_id_pudl=pd.array([1, 1, 1, None], dtype="Int64"),
+        technology_description=["coal", "coal", "gas", "gas"],
+        generator_operating_year=pd.array([1990, 2000, 2010, 2010], dtype="Int64"),
+    )
+    part_df = pd.DataFrame(
+        {
+            "plant_id_eia": [1, 2, 3],
+            "report_date": "2020-01-01",
+            "operational_status_pudl": "operating",
+            "capacity_mw": [450.0, 200.0, 10.0],
+        }
+    ).astype({"report_date": "datetime64[s]"})
+    out = pudl.analysis.plant_parts_eia.AddConsistentAttributes(
+        ["unit_id_pudl", "technology_description", "generator_operating_year"],
+        part_name="plant",
+    ).execute(part_df, gens_mega)
+    expected = part_df.assign(
+        unit_id_pudl=pd.array([1, None, None], dtype="Int64"),
+        technology_description=["coal", "gas", None],
+        generator_operating_year=pd.array([None, 2010, None], dtype="Int64"),
+    )
+    pd.testing.assert_frame_equal(out, expected)
+
+
 def test_make_mega_gen_tbl():
     """Test the creation of the mega generator table.
 
@@ -411,6 +496,35 @@ def test_scale_by_ownership():
     pd.testing.assert_frame_equal(out_ex1, out)
 
 
+def test_match_rows_to_single_plant_part():
+    """Test matching records of any granularity to the rows of their generators."""
+    ppe = pd.DataFrame(
+        {
+            "report_date": pd.to_datetime(["2020-01-01"] * 6 + ["2020-12-31"]),
+            "plant_id_eia": [3] * 7,
+            "plant_part": ["plant_gen"] * 3 + ["plant"] + ["plant_unit"] * 3,
+            "generator_id": ["1", "2", "3", None, None, None, None],
+            "unit_id_pudl": [1, 2, 2, None, 2, 5, 1],
+            "ferc1_generator_agg_id": [None] * 7,
+            "operational_status_pudl": ["operating"] * 7,
+            "utility_id_eia": [1] * 7,
+            "ownership_record_type": ["total"] * 7,
+            "prime_mover_code": [None] * 7,
+            "technology_description": [None] * 7,
+            "energy_source_code_1": [None] * 7,
+            "ferc_acct_name": [None] * 7,
+            "generator_operating_year": [None] * 7,
+        }
+    )
+    record_rows, gen_rows = (
+        pudl.analysis.plant_parts_eia.match_rows_to_single_plant_part(ppe, ppe)
+    )
+    # records are matched by plant part, unit 5 has no generators and the unit 1
+    # record reported at the end of the year is matched by its year
+    np.testing.assert_array_equal(record_rows, [3, 3, 3, 4, 4, 5, 6, 0, 1, 2])
+    np.testing.assert_array_equal(gen_rows, [0, 1, 2, 1, 2, -1, 0, 0, 1, 2])
+
+
 def test_label_true_grans():
     """Test the labeling of true granularities in the plant part list."""
     plant_part_list_input = pd.DataFrame(
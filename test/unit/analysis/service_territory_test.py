@@ -0,0 +1,82 @@
+"""Tests for compiling utility and balancing authority service territories."""
+
+import geopandas as gpd
+import pandas as pd
+import pytest
+from geopandas.testing import assert_geodataframe_equal
+from shapely.geometry import box
+
+import pudl.analysis.service_territory as service_territory
+
+
+@pytest.fixture
+def census_gdf() -> gpd.GeoDataFrame:
+    """A 3x3 grid of square counties."""
+    return gpd.GeoDataFrame(
+        {
+            "geoid10": [f"{i:05d}" for i in range(9)],
+            "namelsad10": [f"County {i}" for i in range(9)],
+            "dp0010001": [100 * (i + 1) for i in range(9)],
+        },
+        geometry=[box(i % 3, i // 3, i % 3 + 1, i // 3 + 1) for i in range(9)],
+        crs="EPSG:4326",
+    )
+
+
+@pytest.fixture
+def territory_fips() -> pd.DataFrame:
+    """Counties of utilities which share or keep the same set of counties."""
+    counties = {
+        (2020, 1): ["00000", "00001", "00004"],
+        (2021, 1): ["00004", "00000", "00001"],
+        (2020, 2): ["00001", "00004", "00000", "00000"],
+        (2021, 2): ["00008"],
+        (2020, 3): ["00002", "00006"],
+    }
+    return pd.DataFrame(
+        [
+            {
+                "report_date": pd.Timestamp(f"{year}-01-01"),
+                "utility_id_eia": utility_id_eia,
+                "state": "XX",
+                "county": f"County {int(fips)}",
+                "state_id_fips": "00",
+                "county_id_fips": fips,
+            }
+            for (year, utility_id_eia), fips_codes in counties.items()
+            for fips in fips_codes
+        ]
+    )
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_dissolve_county_sets(census_gdf, territory_fips, max_workers, mocker):
+    """Test that each distinct county set is dissolved once, as GeoPandas would."""
+    by = ["report_date", "utility_id_eia"]
+    gdf = service_territory.add_geometries(territory_fips, census_gdf).drop_duplicates(
+        subset=by + ["county_id_fips"]
+    )
+    expected = gdf.dissolve(by=by).geometry
+    spy = mocker.spy(service_territory, "_dissolve_counties")
+    result = service_territory.dissolve_county_sets(gdf, by=by, max_workers=max_workers)
+    assert_geodataframe_equal(result.to_frame(), expected.to_frame())
+    assert spy.call_count == (3 if max_workers == 1 else 0)
+
+
+def test_add_geometries_dissolve(census_gdf, territory_fips):
+    """Test that dissolved geometries keep the summed county attributes."""
+    result = service_territory.add_geometries(
+        territory_fips,
+        census_gdf,
+        dissolve=True,
+        dissolve_by=["report_date", "utility_id_eia"],
+    )
+    assert list(result.columns) == [
+        "report_date",
+        "utility_id_eia",
+        "geometry",
+        "population",
+        "area_km2",
+    ]
+    assert result.population.tolist() == [800, 800, 1000, 800, 900]
+    assert result.geometry.area.tolist() == [3.0, 3.0, 2.0, 3.0, 1.0]
@@ -1,5 +1,6 @@
 """Tests for timeseries anomalies detection and imputation."""
 
+import itertools
 import logging
 import re
 
@@ -15,6 +16,7 @@ from pudl.analysis.spatial import (
     check_gdf,
     dissolve,
     explode,
+    intersecting_pairs,
     overlay,
     polygonize,
     self_union,
@@ -184,6 +186,44 @@ def test_self_union():
     assert_geodataframe_equal(result_two, expected_two)
 
 
+def test_self_union_ignores_enclosed_gaps():
+    """Test that gaps enclosed by features are not part of the self union."""
+    gdf = GeoDataFrame(
+        {
+            "geometry": GeoSeries(
+                [
+                    Polygon([(0, 0), (0, 3), (1, 3), (1, 0)]),
+                    Polygon([(0, 2), (0, 3), (3, 3), (3, 2)]),
+                    Polygon([(2, 0), (2, 3), (3, 3), (3, 0)]),
+                    Polygon([(0, 0), (0, 1), (3, 1), (3, 0)]),
+                ]
+            ),
+            "x": [0, 1, 2, 3],
+        }
+    )
+    result = self_union(gdf)
+    assert result.geometry.union_all().equals(gdf.geometry.union_all())
+    assert result.area.sum() == gdf.area.sum()
+    assert list(result.columns) == ["geometry", "x"]
+
+
+def test_intersecting_pairs():
+    """Test that only intersecting pairs are found, in combinations order."""
+    rng = np.random.default_rng(0)
+    centers = rng.uniform(0, 20, size=(50, 2))
+    geoms = GeoSeries(
+        [Polygon([(x, y), (x, y + 2), (x + 2, y + 2), (x + 2, y)]) for x, y in centers]
+    )
+    left, right = intersecting_pairs(geoms)
+    expected = [
+        (i, j)
+        for i, j in itertools.combinations(range(len(geoms)), 2)
+        if geoms[i].intersects(geoms[j])
+    ]
+    assert expected
+    assert list(zip(left, right, strict=True)) == expected
+
+
 def test_dissolve():
     """Test mergining of geometries and non-spatial attributes."""
     gdf = GeoDataFrame(
@@ -4,7 +4,10 @@ import numpy as np
 import pandas as pd
 import pytest
 
-from pudl.analysis.state_demand import lookup_state
+from pudl.analysis.state_demand import (
+    impute_ferc714_hourly_demand_matrix,
+    lookup_state,
+)
 
 AK_FIPS = {"name": "Alaska", "code": "AK", "fips": "02"}
 
@@ -34,3 +37,30 @@ AK_FIPS = {"name": "Alaska", "code": "AK", "fips": "02"}
 def test_lookup_state(state: str | int, expected: dict[str, str | int]) -> None:
     """Check that various kinds of state lookups work."""
     assert lookup_state(state) == expected
+
+
+def test_impute_ferc714_hourly_demand_matrix_parallel_is_deterministic():
+    """Imputation gives the same result regardless of the number of workers."""
+    rng = np.random.default_rng(2024)
+    index = pd.date_range("2020-01-01", "2021-12-31 23:00", freq="h", name="datetime")
+    hours = np.arange(len(index))
+    df = pd.DataFrame(
+        {
+            respondent: 100 * respondent
+            + 10 * np.sin(2 * np.pi * (hours + respondent) / 24)
+            + rng.normal(size=len(index))
+            for respondent in [1, 2, 3]
+        },
+        index=index,
+    )
+    df.columns.name = "respondent_id_ferc714"
+    df = df.mask(rng.random(df.shape) < 0.05)
+    kwargs = {"years": [2020, 2021], "seed": 7}
+    serial = impute_ferc714_hourly_demand_matrix(df, max_workers=1, **kwargs)
+    parallel = impute_ferc714_hourly_demand_matrix(df, max_workers=2, **kwargs)
+    pd.testing.assert_frame_equal(serial, parallel)
+    assert serial.notnull().all().all()
+    # Warm starting from a previous result still fills all of the null values
+    warm = impute_ferc714_hourly_demand_matrix(df, initial=serial, **kwargs)
+    assert warm.notnull().all().all()
+    pd.testing.assert_frame_equal(warm[df.notnull()], serial[df.notnull()])
@@ -1,6 +1,9 @@
 """Tests for timeseries anomalies detection and imputation."""
 
+import warnings
+
 import numpy as np
+import pandas as pd
 import pytest
 
 import pudl.analysis.timeseries_cleaning
@@ -107,3 +110,65 @@ def test_flags_and_imputes_anomalies(series_seed, anomalies_seed) -> None:
         fit = s.summarize_imputed(imputed, mask)
         # Mean MAPE (mean absolute percent error) is converging
         assert fit["mape"].mean() < fit0["mape"].mean()
+
+
+def test_impute_is_seeded_and_warm_starts() -> None:
+    """Seeded imputation is reproducible, and warm starts improve early iterations."""
+    s = pudl.analysis.timeseries_cleaning.Timeseries(simulate_series(seed=1234))
+    mask = np.random.default_rng(seed=5678).random(s.x.shape) < 0.1
+    for method in "tubal", "tnn":
+        kwargs = {"mask": mask, "method": method, "rho0": 1, "seed": 42}
+        imputed = s.impute(maxiter=10, **kwargs)
+        np.testing.assert_array_equal(imputed, s.impute(maxiter=10, **kwargs))
+        cold = s.impute(maxiter=1, **kwargs)
+        warm = s.impute(maxiter=1, initial=imputed, **kwargs)
+        fit_cold = s.summarize_imputed(cold, mask)
+        fit_warm = s.summarize_imputed(warm, mask)
+        assert fit_warm["mape"].mean() < fit_cold["mape"].mean()
+
+
+@pytest.mark.parametrize("svd", list(pudl.analysis.timeseries_cleaning.SVD_KERNELS))
+@pytest.mark.parametrize("shape", [(20, 300), (300, 20), (60, 80)])
+def test_svd_kernels_match_exact_thresholding(svd, shape) -> None:
+    """Low-rank SVD kernels give the same singular value thresholding as a full SVD."""
+    rng = np.random.default_rng(seed=1)
+    matrix = rng.random((shape[0], 5)) @ rng.random((5, shape[1]))
+    matrix += 0.01 * rng.random(shape)
+    tau = np.linalg.svd(matrix, compute_uv=False)[3]
+    np.testing.assert_allclose(
+        pudl.analysis.timeseries_cleaning._svt_tnn(matrix, tau, theta=1, svd=svd),
+        pudl.analysis.timeseries_cleaning._svt_tnn(matrix, tau, theta=1),
+        atol=1e-8,
+    )
+    tensor = rng.random((10, 12, 6))
+    phi = np.linalg.qr(rng.random((6, 6)))[0]
+    np.testing.assert_allclose(
+        pudl.analysis.timeseries_cleaning._tsvt(tensor, phi, tau=0.5, svd=svd),
+        pudl.analysis.timeseries_cleaning._tsvt(tensor, phi, tau=0.5),
+        atol=1e-8,
+    )
+
+
+@pytest.mark.parametrize("window", [1, 4, 5, 48, 1000])
+def test_rolling_kernels_match_pandas(window) -> None:
+    """Array-native rolling kernels exactly reproduce pandas and numpy results."""
+    rng = np.random.default_rng(seed=window)
+    x = simulate_series(n=4, periods=10, seed=window)
+    x[rng.random(x.shape) < 0.1] = np.nan
+    x[50:150, 0] = np.nan
+    x[:, 1] = np.round(x[:, 1], 1)
+    rolling = pd.DataFrame(x).rolling(window, min_periods=1, center=True)
+    median, q3, q1 = pudl.analysis.timeseries_cleaning._rolling_quantiles(
+        x, window, np.array([0.5, 0.75, 0.25])
+    )
+    np.testing.assert_array_equal(median, rolling.median().to_numpy())
+    np.testing.assert_array_equal(q3, rolling.quantile(0.75).to_numpy())
+    np.testing.assert_array_equal(q1, rolling.quantile(0.25).to_numpy())
+    shifts = np.arange(-window, window + 1, 3)
+    shifted = np.stack([pd.DataFrame(x).shift(shift).to_numpy() for shift in shifts])
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", category=RuntimeWarning)
+        expected = np.nanmedian(shifted, axis=0)
+    np.testing.assert_array_equal(
+        pudl.analysis.timeseries_cleaning._median_of_shifts(x, shifts), expected
+    )
@@ -0,0 +1,55 @@
+"""Unit tests for the pudl.etl.epacems_assets module."""
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from pudl.etl.epacems_assets import YearPartitions, _iter_year_state_tables
+
+
+@pytest.mark.parametrize("prefetch", [False, True])
+def test_iter_year_state_tables(tmp_path, prefetch):
+    """Quarters are read once and re-grouped into year-state tables in order."""
+    schema = pa.schema(
+        [
+            pa.field("state", pa.dictionary(pa.int32(), pa.string())),
+            pa.field("year", pa.int32()),
+            pa.field("gross_load_mw", pa.float32()),
+        ]
+    )
+    quarters = {
+        "2022q1": (["ME", "ID", "ME", "XX"], 2022, [1.0, 2.0, 3.0, 4.0]),
+        "2022q2": (["ID", "ME"], 2022, [5.0, 6.0]),
+        "2023q1": (["ID", "ID"], 2023, [7.0, 8.0]),
+    }
+    for year_quarter, (states, year, load) in quarters.items():
+        pq.write_table(
+            pa.table(
+                {
+                    "state": pa.array(states).dictionary_encode(),
+                    "year": pa.array([year] * len(states), pa.int32()),
+                    "gross_load_mw": pa.array(load, pa.float32()),
+                },
+                schema=schema,
+            ),
+            tmp_path / f"epacems-{year_quarter}.parquet",
+        )
+    partitions = [
+        YearPartitions({"2022q2", "2022q1"}),
+        YearPartitions({"2023q1"}),
+    ]
+
+    tables = list(
+        _iter_year_state_tables(
+            tmp_path, partitions, schema, states=["ID", "ME"], prefetch=prefetch
+        )
+    )
+
+    assert [
+        (t["state"].to_pylist(), t["gross_load_mw"].to_pylist()) for t in tables
+    ] == [
+        (["ID", "ID"], [2.0, 5.0]),
+        (["ME", "ME", "ME"], [1.0, 3.0, 6.0]),
+        (["ID", "ID"], [7.0, 8.0]),
+        ([], []),
+    ]
@@ -1,5 +1,6 @@
 """Test Dagster IO Managers."""
 
+import datetime
 from pathlib import Path
 
 import alembic.config
@@ -16,6 +17,7 @@ from pudl.etl.check_foreign_keys import (
 )
 from pudl.io_managers import (
     FercXBRLSQLiteIOManager,
+    PudlParquetIOManager,
     PudlSQLiteIOManager,
     SQLiteIOManager,
 )
@@ -454,3 +456,132 @@ def test_report_year_fixing_duration():
 def test_report_year_fixing_bad_values(df, match):
     with pytest.raises(ValueError, match=match):
         FercXBRLSQLiteIOManager.refine_report_year(df, xbrl_years=[2021, 2022])
+
+
+@pytest.fixture
+def bulk_load_test_pkg() -> Package:
+    """Create a test metadata package with one column of each field type."""
+    fields = [
+        {"name": "id", "type": "integer", "description": "id"},
+        {"name": "name", "type": "string", "description": "name"},
+        {"name": "value", "type": "number", "description": "value"},
+        {"name": "flag", "type": "boolean", "description": "flag"},
+        {"name": "report_date", "type": "date", "description": "report_date"},
+        {"name": "timestamp", "type": "datetime", "description": "timestamp"},
+        {
+            "name": "kind",
+            "type": "string",
+            "constraints": {"enum": ["a", "b"]},
+            "description": "kind",
+        },
+    ]
+    schema = {"fields": fields, "primary_key": ["id"]}
+    return Package(
+        name="bulk",
+        resources=[Resource(name="thing", schema=schema, description="Thing")],
+    )
+
+
+def test_bulk_load_matches_to_sql(tmp_path, bulk_load_test_pkg):
+    """The bulk loading path stores exactly the same values as to_sql."""
+    df = pd.DataFrame(
+        {
+            "id": [1, 2, 3],
+            "name": ["x", None, "z"],
+            "value": [1.5, float("nan"), -3.0],
+            "flag": [True, None, False],
+            "report_date": pd.to_datetime(["2020-01-01", None, "2022-12-31"]),
+            "timestamp": pd.to_datetime(
+                ["2020-01-01 01:02:03.000", "2021-06-30 23:59:59.500", None]
+            ),
+            "kind": ["a", "b", None],
+        }
+    )
+    md = bulk_load_test_pkg.to_sql()
+    dumps = {}
+    for bulk_load in [False, True]:
+        db_dir = tmp_path / str(bulk_load)
+        db_dir.mkdir()
+        md.create_all(sa.create_engine(f"sqlite:///{db_dir / 'bulk.sqlite'}"))
+        manager = PudlSQLiteIOManager(
+            base_dir=db_dir,
+            db_name="bulk",
+            package=bulk_load_test_pkg,
+            bulk_load=bulk_load,
+        )
+        output_context = build_output_context(asset_key=AssetKey("thing"))
+        # Writing twice makes sure the old records are replaced.
+        manager.handle_output(output_context, df.iloc[:1])
+        manager.handle_output(output_context, df)
+        with manager.engine.connect() as con:
+            columns = ", ".join(f"{c}, typeof({c})" for c in df.columns)
+            dumps[bulk_load] = con.execute(
+                sa.text(f"SELECT {columns} FROM thing ORDER BY id")  # noqa: S608
+            ).all()
+            pragmas = {
+                p: con.execute(sa.text(f"PRAGMA {p}")).scalar()
+                for p in ["journal_mode", "synchronous", "cache_size"]
+            }
+        assert pragmas == {
+            "journal_mode": "delete",
+            "synchronous": 2,
+            "cache_size": -2000,
+        }
+        check_foreign_keys(manager.engine)
+    assert len(dumps[True]) == 3
+    assert dumps[True] == dumps[False]
+
+
+@pytest.mark.parametrize(
+    "table_name",
+    [
+        "core_eia861__yearly_service_territory",
+        "core_eia861__yearly_non_net_metering_misc",
+    ],
+)
+def test_parquet_trusted_and_pushdown_reads(table_name):
+    """Trusted and column/row filtered reads give the same data as a full read."""
+    res = Resource.from_id(table_name)
+    df = res.format_df(
+        pd.DataFrame(
+            {
+                "report_date": pd.to_datetime(
+                    ["2020-01-01", "2021-01-01", "2022-01-01"]
+                ),
+                "state": ["CA", "CO", "CO"],
+                "utility_id_eia": [1, 2, 3],
+                "county_id_fips": ["08001", "06001", "08005"],
+                "short_form": [True, None, False],
+                "pv_current_flow_type": ["AC", None, "DC"],
+                "backup_capacity_mw": [1.0, None, 3.5],
+                "generators_number": [None, 2, 3],
+            }
+        )
+    )
+    manager = PudlParquetIOManager()
+    manager.handle_output(build_output_context(asset_key=AssetKey(table_name)), df)
+
+    full = manager.load_input(build_input_context(asset_key=AssetKey(table_name)))
+    trusted = PudlParquetIOManager(trusted_read=True).load_input(
+        build_input_context(asset_key=AssetKey(table_name))
+    )
+    pd.testing.assert_frame_equal(full, trusted)
+
+    filtered = manager.load_input(
+        build_input_context(
+            asset_key=AssetKey(table_name),
+            definition_metadata={
+                "columns": ["report_date", "state", "utility_id_eia"],
+                "filters": [
+                    ("report_date", ">=", datetime.date(2020, 6, 1)),
+                    ("state", "in", ["CO"]),
+                ],
+            },
+        )
+    )
+    expected = full.loc[
+        (full.report_date >= "2020-06-01") & (full.state == "CO"),
+        ["report_date", "state", "utility_id_eia"],
+    ].reset_index(drop=True)
+    assert len(expected) == 2
+    pd.testing.assert_frame_equal(filtered, expected)
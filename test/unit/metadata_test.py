@@ -62,6 +62,26 @@ def test_pyarrow_schemas(resource_name: str):
     _ = PUDL_RESOURCES[resource_name].to_pyarrow()
 
 
+def test_resource_metadata_is_cached():
+    """Resources and their schemas are built once, and match freshly built ones."""
+    resource_id = "core_eia861__assn_utility"
+    resource = Resource.from_id(resource_id)
+    fresh = Resource(**Resource.dict_from_id(resource_id))
+    assert Resource.from_id(resource_id) is resource
+    assert resource == fresh
+    assert resource.to_pyarrow() is resource.to_pyarrow()
+    assert resource.to_pyarrow().equals(fresh.to_pyarrow(), check_metadata=True)
+    assert resource.to_sql() is resource.to_sql()
+    assert resource.to_sql(check_types=False) is not resource.to_sql()
+    dtypes = resource.to_pandas_dtypes()
+    assert dtypes == fresh.to_pandas_dtypes()
+    dtypes["state"] = "string"
+    assert resource.to_pandas_dtypes() == fresh.to_pandas_dtypes()
+    assert resource.to_pandas_dtypes(compact=True) == fresh.to_pandas_dtypes(
+        compact=True
+    )
+
+
 @pytest.mark.parametrize("encoder_name", sorted(PUDL_ENCODERS.keys()))
 def test_encoders(encoder_name: SnakeCase):
     """Verify that Encoders work on the kinds of values they're supposed to."""
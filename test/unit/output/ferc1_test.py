@@ -8,13 +8,13 @@ Stuff we could test:
 - does it identify stepparent nodes correctly?
 - does it identify stepchild nodes correctly?
 - pruning of passthrough nodes & associated corrections
-- propagation of weights
-- conflicting weights
 - conflicting tags
 - validation of calculations using only leaf-nodes to reproduce root node values
 
 Stuff we are testing:
 - propagation of tags
+- propagation of weights
+- conflicting weights
 
 """
 
@@ -30,6 +30,8 @@ from pudl.helpers import dedupe_n_flatten_list_of_lists
 from pudl.output.ferc1 import (
     NodeId,
     XbrlCalculationForestFerc1,
+    _leafy_meta,
+    _LeafyMetaKey,
     disaggregate_null_or_total_tag,
     get_core_ferc1_asset_description,
 )
@@ -367,6 +369,73 @@ class TestTagPropagation(TestForestSetup):
         ]:
             assert annotated_tags[post_yes_node]["in_rate_base"] == "yes"
 
+    def test_leafy_meta_weights_and_tags(self):
+        edges = [
+            (self.parent, self.child1),
+            (self.parent, self.child2),
+            (self.child1, self.grand_child11),
+            (self.child1, self.grand_child12),
+        ]
+        tags = pd.DataFrame([self.parent, self.grand_child12]).assign(
+            in_rate_base=["yes", pd.NA],
+            rate_base_category=[pd.NA, "other_plant"],
+        )
+        forest = XbrlCalculationForestFerc1(
+            exploded_calcs=self._exploded_calcs_from_edges(edges).assign(
+                weight=[1, -1, 1, -1]
+            ),
+            seeds=[self.parent],
+            tags=tags,
+        )
+        leafy_meta = forest.leafy_meta.set_index("xbrl_factoid")
+        assert set(leafy_meta.index) == {
+            "reported_1_2",
+            "reported_1_1_1",
+            "reported_1_1_2",
+        }
+        assert (leafy_meta["xbrl_factoid_root"] == "reported_1").all()
+        assert leafy_meta["weight"].to_dict() == {
+            "reported_1_2": -1,
+            "reported_1_1_1": 1,
+            "reported_1_1_2": -1,
+        }
+        assert (leafy_meta["tags_in_rate_base"] == "yes").all()
+        assert leafy_meta.loc["reported_1_1_2", "tags_rate_base_category"] == (
+            "other_plant"
+        )
+
+    def test_leafy_meta_cache(self):
+        edges = [(self.parent, self.child1), (self.parent, self.child2)]
+        forests = [
+            self.build_forest(
+                edges, pd.DataFrame(columns=list(NodeId._fields)).convert_dtypes()
+            )
+            for _ in range(2)
+        ]
+        _leafy_meta.cache_clear()
+        pd.testing.assert_frame_equal(forests[0].leafy_meta, forests[1].leafy_meta)
+        # The second forest has the same content, so its leafy metadata is reused.
+        assert _leafy_meta.cache_info().hits == 1
+        assert _leafy_meta.cache_info().maxsize is not None
+
+        graph = forests[0].annotated_forest
+        calc_cols = forests[0].calc_cols
+        assert _LeafyMetaKey(graph, calc_cols) == _LeafyMetaKey(graph.copy(), calc_cols)
+        assert _LeafyMetaKey(graph, calc_cols) != _LeafyMetaKey(graph, calc_cols[:-1])
+
+    def test_leafy_meta_conflicting_path_weights(self):
+        forest = self.build_forest(
+            [(self.parent, self.child1)],
+            pd.DataFrame(columns=list(NodeId._fields)).convert_dtypes(),
+        )
+        graph = nx.DiGraph()
+        graph.add_edge(self.parent, self.child1, weight=1)
+        graph.add_edge(self.parent, self.child2, weight=1)
+        graph.add_edge(self.child1, self.grand_child11, weight=1)
+        graph.add_edge(self.child2, self.grand_child11, weight=-1)
+        with pytest.raises(ValueError, match="different weights"):
+            forest._compile_leafy_meta(graph, forest.calc_cols)
+
 
 def test_get_core_ferc1_asset_description():
     valid_core_ferc1_asset_name = "core_ferc1__yearly_income_statements_sched114"
@@ -0,0 +1,81 @@
+"""Unit tests for reading tables through the deprecated PudlTabl class."""
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+import sqlalchemy as sa
+
+from pudl.metadata.classes import Resource
+from pudl.output.pudltabl import PudlTabl
+
+TABLE_NAME = "core_eia861__assn_utility"
+
+
+@pytest.fixture
+def assn_utility() -> pd.DataFrame:
+    """A small table with one record per state and year."""
+    return Resource.from_id(TABLE_NAME).enforce_schema(
+        pd.DataFrame(
+            {
+                "report_date": pd.to_datetime(
+                    [f"{year}-01-01" for year in range(2015, 2023) for _ in range(2)]
+                ),
+                "utility_id_eia": [1, 2] * 8,
+                "state": ["CO", "ID"] * 8,
+            }
+        )
+    )
+
+
+@pytest.fixture
+def pudl_engine(tmp_path, assn_utility) -> sa.Engine:
+    """A PUDL DB containing only the example table."""
+    engine = sa.create_engine(f"sqlite:///{tmp_path / 'pudl.sqlite'}")
+    md = sa.MetaData()
+    Resource.from_id(TABLE_NAME).to_sql(md, check_types=False, check_values=False)
+    md.create_all(engine)
+    assn_utility.assign(report_date=assn_utility.report_date.dt.date).to_sql(
+        TABLE_NAME, engine, if_exists="append", index=False
+    )
+    return engine
+
+
+def test_reads_between_dates_with_cached_metadata(pudl_engine, assn_utility):
+    """Tables are filtered by date, and their metadata is only built once."""
+    pudl_out = PudlTabl(pudl_engine, start_date="2017-01-01", end_date="2019-12-31")
+    df = pudl_out.core_eia861__assn_utility()
+    expected = assn_utility[assn_utility.report_date.dt.year.between(2017, 2019)]
+    pd.testing.assert_frame_equal(
+        df.reset_index(drop=True), expected.reset_index(drop=True)
+    )
+
+    select = pudl_out._select_between_dates(TABLE_NAME)
+    resource = pudl_out._get_resource(TABLE_NAME)
+    pudl_out.core_eia861__assn_utility()
+    assert pudl_out._select_between_dates(TABLE_NAME) is select
+    assert pudl_out._get_resource(TABLE_NAME) is resource
+    assert list(pudl_out._metadata.tables) == [TABLE_NAME]
+
+    with pytest.raises(ValueError, match="not found in the PUDL DB"):
+        pudl_out._select_between_dates("core_eia861__yearly_sales")
+
+
+def test_parquet_read_matches_db(tmp_path, pudl_engine, assn_utility):
+    """Reading from parquet gives the same result as reading from the DB."""
+    resource = Resource.from_id(TABLE_NAME)
+    schema = resource.to_pyarrow()
+    pq.write_table(
+        pa.Table.from_pandas(assn_utility, schema=schema, preserve_index=False),
+        tmp_path / f"{TABLE_NAME}.parquet",
+        row_group_size=4,
+    )
+    kwargs = {"start_date": "2017-06-01", "end_date": "2020-12-31"}
+    from_db = PudlTabl(pudl_engine, **kwargs).core_eia861__assn_utility()
+    from_parquet = PudlTabl(
+        pudl_engine, parquet_dir=tmp_path, **kwargs
+    ).core_eia861__assn_utility()
+    assert from_parquet.report_date.min() == pd.Timestamp("2018-01-01")
+    pd.testing.assert_frame_equal(
+        from_parquet.reset_index(drop=True), from_db.reset_index(drop=True)
+    )
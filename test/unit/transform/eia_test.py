@@ -0,0 +1,117 @@
+"""Unit tests for the shared EIA transform functions."""
+
+import numpy as np
+import pandas as pd
+
+from pudl.metadata.fields import get_pudl_dtypes
+from pudl.metadata.resources import ENTITIES
+from pudl.settings import EiaSettings
+from pudl.transform.eia import (
+    EiaEntity,
+    _add_timezone,
+    find_timezone,
+    harvest_entity_tables,
+)
+
+
+def test_add_timezone(tmp_path, mocker):
+    """Timezones are looked up once per location and memoized between runs."""
+    plants = pd.DataFrame(
+        {
+            "plant_id_eia": [1, 2, 3, 4, 5, 6],
+            "latitude": [39.74, 39.74, 40.71, np.nan, 200.0, np.nan],
+            "longitude": [-104.99, -104.99, -74.0, np.nan, -120.0, -80.0],
+            "state": ["CO", "CO", "NY", "CA", "OR", None],
+        }
+    )
+    expected = [
+        find_timezone(
+            lng=row.longitude, lat=row.latitude, state=row.state, strict=False
+        )
+        for row in plants.itertuples()
+    ]
+    assert expected[:5] == [
+        "America/Denver",
+        "America/Denver",
+        "America/New_York",
+        "America/Los_Angeles",
+        "America/Los_Angeles",
+    ]
+    memo_path = tmp_path / "timezones.parquet"
+
+    find = mocker.patch(
+        "pudl.transform.eia.find_timezone", side_effect=find_timezone, autospec=True
+    )
+    result = _add_timezone(plants.copy(), memo_path=memo_path)
+    assert result.timezone.tolist() == expected
+    assert find.call_count == 2
+    assert len(pd.read_parquet(memo_path)) == 2
+
+    # A second run only has to look up the new location.
+    plants.loc[5, ["latitude", "longitude"]] = [25.76, -80.19]
+    result = _add_timezone(plants.copy(), memo_path=memo_path)
+    assert find.call_count == 3
+    assert result.timezone.tolist() == expected[:5] + ["America/New_York"]
+    assert len(pd.read_parquet(memo_path)) == 3
+
+    # A memo that can't be written doesn't stop the timezones from being found.
+    result = _add_timezone(plants.copy(), memo_path=memo_path / "unwritable.parquet")
+    assert result.timezone.tolist() == expected[:5] + ["America/New_York"]
+
+
+def _fake_boiler_tables(n_boilers: int = 200, seed: int = 0) -> dict[str, pd.DataFrame]:
+    """Two overlapping tables of mostly consistent boiler attributes."""
+    rng = np.random.default_rng(seed)
+    dtypes = get_pudl_dtypes(group="eia")
+    cols = ENTITIES["boilers"]["static_cols"] + ENTITIES["boilers"]["annual_cols"]
+    ids = pd.DataFrame(
+        {
+            "plant_id_eia": rng.integers(1, 50, n_boilers),
+            "boiler_id": [f"B{i}" for i in range(n_boilers)],
+        }
+    )
+    years = pd.DataFrame({"report_date": pd.to_datetime(["2020-01-01", "2021-01-01"])})
+    base = ids.merge(years, how="cross")
+    for col in cols:
+        if col in ENTITIES["boilers"]["static_cols"]:
+            key = base.boiler_id.str[1:].astype(int)
+        else:
+            key = base.boiler_id.str[1:].astype(int) + base.report_date.dt.year
+        dtype = dtypes[col]
+        if dtype == "string":
+            values = "v" + (key % 7).astype(str)
+        elif dtype == "boolean":
+            values = key % 2 == 0
+        elif dtype.startswith("datetime"):
+            values = pd.to_datetime("2000-01-01") + pd.to_timedelta(key % 5, "D")
+        elif dtype == "Int64":
+            values = key % 5
+        else:
+            values = (key % 5) / 2
+        base[col] = pd.Series(values).astype(dtype)
+    tables = {}
+    for name in ["table_a", "table_b", "table_c"]:
+        df = base.copy()
+        # Make a few values inconsistent and others missing.
+        for col in cols:
+            noise = rng.random(len(df))
+            df.loc[noise < 0.02, col] = df[col].shift().loc[noise < 0.02]
+            df.loc[noise > 0.9, col] = pd.NA
+        tables[name] = df
+    return tables
+
+
+def test_harvest_entity_tables_single_pass_matches_debug():
+    """The single pass harvesting gives the same results as harvesting by column."""
+    clean_dfs = _fake_boiler_tables()
+    entity_df, annual_df, col_dfs = harvest_entity_tables(
+        EiaEntity.BOILERS, clean_dfs, EiaSettings(), debug=False
+    )
+    debug_entity_df, debug_annual_df, debug_col_dfs = harvest_entity_tables(
+        EiaEntity.BOILERS, clean_dfs, EiaSettings(), debug=True
+    )
+    assert col_dfs == {}
+    assert len(debug_col_dfs) > 0
+    assert entity_df.boiler_manufacturer.notna().any()
+    pd.testing.assert_frame_equal(entity_df, debug_entity_df)
+    pd.testing.assert_frame_equal(annual_df, debug_annual_df)
@@ -1,8 +1,10 @@
 """Unit tests for the pudl.transform.epacems module."""
 
 import pandas as pd
+import pyarrow as pa
 
 import pudl.transform.epacems as epacems
+from pudl.metadata.classes import Resource
 
 
 def test_harmonize_eia_epa_orispl():
@@ -38,3 +40,126 @@ def test_harmonize_eia_epa_orispl():
     )
     actual_df = epacems.harmonize_eia_epa_orispl(cems_test_df, crosswalk_test_df)
     pd.testing.assert_frame_equal(expected_df, actual_df, check_dtype=False)
+
+
+def test_transform_chunks_matches_transform():
+    """Transforming a quarter in chunks should match transforming it all at once."""
+    raw_df = pd.DataFrame(
+        {
+            "plant_id_epa": [2713, 2713, 3, 3, 10],
+            "emissions_unit_id_epa": ["01A", "01A", "01", "1", "2"],
+            "op_date": ["2023-01-01"] * 5,
+            "op_hour": [0, 1, 2, 3, 4],
+            "gross_load_mw": [100.0, 2500000.0, 50.0, 60.0, 70.0],
+            "year": [2023] * 5,
+        }
+    )
+    crosswalk_df = pd.DataFrame(
+        {
+            "plant_id_epa": [2713, 3, 10],
+            "plant_id_eia": [58697, 3, 10],
+            "emissions_unit_id_epa": ["01A", "1", "2"],
+        }
+    )
+    plants_df = pd.DataFrame(
+        {
+            "plant_id_eia": [58697, 3, 10],
+            "timezone": ["America/Denver", "America/Chicago", "America/New_York"],
+        }
+    )
+    expected = epacems.transform(raw_df, crosswalk_df, plants_df)
+    actual = pd.concat(
+        epacems.transform_chunks(
+            [raw_df.iloc[:2], raw_df.iloc[2:]], crosswalk_df, plants_df
+        ),
+        ignore_index=True,
+    )
+    pd.testing.assert_frame_equal(expected, actual)
+
+
+def test_transform_arrow_matches_transform():
+    """The Arrow-native transform should produce exactly the pandas output."""
+    raw_df = pd.DataFrame(
+        {
+            "state": ["ME", "ME", "ID", "ID", "XX"],
+            "plant_id_epa": [2713, 2713, 3, 3, 10],
+            "emissions_unit_id_epa": ["01A", "01A", "001", "1", "2"],
+            "op_date": pd.to_datetime(
+                ["2023-01-01", "2023-01-01", "2023-01-02", "2023-01-02", "2023-03-12"]
+            ),
+            "op_hour": [0, 1, 2, 3, 23],
+            "operating_time_hours": [1.0, 1.0, 0.5, None, 1.0],
+            "gross_load_mw": [100.0, 2500000.0, 50.0, None, 70.0],
+            "steam_load_1000_lbs": [None] * 5,
+            "so2_mass_lbs": [1.0, 2.0, 3.0, 4.0, 5.0],
+            "so2_mass_measurement_code": [
+                "Measured",
+                "Calculated",
+                "Measured",
+                None,
+                "Measured",
+            ],
+            "nox_mass_lbs": [1.0] * 5,
+            "nox_mass_measurement_code": ["Measured"] * 5,
+            "co2_mass_tons": [1.0] * 5,
+            "co2_mass_measurement_code": ["Measured"] * 5,
+            "heat_content_mmbtu": [1.0] * 5,
+            "year": [2023] * 5,
+        }
+    )
+    crosswalk_df = pd.DataFrame(
+        {
+            "plant_id_epa": [2713, 3, 10],
+            "plant_id_eia": [58697, 3, 10],
+            "emissions_unit_id_epa": ["01A", "1", "2"],
+        }
+    )
+    plants_df = pd.DataFrame(
+        {
+            "plant_id_eia": [58697, 3, 10],
+            "timezone": ["America/Denver", "America/Chicago", "America/New_York"],
+        }
+    )
+    schema = Resource.from_id("core_epacems__hourly_emissions").to_pyarrow()
+    expected = pa.Table.from_pandas(
+        epacems.transform(raw_df, crosswalk_df, plants_df),
+        schema=schema,
+        preserve_index=False,
+    )
+    raw_table = pa.Table.from_pandas(raw_df, preserve_index=False)
+    raw_table = raw_table.set_column(
+        raw_table.schema.get_field_index("op_date"),
+        "op_date",
+        raw_table["op_date"].cast(pa.date32()),
+    )
+    actual = pa.concat_tables(
+        epacems.transform_arrow(
+            [raw_table.slice(0, 2), raw_table.slice(2)], crosswalk_df, plants_df
+        )
+    )
+    assert actual.to_pylist() == expected.to_pylist()
+
+
+def test_arrow_plant_id_eia_with_null_unit_ids():
+    """Null unit IDs only match the crosswalk at the same plant, like the merge."""
+    raw_df = pd.DataFrame(
+        {
+            "plant_id_epa": [3, 10, 3, 4],
+            "emissions_unit_id_epa": ["1", None, None, "2"],
+        }
+    )
+    crosswalk_df = pd.DataFrame(
+        {
+            "plant_id_epa": [3, 4, 3],
+            "plant_id_eia": [3, 58697, 58697],
+            "emissions_unit_id_epa": ["1", None, None],
+        }
+    )
+    expected = epacems.harmonize_eia_epa_orispl(raw_df, crosswalk_df)
+    actual = epacems._arrow_plant_id_eia(
+        pa.array(raw_df.plant_id_epa),
+        pa.array(raw_df.emissions_unit_id_epa, type=pa.string()),
+        epacems._arrow_crosswalk(epacems._unique_crosswalk(crosswalk_df)),
+    )
+    assert actual.to_pylist() == [3, 10, 58697, 4]
+    assert actual.to_pylist() == expected.plant_id_eia.tolist()
@@ -26,9 +26,11 @@ from pudl.transform.ferc1 import (
     TableIdFerc1,
     UnstackBalancesToReportYearInstantXbrl,
     WideToTidy,
+    _grouped_sums,
     add_columns_with_uniform_values,
     assign_parent_dimensions,
     calculate_values_from_components,
+    check_calculation_metrics_by_group,
     drop_duplicate_rows_dbf,
     fill_dbf_to_xbrl_map,
     filter_for_freshest_data_xbrl,
@@ -610,6 +612,94 @@ def _ungrouped_all_errors_group_metric_check():
     )
 
 
+def test_check_calculation_metrics_by_group():
+    calculated_df = pd.DataFrame(
+        {
+            "table_name": "table_1",
+            "xbrl_factoid": ["f1", "f1", "f2", "f2"],
+            "utility_id_ferc1": 144,
+            "report_year": 2021,
+            "reported_value": [10.0, 10.0, np.nan, 0.0],
+            "calculated_value": [10.0, 8.0, 5.0, np.nan],
+            "abs_diff": [np.nan, 2.0, np.nan, np.nan],
+            "rel_diff": [np.nan, 0.2, np.nan, np.nan],
+            "row_type_xbrl": [
+                "calculated_value",
+                "calculated_value",
+                "reported_value",
+                "calculated_value",
+            ],
+        }
+    )
+    input_columns = list(calculated_df.columns)
+    metrics = check_calculation_metrics_by_group(
+        calculated_df,
+        GroupMetricChecks(
+            groups_to_check=["ungrouped", "xbrl_factoid"],
+            metrics_to_check=[
+                "error_frequency",
+                "null_calculated_value_frequency",
+                "null_reported_value_frequency",
+                "absolute_error_magnitude",
+            ],
+        ),
+    )
+    # The metrics shouldn't add any columns to the input dataframe
+    assert list(calculated_df.columns) == input_columns
+    expected = pd.DataFrame(
+        {
+            "error_frequency": [0.25, 0.5, 0.0],
+            "null_calculated_value_frequency": [1 / 3, 0.0, 1.0],
+            "absolute_error_magnitude": [2.0, 2.0, 0.0],
+            "null_reported_value_frequency": [0.25, 0.0, 0.5],
+        },
+        index=pd.MultiIndex.from_tuples(
+            [
+                ("ungrouped", "ungrouped", "ungrouped"),
+                ("xbrl_factoid", "table_1", "f1"),
+                ("xbrl_factoid", "table_1", "f2"),
+            ],
+            names=["group", "table_name", "group_value"],
+        ),
+    )
+    pd.testing.assert_frame_equal(metrics[expected.columns], expected)
+    assert metrics["is_error_error_frequency"].to_list() == [True, True, False]
+
+
+def test_grouped_sums():
+    rng = np.random.default_rng(0)
+    n = 10_000
+    table_name = pd.Series(
+        pd.Categorical(
+            rng.choice(["table_1", "table_2"], size=n),
+            categories=["table_1", "table_2", "unused"],
+        )
+    )
+    utility_id = pd.Series(rng.integers(0, 50, size=n), dtype="Int64")
+    utility_id[:10] = pd.NA
+    components = pd.DataFrame(
+        {
+            "records": 1.0,
+            "abs_diff": rng.lognormal(sigma=5, size=n),
+            "all_null": np.nan,
+        }
+    )
+    components.loc[::3, "abs_diff"] = np.nan
+    sums = _grouped_sums(components, by=[table_name, utility_id])
+
+    expected = (
+        components[utility_id.notna()]
+        .groupby([table_name, utility_id], observed=True)
+        .agg(lambda x: x.sum(min_count=1))
+    )
+    # Unobserved categories and null keys are dropped, and all-null groups are null.
+    assert sums.index.equals(expected.index)
+    assert sums["all_null"].isna().all()
+    assert sums["records"].sum() == n - 10
+    # Compensated grouped sums can differ from Series.sum() in the last few bits.
+    pd.testing.assert_frame_equal(sums, expected, check_exact=False, rtol=1e-12)
+
+
 def _sample_mutli_subdimension_reconciled_data(
     data,
     dimension_values=DIMENSION_VALUES,
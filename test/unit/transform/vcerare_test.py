@@ -0,0 +1,163 @@
+"""Unit tests for the VCE RARE transform and asset checks."""
+
+import duckdb
+import pandas as pd
+import pytest
+from dagster import Definitions, asset, define_asset_job
+
+from pudl.transform import vcerare
+from pudl.transform.vcerare import VCE_ASSET_CHECK_SPECS, _run_vce_checks
+
+
+def _vce_df() -> pd.DataFrame:
+    """A tiny, valid VCE RARE table: two counties, every hour of two years."""
+    dfs = []
+    for year in [2019, 2020]:
+        datetime_utc = pd.date_range(f"{year}-01-01", periods=8760, freq="h")
+        for county, fips in [("autauga", "01001"), ("lake_erie", None)]:
+            dfs.append(
+                pd.DataFrame(
+                    {
+                        "state": "alabama",
+                        "county_or_lake_name": county,
+                        "datetime_utc": datetime_utc,
+                        "report_year": year,
+                        "hour_of_year": range(1, 8761),
+                        "county_id_fips": fips,
+                        "latitude": 32.5,
+                        "longitude": -86.6,
+                        "capacity_factor_solar_pv": 0.5,
+                        "capacity_factor_onshore_wind": 0.5,
+                        "capacity_factor_offshore_wind": 0.5,
+                    }
+                )
+            )
+    return pd.concat(dfs, ignore_index=True)
+
+
+def _failures(df: pd.DataFrame, expected_length: int | None = None):
+    vce = duckdb.from_df(df)
+    results = _run_vce_checks(
+        vce, expected_length=len(df) if expected_length is None else expected_length
+    )
+    assert [r.check_name for r in results] == [
+        spec.name for spec in VCE_ASSET_CHECK_SPECS
+    ]
+    return {r.check_name: r for r in results if not r.passed}
+
+
+def test_vce_checks_pass():
+    assert _failures(_vce_df()) == {}
+
+
+def test_vce_checks_row_count():
+    failures = _failures(_vce_df(), expected_length=10)
+    assert list(failures) == ["check_rows"]
+    assert failures["check_rows"].description == "Table unexpected length"
+    metadata = {k: v.value for k, v in failures["check_rows"].metadata.items()}
+    assert metadata["table_length"] == 4 * 8760
+    assert metadata["expected_length"] == 10
+    assert metadata["rows_per_year"] == {"2019": 2 * 8760, "2020": 2 * 8760}
+
+
+@pytest.mark.parametrize(
+    "row,updates,check_name,description",
+    [
+        (
+            3,
+            {"latitude": None, "state": None},
+            "check_nulls",
+            "Found NULL values in columns state, latitude",
+        ),
+        (
+            3,
+            {"capacity_factor_solar_pv": 1.03},
+            "check_pv_capacity_factor_upper_bound",
+            "Found PV capacity factor values greater than 1.02",
+        ),
+        (
+            3,
+            {"capacity_factor_offshore_wind": 1.01},
+            "check_wind_capacity_factor_upper_bound",
+            "Found wind capacity factor values greater than 1.0 in column "
+            "capacity_factor_offshore_wind",
+        ),
+        (
+            3,
+            {"capacity_factor_solar_pv": -0.1, "capacity_factor_onshore_wind": -0.1},
+            "check_capacity_factor_lower_bound",
+            "Found capacity factor values less than 0 from column "
+            "capacity_factor_solar_pv, capacity_factor_onshore_wind",
+        ),
+        (
+            3,
+            {"county_or_lake_name": "bedford_city"},
+            "check_unexpected_counties",
+            "found records for bedford_city or clifton_forge_city that shouldn't exist",
+        ),
+        (
+            # Duplicate an hour in the second county-year with a FIPS code.
+            8760 * 2 + 5,
+            {"datetime_utc": pd.Timestamp("2020-01-01 04:00"), "hour_of_year": 5},
+            "check_duplicate_county_id_fips",
+            "Found duplicate county_id_fips values",
+        ),
+    ],
+)
+def test_vce_checks_fail(row, updates, check_name, description):
+    df = _vce_df()
+    for col, value in updates.items():
+        df.loc[row, col] = value
+    failures = _failures(df)
+    assert list(failures) == [check_name]
+    assert failures[check_name].description == description
+
+
+def test_vce_checks_hours():
+    df = _vce_df()
+    # Drop the last hour of 2020 and add one for Dec 31st, 2020 at midnight
+    df.loc[df.hour_of_year == 8760, "hour_of_year"] = 8759
+    df.loc[0, "datetime_utc"] = pd.Timestamp("2020-12-31")
+    failures = _failures(df)
+    assert list(failures) == [
+        "check_max_hour_of_year",
+        "check_unexpected_dates",
+        "check_hour_from_date",
+    ]
+    mismatched = failures["check_hour_from_date"].metadata["mismatched_hours"].value
+    assert len(mismatched) == 4 + 1
+
+
+def test_vce_checks_report_every_failure(tmp_path, mocker):
+    """All checks are reported when run by dagster, even after one has failed."""
+    df = _vce_df()
+    df.loc[3, "capacity_factor_solar_pv"] = 1.03
+    df.loc[4, "county_or_lake_name"] = "bedford_city"
+    parquet_path = tmp_path / "out_vcerare__hourly_available_capacity_factor.parquet"
+    df.to_parquet(parquet_path)
+    mocker.patch.object(vcerare, "_get_parquet_path", return_value=parquet_path)
+    mocker.patch.dict(vcerare.VCE_ROW_COUNTS, {"etl_fast": len(df)})
+
+    @asset(name="out_vcerare__hourly_available_capacity_factor")
+    def stub_vce_asset() -> None:
+        pass
+
+    defs = Definitions(
+        assets=[stub_vce_asset],
+        asset_checks=[vcerare.check_vcerare_hourly_available_capacity_factor],
+        jobs=[define_asset_job("etl_fast")],
+    )
+    result = defs.get_job_def("etl_fast").execute_in_process(raise_on_error=False)
+
+    assert not result.success
+    evaluations = {e.check_name: e for e in result.get_asset_check_evaluations()}
+    assert sorted(evaluations) == sorted(spec.name for spec in VCE_ASSET_CHECK_SPECS)
+    assert sorted(name for name, e in evaluations.items() if not e.passed) == [
+        "check_pv_capacity_factor_upper_bound",
+        "check_unexpected_counties",
+    ]
+    (failure,) = [event for event in result.all_events if event.is_step_failure]
+    assert failure.step_key == "check_vcerare_hourly_available_capacity_factor"
+    message = failure.step_failure_data.error.message
+    assert "2 VCE RARE asset checks failed" in message
+    assert "check_unexpected_counties" in message
@@ -0,0 +1,148 @@
+"""Unit tests for the weighted quantiles used in data validations."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import pudl.validate
+
+
+@pytest.fixture
+def fuel_df() -> pd.DataFrame:
+    """Weighted values with ties, nulls and infinities, over several years."""
+    rng = np.random.default_rng(seed=2024)
+    n = 2000
+    df = pd.DataFrame(
+        {
+            "report_date": pd.to_datetime(rng.integers(2015, 2020, n).astype(str)),
+            "fuel_mmbtu_per_unit": np.round(rng.lognormal(3, 0.5, n), 1),
+            "fuel_received_units": rng.integers(0, 100, n).astype(float),
+        }
+    )
+    df.loc[rng.random(n) < 0.05, "fuel_mmbtu_per_unit"] = np.nan
+    df.loc[rng.random(n) < 0.01, "fuel_received_units"] = np.inf
+    # No usable data in one of the years
+    df.loc[df.report_date.dt.year == 2017, "fuel_mmbtu_per_unit"] = np.nan
+    return df
+
+
+def test_weighted_quantiles_by_group(fuel_df):
+    """Grouped quantiles match the quantiles of each group calculated separately."""
+    quantiles = [0, 0.05, 0.5, 0.95, 1]
+    years = fuel_df.report_date.dt.year
+    result = pudl.validate.weighted_quantiles(
+        fuel_df.fuel_mmbtu_per_unit, fuel_df.fuel_received_units, quantiles, by=years
+    )
+    assert result.index.tolist() == years.unique().tolist()
+    for year in years.unique():
+        group = fuel_df[years == year]
+        expected = [
+            pudl.validate.weighted_quantile(
+                group.fuel_mmbtu_per_unit, group.fuel_received_units, q
+            )
+            for q in quantiles
+        ]
+        np.testing.assert_array_equal(result.loc[year], expected)
+    assert result.loc[2017].isna().all()
+    assert (
+        pudl.validate.historical_distribution(
+            fuel_df, "fuel_mmbtu_per_unit", "fuel_received_units", 0.5
+        )
+        == result[0.5].dropna().tolist()
+    )
+
+
+def _sort_values_weighted_quantile(
+    data: pd.Series, weights: pd.Series, quantile: float
+) -> float:
+    """The original single-quantile implementation, which sorted a dataframe."""
+    df = (
+        pd.DataFrame({"data": data, "weights": weights})
+        .replace([np.inf, -np.inf], np.nan)
+        .dropna()
+        .sort_values(by="data")
+    )
+    Sn = df.weights.cumsum()  # noqa: N806
+    if len(Sn) > 0:
+        Pn = (Sn - 0.5 * df.weights) / Sn.iloc[-1]  # noqa: N806
+        return np.interp(quantile, Pn, df.data)
+    return np.nan
+
+
+def test_weighted_quantiles_match_sort_values(fuel_df):
+    """Grouped quantiles match the original algorithm, including ties and zero weights."""
+    quantiles = [0, 0.01, 0.05, 0.25, 0.5, 0.75, 0.95, 0.99, 1]
+    # Rounded data has many ties, and about 1% of the weights are zero.
+    assert fuel_df.fuel_mmbtu_per_unit.duplicated().sum() > 1000
+    assert (fuel_df.fuel_received_units == 0).sum() > 10
+    fuel_df["plant_id"] = np.arange(len(fuel_df)) % 7
+    result = pudl.validate.weighted_quantiles(
+        fuel_df.fuel_mmbtu_per_unit,
+        fuel_df.fuel_received_units,
+        quantiles,
+        by=fuel_df.plant_id,
+    )
+    for plant_id, group in fuel_df.groupby("plant_id"):
+        expected = [
+            _sort_values_weighted_quantile(
+                group.fuel_mmbtu_per_unit, group.fuel_received_units, q
+            )
+            for q in quantiles
+        ]
+        np.testing.assert_array_equal(result.loc[plant_id], expected)
+
+
+def test_weighted_quantiles_known_values():
+    """Quantiles of small groups with ties and zero weights, calculated by hand."""
+    data = pd.Series([1.0, 2.0, 2.0, 3.0, 5.0, 4.0, 4.0, 6.0, 7.0])
+    weights = pd.Series([1.0, 1.0, 1.0, 1.0, 0.0, 1.0, 1.0, 2.0, 0.0])
+    by = pd.Series(["a", "a", "a", "a", "a", "b", "b", "b", "c"])
+    result = pudl.validate.weighted_quantiles(data, weights, [0, 0.25, 0.5, 1], by=by)
+    # a: sorted data 1, 2, 2, 3, 5 with weights 1, 1, 1, 1, 0 has midpoints
+    # 1/8, 3/8, 5/8, 7/8, 1, so the maximum is still 5 despite its zero weight. b: data
+    # 4, 4, 6 with weights 1, 1, 2 has midpoints 1/8, 3/8, 3/4. c has a single value.
+    np.testing.assert_array_equal(result.loc["a"], [1.0, 1.5, 2.0, 5.0])
+    np.testing.assert_array_equal(result.loc["b"], [4.0, 4.0, 14 / 3, 6.0])
+    np.testing.assert_array_equal(result.loc["c"], [7.0] * 4)
+
+
+def test_weighted_quantile_matches_sorted_interpolation():
+    """Weighted quantiles interpolate the weighted midpoints of the sorted data."""
+    data = pd.Series([3.0, 1.0, np.nan, 2.0, np.inf])
+    weights = pd.Series([1.0, 1.0, 1.0, 2.0, 1.0])
+    # Sorted finite data 1, 2, 3 with weights 1, 2, 1 has midpoints 1/8, 1/2, 7/8
+    assert pudl.validate.weighted_quantile(data, weights, 0.5) == 2.0
+    assert pudl.validate.weighted_quantile(data, weights, 0.125) == 1.0
+    assert pudl.validate.weighted_quantile(data, weights, 0.6875) == 2.5
+    assert np.isnan(pudl.validate.weighted_quantile(data[2:3], weights[2:3], 0.5))
+    with pytest.raises(ValueError, match="between 0 and 1"):
+        pudl.validate.weighted_quantiles(data, weights, [0.5, 1.5])
+
+
+def test_validation_cases_do_not_modify_inputs(fuel_df):
+    """Running validation cases without weights leaves the dataframe untouched."""
+    original = fuel_df.copy()
+    pudl.validate.vs_self(
+        fuel_df,
+        data_col="fuel_mmbtu_per_unit",
+        weight_col="",
+        query="fuel_received_units > 10",
+    )
+    pudl.validate.vs_bounds(
+        fuel_df,
+        data_col="fuel_mmbtu_per_unit",
+        weight_col="",
+        low_q=0.05,
+        low_bound=0.0,
+        hi_q=0.95,
+        hi_bound=1000.0,
+    )
+    pd.testing.assert_frame_equal(fuel_df, original)
+    with pytest.raises(ValueError, match="is above upper bound"):
+        pudl.validate.vs_bounds(
+            fuel_df,
+            data_col="fuel_mmbtu_per_unit",
+            weight_col="fuel_received_units",
+            hi_q=0.95,
+            hi_bound=1.0,
+        )
@@ -1,8 +1,11 @@
 """Unit tests for Datastore module."""
 
+import hashlib
+import http.server
 import io
 import json
 import re
+import threading
 import unittest
 import zipfile
 from typing import Any
@@ -340,7 +343,7 @@ class TestZenodoFetcher(unittest.TestCase):
 
 def test_get_zipfile_resource_failure(mocker):
     ds = datastore.Datastore()
-    ds.get_unique_resource = mocker.MagicMock(return_value=b"")
+    ds.get_unique_resource_file = mocker.MagicMock(return_value=io.BytesIO(b""))
     sleep_mock = mocker.MagicMock()
     with (
         mocker.patch("time.sleep", sleep_mock),
@@ -357,7 +360,7 @@ def test_get_zipfile_resource_eventual_success(mocker):
         a_zipfile.writestr("file_name", file_contents)
 
     ds = datastore.Datastore()
-    ds.get_unique_resource = mocker.MagicMock(return_value=b"")
+    ds.get_unique_resource_file = mocker.MagicMock(return_value=io.BytesIO(b""))
     with (
         mocker.patch("time.sleep"),
         mocker.patch(
@@ -415,4 +418,185 @@ def test_get_zipfile_resources_eventual_success(mocker):
                 assert test_file.read().decode(encoding="utf-8") == file_contents
 
 
+def test_get_zipfile_resource_from_local_cache(mocker, tmp_path):
+    """Zipfiles in the local cache are opened lazily without reading all the bytes."""
+    zipfile_bytes = io.BytesIO()
+    with zipfile.ZipFile(zipfile_bytes, "w") as a_zipfile:
+        a_zipfile.writestr("file_name", "aaa")
+    res = PudlResourceKey("test_dataset", "test_doi", "test.zip")
+
+    ds = datastore.Datastore(local_cache_path=tmp_path)
+    ds._cache.add(res, zipfile_bytes.getvalue())
+    ds.get_datapackage_descriptor = mocker.MagicMock(
+        return_value=_make_descriptor(
+            "test_dataset", "test_doi", _make_resource("test.zip")
+        )
+    )
+    cache_get = mocker.spy(ds._cache, "get")
+    fetch = mocker.patch.object(ds._zenodo_fetcher, "get_resource")
+
+    with (
+        ds.get_zipfile_resource("test_dataset") as observed_zipfile,
+        observed_zipfile.open("file_name") as test_file,
+    ):
+        assert test_file.read() == b"aaa"
+    cache_get.assert_not_called()
+    fetch.assert_not_called()
+
+
+class _ZenodoStandInHandler(http.server.BaseHTTPRequestHandler):
+    """Serves in-memory files over HTTP, honoring simple ``bytes=N-`` Range headers."""
+
+    files: dict[str, bytes] = {}
+    range_requests: list[str] = []
+    # Files whose next download is cut off halfway through, like a dropped connection.
+    truncated: set[str] = set()
+
+    def do_GET(self):  # noqa: N802
+        name = self.path.lstrip("/")
+        content = self.files[name]
+        byte_range = self.headers.get("Range")
+        if byte_range:
+            self.range_requests.append(byte_range)
+            start = int(byte_range.removeprefix("bytes=").rstrip("-"))
+            if start >= len(content):
+                self.send_response(416)
+                self.end_headers()
+                return
+            self.send_response(206)
+            content = content[start:]
+        else:
+            self.send_response(200)
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        if name in self.truncated:
+            self.truncated.discard(name)
+            self.close_connection = True
+            content = content[: len(content) // 2]
+        self.wfile.write(content)
+
+    def log_message(self, *args):
+        """Keep the test output quiet."""
+
+
+@pytest.fixture
+def zenodo_stand_in():
+    """Run a local HTTP server standing in for Zenodo's file downloads."""
+    _ZenodoStandInHandler.files = {
+        f"file{i}.zip": bytes(f"contents of file {i} ", "utf-8") * 10_000
+        for i in range(5)
+    }
+    _ZenodoStandInHandler.range_requests = []
+    _ZenodoStandInHandler.truncated = set()
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _ZenodoStandInHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}", _ZenodoStandInHandler
+    server.shutdown()
+    server.server_close()
+
+
+def _stand_in_datastore(
+    url: str, files: dict[str, bytes], cache_path
+) -> datastore.Datastore:
+    """Build a Datastore that fetches epacems resources from the local stand-in.
+
+    The datapackage descriptor is only in the local cache, as it would be after a
+    previous run, so the Zenodo fetcher hasn't loaded it.
+    """
+    doi = datastore.ZenodoDoiSettings().epacems
+    desc = datastore.DatapackageDescriptor(
+        {
+            "resources": [
+                {
+                    "name": name,
+                    "path": f"{url}/{name}",
+                    "hash": hashlib.md5(content).hexdigest(),  # noqa: S324
+                    "parts": {"part": name.removesuffix(".zip")},
+                }
+                for name, content in files.items()
+            ]
+        },
+        dataset="epacems",
+        doi=doi,
+    )
+    ds = datastore.Datastore(local_cache_path=cache_path)
+    ds._cache.add(
+        PudlResourceKey("epacems", doi, "datapackage.json"),
+        bytes(desc.get_json_string(), "utf-8"),
+    )
+    ds._zenodo_fetcher = MockableZenodoFetcher(descriptors={})
+    return ds
+
+
+def test_prefetch_resources(zenodo_stand_in, tmp_path, mocker):
+    """Prefetching downloads every matching resource into the local cache."""
+    url, handler = zenodo_stand_in
+    ds = _stand_in_datastore(url, handler.files, tmp_path)
+    # The descriptor from the cache is used, rather than fetched again in each thread.
+    mocker.patch.object(
+        ds._zenodo_fetcher,
+        "get_descriptor",
+        side_effect=AssertionError("descriptor fetched from zenodo"),
+    )
+
+    datastore.prefetch_resources(ds, ["epacems"], partition={}, max_workers=3)
+
+    for res, content in ds.get_resources("epacems", cached_only=True):
+        assert content == handler.files[res.name]
+    assert sorted(p.name for p in tmp_path.rglob("*.zip")) == sorted(handler.files)
+    assert not list(tmp_path.rglob("*.partial"))
+
+
+def test_prefetch_resumes_partial_download(zenodo_stand_in, tmp_path):
+    """An interrupted download is resumed from where it left off."""
+    url, handler = zenodo_stand_in
+    ds = _stand_in_datastore(url, handler.files, tmp_path)
+    res = PudlResourceKey("epacems", ds._zenodo_fetcher.get_doi("epacems"), "file1.zip")
+    content = handler.files["file1.zip"]
+    path = ds._cache.get_optimal_layer().get_path(res)
+    path.with_name("file1.zip.partial").write_bytes(content[:1000])
+
+    assert ds.prefetch_resource(res) == len(content) - 1000
+    assert handler.range_requests == ["bytes=1000-"]
+    assert path.read_bytes() == content
+    # Already optimally cached resources are skipped
+    assert ds.prefetch_resource(res) == 0
+
+
+def test_fetch_resumes_dropped_connection(zenodo_stand_in, tmp_path, mocker):
+    """A download which is cut off is retried from where it left off."""
+    url, handler = zenodo_stand_in
+    ds = _stand_in_datastore(url, handler.files, tmp_path)
+    res = PudlResourceKey("epacems", ds._zenodo_fetcher.get_doi("epacems"), "file3.zip")
+    content = handler.files["file3.zip"]
+    handler.truncated.add("file3.zip")
+    sleep = mocker.patch("time.sleep")
+
+    path = tmp_path / "file3.zip"
+    transferred = ds._zenodo_fetcher.fetch_to_file(
+        res,
+        path,
+        chunk_size=1000,
+        desc=ds.get_datapackage_descriptor("epacems"),
+    )
+    assert transferred == len(content)
+    assert handler.range_requests == [f"bytes={len(content) // 2}-"]
+    assert path.read_bytes() == content
+    sleep.assert_called_once()
+
+
+def test_prefetch_checksum_mismatch(zenodo_stand_in, tmp_path):
+    """A corrupted download is discarded rather than added to the cache."""
+    url, handler = zenodo_stand_in
+    ds = _stand_in_datastore(url, handler.files, tmp_path)
+    handler.files["file2.zip"] = b"corrupted"
+    res = PudlResourceKey("epacems", ds._zenodo_fetcher.get_doi("epacems"), "file2.zip")
+
+    with pytest.raises(datastore.ChecksumMismatchError):
+        ds.prefetch_resource(res)
+    assert not ds._cache.contains(res)
+    assert not list(tmp_path.rglob("*.partial"))
+
+
 # TODO(rousik): add unit tests for Datasource class as well
@@ -0,0 +1,43 @@
+"""Unit tests for the on-disk memos kept in the local datastore cache."""
+
+import os
+
+import pandas as pd
+
+from pudl.workspace import memo
+from pudl.workspace.resource_cache import LocalFileCache
+
+
+def test_memo_round_trip(tmp_path, monkeypatch):
+    """Memos are written atomically and counted by the local cache size limit."""
+    monkeypatch.setenv("PUDL_INPUT", str(tmp_path))
+    path = memo.memo_path("things", "things-v1.parquet")
+    assert path == tmp_path / "_cache" / "things" / "things-v1.parquet"
+    assert memo.read_memo(path) is None
+
+    df = pd.DataFrame({"thing": ["a", "b"], "value": [1, 2]})
+    assert memo.write_memo(df, path)
+    pd.testing.assert_frame_equal(memo.read_memo(path), df)
+    assert list(path.parent.iterdir()) == [path]
+
+    # The memo is the least recently used file, so it's evicted first.
+    os.utime(path, (1000, 1000))
+    size = path.stat().st_size
+    cache = LocalFileCache(tmp_path, max_size=1)
+    assert cache.enforce_max_size() == size
+    assert not path.exists()
+
+
+def test_memo_errors_are_ignored(tmp_path):
+    """Memos which can't be read or written are skipped, not raised."""
+    assert memo.read_memo(None) is None
+    assert not memo.write_memo(pd.DataFrame({"a": [1]}), None)
+
+    unreadable = tmp_path / "unreadable.parquet"
+    unreadable.write_bytes(b"not parquet")
+    assert memo.read_memo(unreadable) is None
+
+    # The memo directory can't be created where there is already a file.
+    unwritable = tmp_path / "unreadable.parquet" / "memo.parquet"
+    assert not memo.write_memo(pd.DataFrame({"a": [1]}), unwritable)
+    assert list(tmp_path.iterdir()) == [unreadable]
@@ -1,5 +1,6 @@
 """Unit tests for resource_cache."""
 
+import os
 import shutil
 import tempfile
 import unittest
@@ -49,6 +50,15 @@ class TestLocalFileCache(unittest.TestCase):
         self.assertTrue(self.cache.contains(res))
         self.assertEqual(b"blah", self.cache.get(res))
 
+    def test_open_resource(self):
+        """open() returns a seekable file object with the resource contents."""
+        res = PudlResourceKey("ds", "doi", "file.txt")
+        self.cache.add(res, b"blah")
+        with self.cache.open(res) as resource_file:
+            self.assertEqual(b"blah", resource_file.read())
+            resource_file.seek(2)
+            self.assertEqual(b"ah", resource_file.read())
+
     def test_that_two_cache_objects_share_storage(self):
         """Two LocalFileCache instances with the same path share the object storage."""
         second_cache = resource_cache.LocalFileCache(Path(self.test_dir))
@@ -87,6 +97,35 @@ class TestLocalFileCache(unittest.TestCase):
         ro_cache.delete(res)
         self.assertTrue(ro_cache.contains(res))
 
+    def test_max_size_evicts_least_recently_used(self):
+        """Adding past max_size evicts the least recently used unprotected resources."""
+        cache = resource_cache.LocalFileCache(
+            Path(self.test_dir), max_size=10, protected_dois=["10.5281/zenodo.1"]
+        )
+        protected = PudlResourceKey("ds", "10.5281/zenodo.1", "protected.txt")
+        old = PudlResourceKey("ds", "10.5281/zenodo.0", "old.txt")
+        used = PudlResourceKey("ds", "10.5281/zenodo.0", "used.txt")
+        cache.add(protected, b"pppp")
+        cache.add(old, b"oooo")
+        cache.add(used, b"uu")
+        # Make the resources look like they were written long ago, in order.
+        for age, res in enumerate([used, old, protected]):
+            os.utime(cache.get_path(res), (1000 - age, 1000 - age))
+        # Reading a resource marks it as recently used.
+        cache.get(used)
+
+        new = PudlResourceKey("ds", "10.5281/zenodo.0", "new.txt")
+        cache.add(new, b"nn")
+        self.assertFalse(cache.contains(old))
+        for res in [protected, used, new]:
+            self.assertTrue(cache.contains(res))
+
+        # Protected resources are kept even if the cache stays over max_size.
+        cache.add(new, b"n" * 20)
+        self.assertFalse(cache.contains(used))
+        self.assertTrue(cache.contains(protected))
+        self.assertTrue(cache.contains(new))
+
 
 class TestLayeredCache(unittest.TestCase):
     """Unit tests for LayeredCache class."""
@@ -202,3 +241,27 @@ class TestLayeredCache(unittest.TestCase):
         self.assertFalse(lc.contains(r_new))
         self.assertFalse(self.cache_1.contains(r_new))
         self.assertFalse(self.cache_2.contains(r_new))
+
+    def test_cache_stats(self):
+        """Hits, misses and bytes read or written are counted per layer."""
+        res = PudlResourceKey("a", "b", "x.txt")
+        lc = resource_cache.LayeredCache(self.cache_1, self.cache_2)
+        self.cache_2.add(res, b"second")
+        self.assertEqual(b"second", lc.get(res))
+        lc.add(res, b"first")
+        self.assertEqual(b"first", lc.get(res))
+        with lc.open(res) as f:
+            self.assertEqual(b"first", f.read())
+        with self.assertRaises(KeyError):
+            lc.get(PudlResourceKey("a", "b", "missing.txt"))
+
+        stats = lc.get_stats()
+        self.assertEqual(["0:LocalFileCache", "1:LocalFileCache"], list(stats))
+        first, second = stats.values()
+        self.assertEqual((2, 2), (first.hits, first.misses))
+        self.assertEqual(10, first.bytes_read)
+        self.assertEqual(5, first.bytes_written)
+        self.assertEqual(0.5, first.hit_ratio)
+        self.assertEqual((1, 1), (second.hits, second.misses))
+        self.assertEqual(6, second.bytes_read)
+        self.assertEqual(0, second.bytes_written)